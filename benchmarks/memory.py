@@ -0,0 +1,116 @@
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from config import *
+from systems.asset_manager import get_asset_manager
+from entities.boss import Boss
+from entities.enemy import Enemy
+from entities.items import Checkpoint, Chest, Item, Platform, Trap
+from entities.player import Player
+from entities.projectile import Fire, Projectile
+
+MEMORY_ENTITY_COUNT = 2000
+
+# 클래스별 생성 함수 (i: 인스턴스 번호)
+ENTITY_FACTORIES: Dict[str, Callable[[int], object]] = {
+    "Player": lambda i: Player(100, 500),
+    "Enemy": lambda i: Enemy(i % SCREEN_WIDTH, 300, "slime"),
+    "Boss": lambda i: Boss(400, 300),
+    "Projectile": lambda i: Projectile(i % SCREEN_WIDTH, 300, 1),
+    "Fire": lambda i: Fire(i % SCREEN_WIDTH, 500, 60),
+    "Item": lambda i: Item(i % SCREEN_WIDTH, 300, "health"),
+    "Chest": lambda i: Chest(i % SCREEN_WIDTH, 300, None),
+    "Trap": lambda i: Trap(i % SCREEN_WIDTH, 300, "spike"),
+    "Checkpoint": lambda i: Checkpoint(i % SCREEN_WIDTH, 300),
+    "Platform": lambda i: Platform(i % SCREEN_WIDTH, 300, 120, 20),
+}
+
+
+def measure_bytes_per_entity(factory: Callable[[int], object], count: int) -> float:
+    # 클래스/에셋 같은 공유 객체는 미리 만들어 두고 인스턴스 증가분만 측정
+    factory(0)
+    entities: List[object] = [None] * count
+    gc.collect()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(count):
+        entities[i] = factory(i)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (after - before) / count
+
+
+def measure_all(
+    names: Optional[List[str]] = None, count: int = MEMORY_ENTITY_COUNT
+) -> Dict[str, float]:
+    results = {}
+    for name in names or list(ENTITY_FACTORIES):
+        results[name] = round(
+            measure_bytes_per_entity(ENTITY_FACTORIES[name], count), 1
+        )
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Darkspire 엔티티 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=MEMORY_ENTITY_COUNT)
+    parser.add_argument(
+        "--entity", action="append", help="측정할 클래스 (여러 번 지정 가능)"
+    )
+    parser.add_argument("--output", metavar="PATH", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", metavar="PATH", help="비교할 기준 결과 JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    get_asset_manager()
+
+    names = args.entity or list(ENTITY_FACTORIES)
+    unknown = [name for name in names if name not in ENTITY_FACTORIES]
+    if unknown:
+        print(f"unknown entity: {', '.join(unknown)}")
+        print(f"available: {', '.join(ENTITY_FACTORIES)}")
+        return 2
+
+    results = measure_all(names, args.count)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    for name, size in results.items():
+        line = f"{name:<12} {size:>8.1f} B/entity"
+        old = baseline.get(name)
+        if old:
+            line += f"  (before {old:.1f}, {(size - old) / old * 100:+.1f}%)"
+        print(line, file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
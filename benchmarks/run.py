@@ -0,0 +1,178 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from config import *
+from systems.game import Game
+
+from .scenarios import Scenario, build_scenarios, scripted_keys
+
+BENCHMARK_TICKS = 600
+BENCHMARK_WARMUP_TICKS = 60
+MEMORY_TICKS = 120
+REGRESSION_THRESHOLD = 0.15
+
+# 지표별로 값이 커지는 게 나쁜지 여부
+METRIC_HIGHER_IS_WORSE = {
+    "ticks_per_sec": False,
+    "frame_p50_ms": True,
+    "frame_p99_ms": True,
+    "peak_memory_kb": True,
+}
+
+
+def _percentile(samples: List[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _run_ticks(game, scenario: Scenario, screen, ticks: int, start_tick: int = 0):
+    update_times = []
+    frame_times = []
+    perf_counter = time.perf_counter
+
+    for tick in range(start_tick, start_tick + ticks):
+        if scenario.refill:
+            scenario.refill(game)
+        keys = scripted_keys(tick)
+
+        start = perf_counter()
+        game.update(keys)
+        updated = perf_counter()
+        if screen is not None:
+            game.draw_game_screen(screen)
+        end = perf_counter()
+
+        update_times.append(updated - start)
+        frame_times.append(end - start)
+
+    return update_times, frame_times
+
+
+def run_scenario(
+    scenario: Scenario,
+    ticks: int = BENCHMARK_TICKS,
+    seed: int = 0,
+    draw: bool = True,
+) -> Dict:
+    screen = pygame.display.get_surface() if draw else None
+
+    game = Game(seed)
+    scenario.prepare(game)
+    _run_ticks(game, scenario, screen, BENCHMARK_WARMUP_TICKS)
+    update_times, frame_times = _run_ticks(
+        game, scenario, screen, ticks, BENCHMARK_WARMUP_TICKS
+    )
+
+    # 메모리는 tracemalloc 오버헤드 때문에 따로 짧게 측정
+    game = Game(seed)
+    tracemalloc.start()
+    scenario.prepare(game)
+    _run_ticks(game, scenario, screen, MEMORY_TICKS)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    frame_ms = [t * 1000 for t in frame_times]
+    return {
+        "ticks": ticks,
+        "ticks_per_sec": round(ticks / sum(update_times), 1),
+        "update_p50_ms": round(_percentile(update_times, 50) * 1000, 4),
+        "update_p99_ms": round(_percentile(update_times, 99) * 1000, 4),
+        "frame_p50_ms": round(_percentile(frame_ms, 50), 4),
+        "frame_p99_ms": round(_percentile(frame_ms, 99), 4),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def compare_results(
+    results: Dict[str, Dict],
+    baseline: Dict[str, Dict],
+    threshold: float = REGRESSION_THRESHOLD,
+) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+
+        for metric, higher_is_worse in METRIC_HIGHER_IS_WORSE.items():
+            old = base.get(metric)
+            new = result.get(metric)
+            if not old or new is None:
+                continue
+
+            change = (new - old) / old
+            worse = change if higher_is_worse else -change
+            if worse > threshold:
+                regressions.append(
+                    f"{name}.{metric}: {old} -> {new} ({change * 100:+.1f}%)"
+                )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Darkspire 벤치마크")
+    parser.add_argument("--ticks", type=int, default=BENCHMARK_TICKS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--scenario", action="append", help="실행할 시나리오 (여러 번 지정 가능)"
+    )
+    parser.add_argument("--no-draw", action="store_true", help="업데이트만 측정")
+    parser.add_argument("--output", metavar="PATH", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", metavar="PATH", help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    scenarios = build_scenarios()
+    names = args.scenario or list(scenarios)
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        print(f"unknown scenario: {', '.join(unknown)}")
+        print(f"available: {', '.join(scenarios)}")
+        return 2
+
+    results = {}
+    for name in names:
+        results[name] = run_scenario(
+            scenarios[name], args.ticks, args.seed, draw=not args.no_draw
+        )
+        print(f"{name}: {results[name]}", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+import random
+from typing import Callable, Dict, Optional
+
+import pygame
+
+from config import *
+from entities.enemy import Enemy
+from entities.projectile import Fire
+from systems.headless import SyntheticKeys
+from systems.projectile_pool import ProjectilePool
+from systems.stage_loader import StageDefinition, StageTemplate
+
+# 스트레스 시나리오 기본 개체 수
+STRESS_ENEMIES = 200
+STRESS_PROJECTILES = 500
+STRESS_PARTICLES = 10000
+STRESS_FIRES = 50
+STRESS_TRAPS = 100
+# 긴 스테이지 시나리오 - 폭이 달라도 틱 비용이 같아야 함
+WIDE_STAGE_WIDTHS = (2000, 40000)
+WIDE_STAGE_NUMBER = 100
+TRAP_STAGE_NUMBER = 101
+
+
+class Scenario:
+    def __init__(
+        self,
+        name: str,
+        stage: int,
+        setup: Optional[Callable] = None,
+        refill: Optional[Callable] = None,
+    ):
+        self.name = name
+        self.stage = stage
+        # setup(game): 스테이지 로드 직후 한 번
+        self.setup = setup
+        # refill(game): 매 틱 업데이트 전에 개체 수를 유지
+        self.refill = refill
+
+    def prepare(self, game):
+        game.start_game()
+        if self.stage != 1:
+            game.load_stage(self.stage)
+
+        # 측정 중에 죽어서 스테이지가 다시 로드되지 않도록 무적
+        game.player.invincible_time = 10**9
+
+        if self.setup:
+            self.setup(game)
+
+
+def _spawn_enemies(count: int) -> Callable:
+    def setup(game):
+        rng = random.Random(count)
+        for i in range(count):
+            enemy_type = "slime" if i % 2 else "skeleton"
+            enemy = Enemy(
+                rng.uniform(0, SCREEN_WIDTH - ENEMY_WIDTH),
+                rng.uniform(100, 600),
+                enemy_type,
+            )
+            game.stage_manager.add_enemy(enemy)
+
+    return setup
+
+
+def _create_projectile_pool(count: int) -> Callable:
+    def setup(game):
+        game.projectiles = ProjectilePool(count)
+
+    return setup
+
+
+def _keep_projectiles(count: int) -> Callable:
+    def refill(game):
+        rng = game.rng
+        while len(game.projectiles) < count:
+            direction = 1 if rng.random() < 0.5 else -1
+            proj_type = "fireball" if rng.random() < 0.5 else "magic"
+            game.projectiles.acquire(
+                rng.uniform(0, SCREEN_WIDTH),
+                rng.uniform(0, SCREEN_HEIGHT - 100),
+                direction,
+                proj_type,
+            )
+
+    return refill
+
+
+def _keep_particles(count: int) -> Callable:
+    def refill(game):
+        missing = count - len(game.particles)
+        if missing > 0:
+            rng = game.rng
+            game.particles.emit(
+                rng.uniform(0, SCREEN_WIDTH),
+                rng.uniform(0, SCREEN_HEIGHT),
+                missing,
+                [YELLOW, ORANGE, WHITE],
+            )
+
+    return refill
+
+
+def _keep_fires(count: int) -> Callable:
+    def refill(game):
+        rng = game.rng
+        while len(game.fires) < count:
+            game.fires.append(
+                Fire(rng.uniform(0, SCREEN_WIDTH - 100), rng.uniform(200, 650), 100)
+            )
+
+    return refill
+
+
+def _load_wide_stage(width: int) -> Callable:
+    def setup(game):
+        # 반복 구간으로 채운 긴 스테이지를 코드로 만들어 템플릿에 바로 넣음
+        definition = StageDefinition(WIDE_STAGE_NUMBER)
+        definition.width = width
+        definition.platforms.append((0, 650, width, 50, False))
+        for x in range(0, width, 250):
+            definition.platforms.append((x + 50, 500, 150, 20, x % 1000 == 500))
+        for x in range(500, width, 500):
+            enemy_type = "slime" if x % 1000 else "skeleton"
+            definition.enemies.append((x, 600, enemy_type, "green"))
+        for x in range(1200, width, 1000):
+            definition.traps.append((x, 630, "spike"))
+        for x in range(2000, width, 2000):
+            definition.checkpoints.append((x, 590))
+
+        _install_stage(game, definition)
+
+    return setup
+
+
+def _load_trap_stage(count: int) -> Callable:
+    def setup(game):
+        # 한 화면에 회전 칼날/화염 함정을 격자로 깔아 둠
+        definition = StageDefinition(TRAP_STAGE_NUMBER)
+        definition.platforms.append((0, 650, SCREEN_WIDTH, 50, False))
+        columns = SCREEN_WIDTH // 80
+        for i in range(count):
+            trap_type = "fireball" if i % 4 == 3 else "blade"
+            x = 20 + (i % columns) * 80
+            y = 40 + (i // columns) % 7 * 80
+            definition.traps.append((x, y, trap_type))
+
+        _install_stage(game, definition)
+
+    return setup
+
+
+def _install_stage(game, definition: StageDefinition):
+    stage_manager = game.stage_manager
+    stage_manager.templates[definition.stage] = StageTemplate(definition)
+    game.load_stage(definition.stage)
+    game.player.invincible_time = 10**9
+
+
+def build_scenarios(
+    enemies: int = STRESS_ENEMIES,
+    projectiles: int = STRESS_PROJECTILES,
+    particles: int = STRESS_PARTICLES,
+    fires: int = STRESS_FIRES,
+    traps: int = STRESS_TRAPS,
+) -> Dict[str, Scenario]:
+    scenarios = [
+        Scenario("stage1", 1),
+        Scenario("stage2", 2),
+        Scenario("stage3", 3),
+        Scenario(f"enemies_{enemies}", 1, setup=_spawn_enemies(enemies)),
+        Scenario(
+            f"projectiles_{projectiles}",
+            1,
+            setup=_create_projectile_pool(projectiles),
+            refill=_keep_projectiles(projectiles),
+        ),
+        Scenario(f"particles_{particles}", 1, refill=_keep_particles(particles)),
+        Scenario(f"fires_{fires}", 1, refill=_keep_fires(fires)),
+        Scenario(f"traps_{traps}", 1, setup=_load_trap_stage(traps)),
+    ]
+    for width in WIDE_STAGE_WIDTHS:
+        scenarios.append(Scenario(f"wide_{width}", 1, setup=_load_wide_stage(width)))
+
+    return {scenario.name: scenario for scenario in scenarios}
+
+
+_MOVE_RIGHT = SyntheticKeys([pygame.K_RIGHT])
+_MOVE_LEFT = SyntheticKeys([pygame.K_LEFT])
+
+
+def scripted_keys(tick: int) -> SyntheticKeys:
+    # 좌우로 왕복하는 고정 입력 (공격은 하지 않아 적이 줄지 않음)
+    if (tick // 60) % 2 == 0:
+        return _MOVE_RIGHT
+    return _MOVE_LEFT
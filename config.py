@@ -1,6 +1,26 @@
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 700
 FPS = 60
+TICK_RATE = 60
+MAX_CATCH_UP_STEPS = 5
+INTERPOLATION_SNAP_DISTANCE = 100
+# 바뀐 영역만 display.update로 갱신 (--dirty-rects)
+DIRTY_RECT_RENDERING = False
+
+HEADLESS_ENV_VAR = "DARKSPIRE_HEADLESS"
+HEADLESS_MAX_TICKS = 60 * 60 * 5
+# 헤드리스 보스전 정책: 보스와 유지하는 가로 거리 (중심 기준, 최소/최대 px)
+HEADLESS_RANGED_DISTANCE = (150, 320)
+# 위 발판으로 점프를 시작하는 발판 가장자리와의 거리 (최소/최대 px)
+HEADLESS_JUMP_GAP = (40, 55)
+
+REPLAY_CHECKSUM_INTERVAL = 60
+
+# 스테이지 정의 파일(stageN.json)과 컴파일 캐시 위치
+STAGE_DIR = "assets/stages"
+STAGE_CACHE_DIR = ".cache/stages"
+# 스케일/포맷 변환이 끝난 스프라이트 픽셀을 모아 둔 파일
+ASSET_CACHE_PATH = ".cache/assets.pack"
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -58,6 +78,8 @@ PROJECTILE_WIDTH = 16
 PROJECTILE_HEIGHT = 16
 PROJECTILE_SPEED = 5
 PROJECTILE_PLAYER_SPEED = 12
+# 미리 만들어 두는 투사체 슬롯 수
+PROJECTILE_POOL_SIZE = 256
 
 
 TRAP_WIDTH = 40
@@ -65,6 +87,8 @@ TRAP_HEIGHT = 40
 BLADE_SPEED = 3
 SPIKE_FALL_SPEED = 8
 FIREBALL_INTERVAL = 120
+# 발사 직전 이만큼(틱) 동안 충전 표시
+FIREBALL_CHARGE_TIME = 30
 
 
 ITEM_WIDTH = 30
@@ -77,6 +101,7 @@ DISAPPEARING_PLATFORM_TIMER = 60
 SCREEN_SHAKE_DURATION = 15
 SCREEN_SHAKE_INTENSITY = 8
 HIT_FLASH_DURATION = 10
+HIT_FLASH_TINT = (255, 255, 255, 128)
 
 PARTICLE_LIFETIME = 30
 PARTICLE_COUNT = 10
@@ -88,6 +113,57 @@ PLATFORM_COLLAPSE_WARNING = 60
 PLATFORM_COLLAPSE_COUNT = 3
 PLATFORM_COLLAPSE_HP_THRESHOLD = 50
 
+SPATIAL_HASH_CELL_SIZE = 128
+
+# 엔티티 그리기 레이어 (번호가 작은 것부터 그림)
+RENDER_LAYER_TRAPS = 0
+RENDER_LAYER_FIRES = 1
+RENDER_LAYER_ENEMIES = 2
+RENDER_LAYER_PROJECTILES = 3
+RENDER_LAYER_BOSS = 4
+RENDER_LAYER_PLAYER = 5
+RENDER_LAYER_NAMES = ("traps", "fires", "enemies", "projectiles", "boss", "player")
+
+# 종류별 애니메이션 클립: 상태 -> (프레임당 틱, 반복 여부)
+ANIMATION_CLIPS = {
+    "player": {
+        "idle": (8, True),
+        "run": (5, True),
+        "jump": (5, False),
+        "fall": (5, False),
+        "dash": (3, False),
+        "attack": (4, False),
+        "hit": (5, False),
+        "death": (8, False),
+    },
+    "slime": {
+        "idle": (10, True),
+        "jump": (6, False),
+        "hurt": (5, False),
+        "death": (8, False),
+    },
+    "skeleton": {
+        "idle": (10, True),
+        "walk": (6, True),
+        "attack": (5, False),
+        "hurt": (5, False),
+        "death": (8, False),
+    },
+    "boss": {
+        "idle": (10, True),
+        "attack": (6, True),
+        "hurt": (5, False),
+        "death": (10, False),
+    },
+}
+
+# 가로로 긴 스테이지는 고정 폭 청크로 나눠 카메라 근처만 그리고 시뮬레이션함
+WORLD_CHUNK_WIDTH = 500
+# 화면 밖으로 이 거리(px)까지의 엔티티는 계속 깨어 있음
+WORLD_ACTIVE_MARGIN = 500
+# 화면 양옆으로 미리 그려 두는 발판 청크 수
+WORLD_STREAM_CHUNKS = 1
+
 HEART_SIZE = 25
 HEART_SPACING = 5
 UI_PADDING = 10
@@ -1,14 +1,55 @@
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import pygame
 
 from config import *
+from systems.asset_manager import get_asset_manager
+from systems.sprite_manager import AnimationSet, get_animation_set
+
+# 클래스별 전체 슬롯 이름 (MRO 전체를 합친 것)
+_slot_names: Dict[type, Tuple[str, ...]] = {}
+
+
+def get_slot_names(cls: type) -> Tuple[str, ...]:
+    names = _slot_names.get(cls)
+    if names is None:
+        names = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get("__slots__", ())
+        )
+        _slot_names[cls] = names
+    return names
 
 
 class BaseEntity:
+    # 인스턴스 __dict__ 대신 고정 슬롯 사용 - 하위 클래스는 새 속성만 추가
+    __slots__ = (
+        "x",
+        "y",
+        "prev_x",
+        "prev_y",
+        "width",
+        "height",
+        "velocity_x",
+        "velocity_y",
+        "on_ground",
+        "gravity",
+        "facing_right",
+        "alive",
+        "hit_flash",
+    )
+
+    # 스프라이트/이펙트가 히트박스 밖으로 삐져나오는 최대 폭 (dirty rect 계산용)
+    draw_margin = 0
+    # RenderQueue에 쌓을 레이어
+    render_layer = RENDER_LAYER_TRAPS
+
     def __init__(self, x: float, y: float, width: int, height: int):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.width = width
         self.height = height
         self.velocity_x = 0.0
@@ -22,6 +63,24 @@ class BaseEntity:
 
         self.hit_flash = 0
 
+    @property
+    def assets(self):
+        # 에셋 매니저는 모든 엔티티가 공유 - 인스턴스마다 참조를 들고 있지 않음
+        return get_asset_manager()
+
+    def clone(self):
+        # __init__을 거치지 않고 슬롯 값만 얕은 복사 (스테이지 템플릿 복제용)
+        cls = self.__class__
+        clone = cls.__new__(cls)
+        # 빈 객체라 하위 클래스의 restore_state(기존 값 재사용)는 쓰지 않음
+        BaseEntity.restore_state(clone, self)
+        return clone
+
+    def restore_state(self, source: "BaseEntity"):
+        # 같은 클래스의 스냅샷 값으로 제자리 복원 (객체를 새로 만들지 않음)
+        for name in get_slot_names(self.__class__):
+            setattr(self, name, getattr(source, name))
+
     def apply_gravity(self):
         self.velocity_y += self.gravity
 
@@ -32,6 +91,17 @@ class BaseEntity:
     def get_rect(self) -> pygame.Rect:
         return pygame.Rect(self.x, self.y, self.width, self.height)
 
+    def get_draw_rect(self, shake_offset: Tuple[int, int] = (0, 0)) -> pygame.Rect:
+        rect = pygame.Rect(
+            self.x + shake_offset[0], self.y + shake_offset[1], self.width, self.height
+        )
+        return rect.inflate(self.draw_margin * 2, self.draw_margin * 2)
+
+    def is_visible(
+        self, view: pygame.Rect, shake_offset: Tuple[int, int] = (0, 0)
+    ) -> bool:
+        return self.get_draw_rect(shake_offset).colliderect(view)
+
     def get_center(self) -> Tuple[float, float]:
         return (self.x + self.width / 2, self.y + self.height / 2)
 
@@ -47,6 +117,23 @@ class BaseEntity:
     def get_right(self) -> float:
         return self.x + self.width
 
+    def save_previous_position(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def get_render_position(self, alpha: float) -> Tuple[float, float]:
+        # 순간이동처럼 크게 움직였으면 보간하지 않음
+        if (
+            abs(self.x - self.prev_x) > INTERPOLATION_SNAP_DISTANCE
+            or abs(self.y - self.prev_y) > INTERPOLATION_SNAP_DISTANCE
+        ):
+            return self.x, self.y
+
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+        )
+
     def set_position(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -74,6 +161,10 @@ class BaseEntity:
     def draw(self, surface: pygame.Surface, shake_offset: Tuple[int, int] = (0, 0)):
         raise NotImplementedError("Subclass must implement draw()")
 
+    def submit(self, queue, shake_offset: Tuple[int, int] = (0, 0)):
+        # 기본은 draw를 그대로 미뤄서 호출 - 스프라이트 한 장이면 하위 클래스가 blit으로
+        queue.draw(self.render_layer, self.draw, shake_offset)
+
     def take_damage(self, amount: int = 1) -> bool:
         return False
 
@@ -82,6 +173,8 @@ class BaseEntity:
 
 
 class PhysicsEntity(BaseEntity):
+    __slots__ = ("max_fall_speed",)
+
     def __init__(self, x: float, y: float, width: int, height: int):
         super().__init__(x, y, width, height)
         self.max_fall_speed = 20
@@ -94,10 +187,16 @@ class PhysicsEntity(BaseEntity):
 
         self.apply_velocity()
 
+    def get_nearby_platforms(self, platforms):
+        # SpatialHash가 넘어오면 주변 셀만 조회, 리스트면 전체 순회
+        if hasattr(platforms, "query"):
+            return platforms.query(self.x, self.y, self.width, self.height)
+        return platforms
+
     def check_platform_collision_vertical(self, platforms):
         self.on_ground = False
 
-        for platform in platforms:
+        for platform in self.get_nearby_platforms(platforms):
             if not hasattr(platform, "visible") or platform.visible:
                 if (
                     self.x < platform.x + platform.width
@@ -114,7 +213,7 @@ class PhysicsEntity(BaseEntity):
                         self.velocity_y = 0
 
     def check_platform_collision_horizontal(self, platforms):
-        for platform in platforms:
+        for platform in self.get_nearby_platforms(platforms):
             if not hasattr(platform, "visible") or platform.visible:
                 if (
                     self.x < platform.x + platform.width
@@ -131,6 +230,8 @@ class PhysicsEntity(BaseEntity):
 
 
 class DamageableEntity(PhysicsEntity):
+    __slots__ = ("max_health", "health", "invincible_time")
+
     def __init__(
         self, x: float, y: float, width: int, height: int, max_health: int = 1
     ):
@@ -172,27 +273,38 @@ class DamageableEntity(PhysicsEntity):
 
 
 class AnimatedEntity(DamageableEntity):
+    # 프레임은 종류별 AnimationSet이 공유 - 인스턴스는 상태 이름과 그 상태로 바뀐 뒤의 틱만 가짐
+    __slots__ = (
+        "current_animation",
+        "animation_timer",
+    )
+
     def __init__(
         self, x: float, y: float, width: int, height: int, max_health: int = 1
     ):
         super().__init__(x, y, width, height, max_health)
         self.current_animation = "idle"
-        self.animation_frame = 0
         self.animation_timer = 0
-        self.animation_speed = 5
 
     def update_animation(self):
         self.animation_timer += 1
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.animation_frame += 1
 
     def set_animation(self, animation_name: str, reset: bool = True):
         if self.current_animation != animation_name:
             self.current_animation = animation_name
             if reset:
-                self.animation_frame = 0
                 self.animation_timer = 0
 
-    def get_sprite_key(self) -> str:
-        return f"{self.__class__.__name__.lower()}_{self.current_animation}"
+    def get_animations(self) -> AnimationSet:
+        # 시트 이름 앞부분 - player_idle, boss_attack ...
+        return get_animation_set(self.__class__.__name__.lower())
+
+    def get_animation_frame(
+        self, flip_x: bool = False, tint: Optional[Tuple[int, ...]] = None
+    ) -> Optional[pygame.Surface]:
+        animation = self.get_animations().get(
+            self.assets, self.current_animation, flip_x, tint
+        )
+        if animation is None:
+            return None
+        return animation.get_frame_at(self.animation_timer)
@@ -9,15 +9,37 @@ from patterns.slash_pattern import SlashPattern
 from patterns.teleport_pattern import TeleportPattern
 
 from config import *
-from entities.base_entity import DamageableEntity
-from systems.asset_manager import get_asset_manager
+from entities.base_entity import AnimatedEntity
+from utils.surface_cache import get_effect_surface_cache
+
+
+class Boss(AnimatedEntity):
+    __slots__ = (
+        "rng",
+        "pattern",
+        "current_pattern_obj",
+        "vulnerable",
+        "vulnerable_timer",
+        "attack_cooldown",
+        "stunned",
+        "stun_timer",
+        "berserk_mode",
+        "platform_collapsed",
+        "charge_particles",
+        "warning_timer",
+        "last_pattern",
+        "pattern_count",
+        "patterns",
+    )
+
+    draw_margin = 60
+    render_layer = RENDER_LAYER_BOSS
 
-
-class Boss(DamageableEntity):
     def __init__(self, x, y):
         super().__init__(x, y, BOSS_WIDTH, BOSS_HEIGHT, max_health=BOSS_MAX_HEALTH)
 
-        self.assets = get_asset_manager()
+        # 게임별 RNG - Game이 생성할 때 교체함
+        self.rng = random
 
         self.pattern = None
         self.current_pattern_obj = None
@@ -55,6 +77,7 @@ class Boss(DamageableEntity):
             self.warning_timer -= 1
 
         self.update_timers()
+        self.update_animation()
 
         if self.stunned:
             self.stun_timer -= 1
@@ -78,7 +101,7 @@ class Boss(DamageableEntity):
         self.check_platform_collision_vertical(platforms)
 
         if self.pattern == "charge" and abs(self.velocity_x) > 10:
-            for platform in platforms:
+            for platform in self.get_nearby_platforms(platforms):
                 if not platform.visible:
                     continue
                 if (
@@ -142,13 +165,22 @@ class Boss(DamageableEntity):
             idx = patterns.index(self.last_pattern)
             weights[idx] = max(5, weights[idx] - 30)
 
-        self.pattern = random.choices(patterns, weights=weights)[0]
+        self.pattern = self.rng.choices(patterns, weights=weights)[0]
         self.last_pattern = self.pattern
         self.current_pattern_obj = self.patterns[self.pattern]
         self.current_pattern_obj.start()
         self.facing_right = player.x > self.x
         self.warning_timer = 45
 
+    def restore_state(self, source):
+        # 패턴 객체는 이 보스를 가리키므로 교체하지 않고 초기화만 함
+        patterns = self.patterns
+        super().restore_state(source)
+        self.patterns = patterns
+        self.charge_particles = []
+        for pattern in patterns.values():
+            pattern.reset()
+
     def enter_stun(self, reason):
         self.stunned = True
         self.stun_timer = BOSS_CHARGE_STUN_DURATION
@@ -188,23 +220,24 @@ class Boss(DamageableEntity):
     def can_be_damaged(self):
         return self.health <= BOSS_VULNERABLE_THRESHOLD or self.vulnerable
 
+    def get_animation_state(self):
+        if self.berserk_mode:
+            return "berserk"
+        if self.hit_flash > 0:
+            return "hurt"
+        if self.pattern:
+            return "attack"
+        return "idle"
+
     def draw(self, screen, shake_offset=(0, 0)):
         draw_x = self.x + shake_offset[0]
         draw_y = self.y + shake_offset[1]
 
-        sprite_key = "boss_idle"
-        if self.berserk_mode:
-            sprite_key = "boss_berserk"
-        elif self.hit_flash > 0:
-            sprite_key = "boss_hurt"
-        elif self.pattern:
-            sprite_key = "boss_attack"
-
-        sprite = self.assets.get_sprite(sprite_key)
+        # 피격/패턴 시작은 업데이트 밖에서도 바뀌므로 그릴 때 상태를 맞춤
+        self.set_animation(self.get_animation_state())
+        sprite = self.get_animation_frame(not self.facing_right)
 
         if sprite:
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
             screen.blit(sprite, (draw_x, draw_y))
         else:
             if self.hit_flash > 0:
@@ -222,20 +255,14 @@ class Boss(DamageableEntity):
             )
 
         if not self.can_be_damaged() and self.health > BOSS_VULNERABLE_THRESHOLD:
-            shield_surface = pygame.Surface(
-                (self.width + 20, self.height + 20), pygame.SRCALPHA
-            )
-            pygame.draw.circle(
-                shield_surface,
-                (*PURPLE, 64),
-                (self.width // 2 + 10, self.height // 2 + 10),
-                max(self.width, self.height) // 2 + 10,
-            )
-            pygame.draw.circle(
-                shield_surface,
-                (*LIGHT_BLUE, 128),
+            shield_surface = get_effect_surface_cache().circle(
+                (self.width + 20, self.height + 20),
                 (self.width // 2 + 10, self.height // 2 + 10),
                 max(self.width, self.height) // 2 + 10,
+                PURPLE,
+                64,
+                LIGHT_BLUE,
+                128,
                 3,
             )
             screen.blit(shield_surface, (draw_x - 10, draw_y - 10))
@@ -250,16 +277,14 @@ class Boss(DamageableEntity):
                 self.draw_star(screen, star_x, star_y, 8, 4)
 
         if self.berserk_mode:
-            aura_surface = pygame.Surface(
-                (self.width + 40, self.height + 40), pygame.SRCALPHA
-            )
             pulse = abs(math.sin(pygame.time.get_ticks() / 200))
             alpha = int(50 + pulse * 50)
-            pygame.draw.circle(
-                aura_surface,
-                (*RED, alpha),
+            aura_surface = get_effect_surface_cache().circle(
+                (self.width + 40, self.height + 40),
                 (self.width // 2 + 20, self.height // 2 + 20),
                 max(self.width, self.height) // 2 + 20,
+                RED,
+                alpha,
             )
             screen.blit(aura_surface, (draw_x - 20, draw_y - 20))
 
@@ -310,8 +335,9 @@ class Boss(DamageableEntity):
 
         elif self.pattern == "charge" and self.current_pattern_obj.phase == 1:
             trail_x = draw_x - self.velocity_x
-            trail_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            trail_surface.fill((*CYAN, 100))
+            trail_surface = get_effect_surface_cache().fill(
+                (self.width, self.height), CYAN, 100
+            )
             screen.blit(trail_surface, (trail_x, draw_y))
 
         elif self.pattern == "slash" and self.current_pattern_obj.phase == 0:
@@ -3,15 +3,28 @@ import random
 import pygame
 
 from config import *
-from entities.base_entity import DamageableEntity
-from systems.asset_manager import get_asset_manager
+from entities.base_entity import AnimatedEntity
+from systems.sprite_manager import get_animation_set
 
 
-class Enemy(DamageableEntity):
+class Enemy(AnimatedEntity):
+    __slots__ = (
+        "rng",
+        "type",
+        "color",
+        "direction",
+        "attack_timer",
+        "jump_timer",
+    )
+
+    draw_margin = 12
+    render_layer = RENDER_LAYER_ENEMIES
+
     def __init__(self, x, y, enemy_type, color="blue"):
         super().__init__(x, y, ENEMY_WIDTH, ENEMY_HEIGHT, max_health=1)
 
-        self.assets = get_asset_manager()
+        # 게임별 RNG - StageManager가 로드할 때 교체함
+        self.rng = random
         self.type = enemy_type
         self.color = color
 
@@ -24,13 +37,12 @@ class Enemy(DamageableEntity):
         self.attack_timer = 0
         self.jump_timer = 0
 
-        self.current_animation = "idle"
-
-    def update(self, platforms, player):
+    def update(self, platforms, player, world_width=SCREEN_WIDTH):
         if not self.alive:
             return
 
         self.update_timers()
+        self.update_animation()
 
         self.apply_gravity()
         self.y += self.velocity_y
@@ -39,7 +51,7 @@ class Enemy(DamageableEntity):
 
         self.check_platform_collision_vertical(platforms)
 
-        for platform in platforms:
+        for platform in self.get_nearby_platforms(platforms):
             if not hasattr(platform, "visible") or platform.visible:
                 if (
                     self.x < platform.x + platform.width
@@ -59,25 +71,44 @@ class Enemy(DamageableEntity):
         if self.type == "skeleton":
             self.facing_right = self.direction > 0
 
-            if self.x <= 0 or self.x >= SCREEN_WIDTH - self.width:
+            if self.x <= 0 or self.x >= world_width - self.width:
                 self.direction *= -1
                 self.velocity_x *= -1
                 self.facing_right = self.direction > 0
 
             if abs(self.velocity_x) > 0:
-                self.current_animation = "walk"
+                self.set_animation("walk")
             else:
-                self.current_animation = "idle"
+                self.set_animation("idle")
 
         elif self.type == "slime":
             self.jump_timer += 1
-            if self.on_ground and self.jump_timer > random.randint(60, 120):
+            if self.on_ground and self.jump_timer > self.rng.randint(60, 120):
                 self.velocity_y = -SLIME_JUMP_POWER
-                self.velocity_x = random.choice([-2, 2])
+                self.velocity_x = self.rng.choice([-2, 2])
                 self.jump_timer = 0
-                self.current_animation = "jump"
+                self.set_animation("jump")
             elif self.on_ground:
-                self.current_animation = "idle"
+                self.set_animation("idle")
+
+    def get_animations(self):
+        if self.type == "slime":
+            return get_animation_set(f"slime_{self.color}")
+        return get_animation_set(self.type)
+
+    def get_sprite(self):
+        return self.get_animation_frame(not self.facing_right)
+
+    def submit(self, queue, shake_offset=(0, 0)):
+        if not self.alive:
+            return
+
+        sprite = self.get_sprite()
+        if sprite:
+            draw_pos = (self.x + shake_offset[0], self.y + shake_offset[1])
+            queue.blit(self.render_layer, sprite, draw_pos)
+        else:
+            queue.draw(self.render_layer, self.draw, shake_offset)
 
     def draw(self, screen, shake_offset=(0, 0)):
         if not self.alive:
@@ -86,17 +117,9 @@ class Enemy(DamageableEntity):
         draw_x = self.x + shake_offset[0]
         draw_y = self.y + shake_offset[1]
 
-        if self.type == "slime":
-            sprite_key = f"slime_{self.color}_{self.current_animation}"
-        else:
-            sprite_key = f"{self.type}_{self.current_animation}"
-
-        sprite = self.assets.get_sprite(sprite_key)
+        sprite = self.get_sprite()
 
         if sprite:
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
-
             screen.blit(sprite, (draw_x, draw_y))
         else:
             if self.type == "skeleton":
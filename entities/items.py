@@ -1,14 +1,25 @@
+import math
+import random
+
 import pygame
 
 from config import *
 from entities.base_entity import BaseEntity
-from systems.asset_manager import get_asset_manager
+from systems.sprite_manager import get_sprite_baker
+from utils.constants import TRAP_BLADE_FRAME_SIZE, TRAP_BLADE_FRAMES
+from utils.surface_cache import get_effect_surface_cache
+
+# get_trap_animations()가 처음 불릴 때 구움
+_trap_animations = None
 
 
 class Item(BaseEntity):
+    __slots__ = ("type", "collected", "float_offset", "float_timer")
+
+    draw_margin = 10
+
     def __init__(self, x, y, item_type):
         super().__init__(x, y, ITEM_WIDTH, ITEM_HEIGHT)
-        self.assets = get_asset_manager()
         self.type = item_type
         self.collected = False
         self.float_offset = 0
@@ -124,13 +135,29 @@ def draw(self, screen, shake_offset=(0, 0)):
 
 
 class Chest(BaseEntity):
+    __slots__ = ("item", "opened", "open_animation")
+
+    draw_margin = 10
+
     def __init__(self, x, y, item):
         super().__init__(x, y, CHEST_WIDTH, CHEST_HEIGHT)
-        self.assets = get_asset_manager()
         self.item = item
         self.opened = False
         self.open_animation = 0
 
+    def clone(self):
+        clone = super().clone()
+        if self.item is not None:
+            clone.item = self.item.clone()
+        return clone
+
+    def restore_state(self, source):
+        item = self.item
+        super().restore_state(source)
+        if item is not None and source.item is not None:
+            item.restore_state(source.item)
+            self.item = item
+
     def draw(self, screen, shake_offset=(0, 0)):
         draw_x = self.x + shake_offset[0]
         draw_y = self.y + shake_offset[1]
@@ -161,6 +188,10 @@ class Chest(BaseEntity):
 
 
 class Trap(BaseEntity):
+    __slots__ = ("type", "timer", "active", "falling", "original_x", "original_y")
+
+    draw_margin = 20
+
     def __init__(self, x, y, trap_type):
         super().__init__(x, y, TRAP_WIDTH, TRAP_HEIGHT)
         self.type = trap_type
@@ -193,35 +224,47 @@ class Trap(BaseEntity):
 
         return False
 
-    def draw(self, screen, shake_offset=(0, 0)):
+    def get_frame(self, shake_offset=(0, 0)):
+        # 미리 구운 프레임과 그릴 위치 - 구운 애니메이션이 없는 종류(가시)는 None
+        animation = get_trap_animations().get(self.type)
+        if animation is None:
+            return None, None
+
+        if self.type == "blade":
+            half = TRAP_BLADE_FRAME_SIZE // 2
+            dest = (
+                self.x + self.width // 2 - half + shake_offset[0],
+                self.y + self.height // 2 - half + shake_offset[1],
+            )
+            return animation.get_frame_at(self.timer), dest
+
+        charge_tick = max(0, self.timer - (FIREBALL_INTERVAL - FIREBALL_CHARGE_TIME))
+        dest = (self.x + shake_offset[0], self.y + shake_offset[1])
+        return animation.get_frame_at(charge_tick), dest
+
+    def submit(self, queue, shake_offset=(0, 0)):
         if not self.active:
             return
 
-        draw_x = self.x + shake_offset[0]
-        draw_y = self.y + shake_offset[1]
-
-        if self.type == "blade":
-            import math
+        frame, dest = self.get_frame(shake_offset)
+        if frame is None:
+            queue.draw(self.render_layer, self.draw, shake_offset)
+        else:
+            queue.blit(self.render_layer, frame, dest)
 
-            angle = (self.timer * 10) % 360
-            center_x = draw_x + self.width // 2
-            center_y = draw_y + self.height // 2
+    def draw(self, screen, shake_offset=(0, 0)):
+        if not self.active:
+            return
 
-            pygame.draw.circle(screen, GRAY, (int(center_x), int(center_y)), 20)
+        frame, dest = self.get_frame(shake_offset)
+        if frame is not None:
+            screen.blit(frame, dest)
+            return
 
-            for i in range(8):
-                blade_angle = math.radians(angle + i * 45)
-                blade_x = center_x + 25 * math.cos(blade_angle)
-                blade_y = center_y + 25 * math.sin(blade_angle)
-                pygame.draw.line(
-                    screen,
-                    RED,
-                    (int(center_x), int(center_y)),
-                    (int(blade_x), int(blade_y)),
-                    3,
-                )
+        draw_x = self.x + shake_offset[0]
+        draw_y = self.y + shake_offset[1]
 
-        elif self.type == "spike":
+        if self.type == "spike":
             if not self.falling and self.timer % 60 < 30:
                 pygame.draw.rect(screen, RED, (draw_x, draw_y - 5, self.width, 3))
 
@@ -234,23 +277,64 @@ class Trap(BaseEntity):
                 ]
                 pygame.draw.polygon(screen, GRAY, points)
 
-        elif self.type == "fireball":
-            pygame.draw.rect(
-                screen, DARK_GRAY, (draw_x, draw_y, self.width, self.height)
-            )
 
-            if self.timer > FIREBALL_INTERVAL - 30:
-                charge = (self.timer - (FIREBALL_INTERVAL - 30)) / 30
-                pygame.draw.circle(
-                    screen,
-                    ORANGE,
-                    (int(draw_x + self.width // 2), int(draw_y + self.height // 2)),
-                    int(5 + charge * 10),
-                    2,
-                )
+def _draw_blade_frame(surface, index):
+    center = TRAP_BLADE_FRAME_SIZE // 2
+    angle = index * 360 // TRAP_BLADE_FRAMES
+
+    pygame.draw.circle(surface, GRAY, (center, center), 20)
+
+    for i in range(8):
+        blade_angle = math.radians(angle + i * 45)
+        # 90도 단위에서 생기는 부동소수 오차를 버리고 내림 (화면 좌표 int()와 같은 결과)
+        blade_x = center + math.floor(round(25 * math.cos(blade_angle), 6))
+        blade_y = center + math.floor(round(25 * math.sin(blade_angle), 6))
+        pygame.draw.line(surface, RED, (center, center), (blade_x, blade_y), 3)
+
+
+def _draw_fireball_frame(surface, index):
+    # index: 충전 시작 후 지난 틱 (0이면 충전 전)
+    pygame.draw.rect(surface, DARK_GRAY, (0, 0, TRAP_WIDTH, TRAP_HEIGHT))
+
+    if index > 0:
+        charge = index / FIREBALL_CHARGE_TIME
+        pygame.draw.circle(
+            surface,
+            ORANGE,
+            (TRAP_WIDTH // 2, TRAP_HEIGHT // 2),
+            int(5 + charge * 10),
+            2,
+        )
+
+
+def get_trap_animations():
+    # 함정 종류 -> 구워 둔 Animation (모든 함정이 같이 씀, 재생 위치는 각자의 timer)
+    global _trap_animations
+    if _trap_animations is None:
+        baker = get_sprite_baker()
+        _trap_animations = {
+            "blade": baker.bake(
+                "trap_blade",
+                (TRAP_BLADE_FRAME_SIZE, TRAP_BLADE_FRAME_SIZE),
+                TRAP_BLADE_FRAMES,
+                _draw_blade_frame,
+            ),
+            "fireball": baker.bake(
+                "trap_fireball",
+                (TRAP_WIDTH, TRAP_HEIGHT),
+                FIREBALL_CHARGE_TIME,
+                _draw_fireball_frame,
+                loop=False,
+            ),
+        }
+    return _trap_animations
 
 
 class Checkpoint(BaseEntity):
+    __slots__ = ("activated", "animation_timer")
+
+    draw_margin = 10
+
     def __init__(self, x, y):
         super().__init__(x, y, 40, 60)
         self.activated = False
@@ -303,6 +387,19 @@ class Checkpoint(BaseEntity):
 
 
 class Platform(BaseEntity):
+    __slots__ = (
+        "disappearing",
+        "timer",
+        "visible",
+        "original_visible",
+        "warning",
+        "collapsing",
+        "collapse_timer",
+        "cracks",
+    )
+
+    draw_margin = 30
+
     def __init__(self, x, y, width, height, disappearing=False):
         super().__init__(x, y, width, height)
         self.disappearing = disappearing
@@ -312,6 +409,19 @@ class Platform(BaseEntity):
         self.warning = False
         self.collapsing = False
         self.collapse_timer = 0
+        self.cracks = self._generate_cracks()
+
+    def _generate_cracks(self):
+        # 위치 기반 시드로 금 모양을 한 번만 만들어 둠 (전역 RNG를 건드리지 않음)
+        rng = random.Random(int(self.x + self.y))
+        cracks = []
+        for i in range(2):
+            crack_x = rng.randint(5, self.width - 5)
+            crack_y = rng.randint(3, self.height - 3)
+            end_x = crack_x + rng.randint(10, 30)
+            end_y = crack_y + rng.randint(-3, 3)
+            cracks.append((crack_x, crack_y, end_x, end_y))
+        return cracks
 
     def update(self, player):
         if not self.disappearing or not self.visible:
@@ -375,20 +485,14 @@ class Platform(BaseEntity):
             edge_color = (60, 80, 120)
             if self.timer > 0:
                 alpha = int(255 * (1 - self.timer / DISAPPEARING_PLATFORM_TIMER))
-                platform_surface = pygame.Surface(
-                    (self.width, self.height), pygame.SRCALPHA
+                surfaces = get_effect_surface_cache()
+                platform_surface = surfaces.fill(
+                    (self.width, self.height), color, alpha
                 )
-                platform_surface.fill((*color, alpha))
                 screen.blit(platform_surface, (draw_x, draw_y))
 
-                border_surface = pygame.Surface(
-                    (self.width, self.height), pygame.SRCALPHA
-                )
-                pygame.draw.rect(
-                    border_surface,
-                    (*edge_color, alpha),
-                    (0, 0, self.width, self.height),
-                    3,
+                border_surface = surfaces.rect_outline(
+                    (self.width, self.height), edge_color, alpha, 3
                 )
                 screen.blit(border_surface, (draw_x, draw_y))
                 return
@@ -409,23 +513,16 @@ class Platform(BaseEntity):
         )
 
         if not self.collapsing and not self.disappearing:
-            import random
-
-            random.seed(int(self.x + self.y))
-            for i in range(2):
-                crack_x = draw_x + random.randint(5, self.width - 5)
-                crack_y = draw_y + random.randint(3, self.height - 3)
+            for crack_x, crack_y, end_x, end_y in self.cracks:
                 pygame.draw.line(
                     screen,
                     (60, 60, 70),
-                    (crack_x, crack_y),
-                    (crack_x + random.randint(10, 30), crack_y + random.randint(-3, 3)),
+                    (draw_x + crack_x, draw_y + crack_y),
+                    (draw_x + end_x, draw_y + end_y),
                     1,
                 )
 
         if self.collapsing and self.collapse_timer >= PLATFORM_COLLAPSE_WARNING:
-            import random
-
             for _ in range(5):
                 crack_x1 = draw_x + random.randint(0, int(self.width))
                 crack_y1 = draw_y + random.randint(0, int(self.height))
@@ -2,17 +2,32 @@ import pygame
 
 from config import *
 from entities.base_entity import AnimatedEntity
-from systems.asset_manager import get_asset_manager
+from utils.surface_cache import get_effect_surface_cache
 
 
 class Player(AnimatedEntity):
+    __slots__ = (
+        "speed",
+        "jump_power",
+        "dash_cooldown",
+        "dash_duration",
+        "dash_direction",
+        "has_sword",
+        "speed_boost",
+        "attack_cooldown",
+        "attacking",
+        "attack_animation_timer",
+        "ranged_attack_cooldown",
+    )
+
+    draw_margin = 40
+    render_layer = RENDER_LAYER_PLAYER
+
     def __init__(self, x, y):
         super().__init__(
             x, y, PLAYER_WIDTH, PLAYER_HEIGHT, max_health=PLAYER_MAX_HEARTS
         )
 
-        self.assets = get_asset_manager()
-
         self.speed = PLAYER_SPEED
         self.jump_power = PLAYER_JUMP_POWER
 
@@ -28,7 +43,7 @@ class Player(AnimatedEntity):
         self.attack_animation_timer = 0
         self.ranged_attack_cooldown = 0
 
-    def update(self, keys, platforms):
+    def update(self, keys, platforms, world_width=SCREEN_WIDTH):
         self.update_timers()
         self.update_animation()
 
@@ -63,7 +78,7 @@ class Player(AnimatedEntity):
             self.assets.play_sound("jump", volume=0.4)
 
         self.x += self.velocity_x
-        self.check_screen_bounds()
+        self.check_screen_bounds(world_width)
         self.check_platform_collision_horizontal(platforms)
 
         self.apply_gravity()
@@ -130,6 +145,25 @@ class Player(AnimatedEntity):
             return True
         return False
 
+    def get_sprite(self):
+        tint = HIT_FLASH_TINT if self.hit_flash > 0 else None
+        return self.get_animation_frame(not self.facing_right, tint)
+
+    def submit(self, queue, shake_offset=(0, 0)):
+        if self.invincible_time > 0 and self.invincible_time % 10 < 5:
+            return
+
+        sprite = self.get_sprite()
+        # 대시 잔상은 반투명 이펙트라 기존 draw 경로로 그림
+        if not sprite or self.dash_duration > 0:
+            queue.draw(self.render_layer, self.draw, shake_offset)
+            return
+
+        draw_x = self.x + shake_offset[0]
+        draw_y = self.y + shake_offset[1]
+        sprite_offset_y = sprite.get_height() - self.height
+        queue.blit(self.render_layer, sprite, (draw_x, draw_y - sprite_offset_y))
+
     def draw(self, screen, shake_offset=(0, 0)):
         draw_x = self.x + shake_offset[0]
         draw_y = self.y + shake_offset[1]
@@ -137,17 +171,9 @@ class Player(AnimatedEntity):
         if self.invincible_time > 0 and self.invincible_time % 10 < 5:
             return
 
-        sprite_key = f"player_{self.current_animation}"
-        sprite = self.assets.get_sprite(sprite_key)
+        sprite = self.get_sprite()
 
         if sprite:
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
-
-            if self.hit_flash > 0:
-                sprite = sprite.copy()
-                sprite.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
-
             # 스프라이트를 히트박스 하단에 맞춰서 그리기
             sprite_offset_y = sprite.get_height() - self.height
             screen.blit(sprite, (draw_x, draw_y - sprite_offset_y))
@@ -166,6 +192,7 @@ class Player(AnimatedEntity):
         if self.dash_duration > 0:
             trail_x = draw_x - self.dash_direction * 15
             trail_alpha = 100
-            trail_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            trail_surface.fill((*CYAN, trail_alpha))
+            trail_surface = get_effect_surface_cache().fill(
+                (self.width, self.height), CYAN, trail_alpha
+            )
             screen.blit(trail_surface, (trail_x, draw_y))
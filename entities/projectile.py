@@ -4,14 +4,36 @@ import pygame
 
 from config import *
 from entities.base_entity import BaseEntity, PhysicsEntity
-from systems.asset_manager import get_asset_manager
+from utils.profiler import get_profiler
+from utils.surface_cache import get_effect_surface_cache
 
 
 class Projectile(PhysicsEntity):
+    __slots__ = (
+        "pool_index",
+        "type",
+        "from_player",
+        "active",
+        "gravity_affected",
+        "lifetime",
+    )
+
+    draw_margin = 20
+    render_layer = RENDER_LAYER_PROJECTILES
+
     def __init__(self, x, y, direction, proj_type="magic", from_player=False, angle=0):
         super().__init__(x, y, PROJECTILE_WIDTH, PROJECTILE_HEIGHT)
+        get_profiler().count("projectiles")
+
+        # ProjectilePool 안에서의 위치 (swap-remove용)
+        self.pool_index = -1
+        self.reset(x, y, direction, proj_type, from_player, angle)
 
-        self.assets = get_asset_manager()
+    def reset(self, x, y, direction, proj_type="magic", from_player=False, angle=0):
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.type = proj_type
         self.from_player = from_player
         self.active = True
@@ -31,7 +53,8 @@ class Projectile(PhysicsEntity):
         self.gravity_affected = False
         self.lifetime = 180
 
-    def update(self):
+    def update(self, min_x=-50, max_x=SCREEN_WIDTH + 50):
+        # min_x/max_x: 카메라 화면 밖으로 이만큼 나가면 사라짐 (월드 좌표)
         if not self.active:
             return
 
@@ -44,8 +67,8 @@ class Projectile(PhysicsEntity):
         self.lifetime -= 1
 
         if (
-            self.x < -50
-            or self.x > SCREEN_WIDTH + 50
+            self.x < min_x
+            or self.x > max_x
             or self.y < -50
             or self.y > SCREEN_HEIGHT + 50
             or self.lifetime <= 0
@@ -53,7 +76,7 @@ class Projectile(PhysicsEntity):
             self.active = False
 
     def check_platform_collision(self, platforms):
-        for platform in platforms:
+        for platform in self.get_nearby_platforms(platforms):
             if not platform.visible:
                 continue
 
@@ -68,35 +91,54 @@ class Projectile(PhysicsEntity):
 
         return None, None, None
 
+    def get_sprite(self):
+        if self.type in ["magic", "player_energy", "fireball"]:
+            sprite_key = f"projectile_{self.type.replace('player_', '')}"
+            return self.assets.get_sprite(sprite_key)
+        return None
+
+    def submit(self, queue, shake_offset=(0, 0)):
+        if not self.active:
+            return
+
+        sprite = self.get_sprite()
+        if sprite:
+            draw_pos = (self.x + shake_offset[0], self.y + shake_offset[1])
+            queue.blit(self.render_layer, sprite, draw_pos)
+        else:
+            queue.draw(self.render_layer, self.draw_shape, shake_offset)
+
     def draw(self, screen, shake_offset=(0, 0)):
         if not self.active:
             return
 
+        sprite = self.get_sprite()
+        if sprite:
+            screen.blit(sprite, (self.x + shake_offset[0], self.y + shake_offset[1]))
+        else:
+            self.draw_shape(screen, shake_offset)
+
+    def draw_shape(self, screen, shake_offset=(0, 0)):
+        # 스프라이트가 없는 투사체 (또는 검기)는 도형으로 그림
         draw_x = self.x + shake_offset[0]
         draw_y = self.y + shake_offset[1]
 
         if self.type in ["magic", "player_energy", "fireball"]:
-            sprite_key = f"projectile_{self.type.replace('player_', '')}"
-            sprite = self.assets.get_sprite(sprite_key)
-
-            if sprite:
-                screen.blit(sprite, (draw_x, draw_y))
-            else:
-                center_x = int(draw_x + self.width // 2)
-                center_y = int(draw_y + self.height // 2)
+            center_x = int(draw_x + self.width // 2)
+            center_y = int(draw_y + self.height // 2)
 
-                if self.type == "magic":
-                    pygame.draw.circle(screen, PURPLE, (center_x, center_y), 6)
-                    pygame.draw.circle(screen, PINK, (center_x, center_y), 3)
+            if self.type == "magic":
+                pygame.draw.circle(screen, PURPLE, (center_x, center_y), 6)
+                pygame.draw.circle(screen, PINK, (center_x, center_y), 3)
 
-                elif self.type == "fireball":
-                    pygame.draw.circle(screen, RED, (center_x, center_y), 8)
-                    pygame.draw.circle(screen, ORANGE, (center_x, center_y), 5)
-                    pygame.draw.circle(screen, YELLOW, (center_x, center_y), 2)
+            elif self.type == "fireball":
+                pygame.draw.circle(screen, RED, (center_x, center_y), 8)
+                pygame.draw.circle(screen, ORANGE, (center_x, center_y), 5)
+                pygame.draw.circle(screen, YELLOW, (center_x, center_y), 2)
 
-                elif self.type == "player_energy":
-                    pygame.draw.circle(screen, CYAN, (center_x, center_y), 7)
-                    pygame.draw.circle(screen, WHITE, (center_x, center_y), 4)
+            elif self.type == "player_energy":
+                pygame.draw.circle(screen, CYAN, (center_x, center_y), 7)
+                pygame.draw.circle(screen, WHITE, (center_x, center_y), 4)
 
         elif self.type == "sword_beam":
             length = 30
@@ -115,6 +157,10 @@ class Projectile(PhysicsEntity):
 
 
 class Fire(BaseEntity):
+    __slots__ = ("duration", "damage_timer", "active", "flicker_timer")
+
+    render_layer = RENDER_LAYER_FIRES
+
     def __init__(self, x, y, width):
         super().__init__(x, y, min(width, 100), 30)
         self.duration = FIRE_DURATION
@@ -130,6 +176,12 @@ class Fire(BaseEntity):
         if self.duration <= 0:
             self.active = False
 
+    def get_draw_rect(self, shake_offset=(0, 0)):
+        # 불꽃은 y 위쪽으로 그려지고 연기가 최대 20px 더 올라감
+        top = self.y + shake_offset[1] - self.height - 30
+        rect = pygame.Rect(self.x + shake_offset[0], top, self.width, self.height + 30)
+        return rect.inflate(10, 10)
+
     def can_damage(self):
         if self.damage_timer >= FIRE_DAMAGE_INTERVAL:
             self.damage_timer = 0
@@ -146,21 +198,20 @@ class Fire(BaseEntity):
         import random
 
         flicker = random.randint(-3, 3)
+        surfaces = get_effect_surface_cache()
 
         for i in range(3):
             height = self.height - i * 8 + flicker
             alpha = 200 - i * 50
 
-            fire_surface = pygame.Surface((self.width, height), pygame.SRCALPHA)
-
             if i == 0:
-                color = (*RED, alpha)
+                color = RED
             elif i == 1:
-                color = (*ORANGE, alpha)
+                color = ORANGE
             else:
-                color = (*YELLOW, alpha)
+                color = YELLOW
 
-            fire_surface.fill(color)
+            fire_surface = surfaces.fill((self.width, height), color, alpha)
             screen.blit(fire_surface, (draw_x, draw_y - height))
 
         if self.flicker_timer % 5 == 0:
@@ -1,55 +1,227 @@
+import argparse
+import atexit
 import sys
+import time
 
 import pygame
 
 from config import *
+from systems.asset_manager import is_headless, start_asset_loading
 from systems.game import Game
+from systems.game_loop import FixedTimestepLoop
+from systems.headless import HeadlessSimulation, boss_fight_policy, enable_headless
+from systems.replay import Replay, ReplayPlayer, ReplayRecorder, get_session_path
+from systems.ui_manager import UIManager
+from utils.constants import TRACE_BUFFER_EVENTS
+from utils.profiler import get_profiler
+from utils.trace import TraceRecorder
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Darkspire")
+    parser.add_argument(
+        "--headless", action="store_true", help="화면/사운드 없이 시뮬레이션만 실행"
+    )
+    parser.add_argument("--stage", type=int, default=3)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=HEADLESS_MAX_TICKS)
+    parser.add_argument(
+        "--record", metavar="PATH", help="플레이 입력을 리플레이로 저장"
+    )
+    parser.add_argument("--replay", metavar="PATH", help="리플레이를 헤드리스로 재생")
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        default=DIRTY_RECT_RENDERING,
+        help="바뀐 영역만 화면에 갱신",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="프로파일러 오버레이 켜고 시작 (F3)"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="프레임/서브시스템 구간을 Chrome 트레이스로 저장",
+    )
+    parser.add_argument("--trace-buffer", type=int, default=TRACE_BUFFER_EVENTS)
+    return parser.parse_args()
+
+
+def run_headless(args):
+    victories = 0
+    boss_runs = 0
+    boss_damaged = 0
+    for run in range(args.runs):
+        simulation = HeadlessSimulation(args.stage, seed=args.seed + run)
+        result = simulation.run(boss_fight_policy, args.max_ticks)
+        victories += result["victory"]
+        if result["boss_health"] is not None:
+            boss_runs += 1
+            boss_damaged += result["boss_health"] < BOSS_MAX_HEALTH
+        print(f"run {run}: {result}")
+
+    print(f"victories: {victories}/{args.runs}")
+    if boss_runs:
+        print(f"boss damaged: {boss_damaged}/{boss_runs}")
+        # 정책이 보스에게 피해를 전혀 못 주면 실패로 처리
+        if not boss_damaged:
+            sys.exit(1)
+
+
+def run_replay(args):
+    replay = Replay.load(args.replay)
+    start = time.perf_counter()
+    result = ReplayPlayer(replay).run()
+    elapsed = time.perf_counter() - start
+
+    print(f"replay: {result}")
+    print(f"{len(replay)} ticks in {elapsed:.2f}s")
+    if result["desync_tick"] is not None:
+        print(f"DESYNC at tick {result['desync_tick']}")
+        sys.exit(1)
+
+
+def create_game(args):
+    game = Game()
+    if args.dirty_rects:
+        game.enable_dirty_rects()
+    return game
+
 
-pygame.init()
+def show_loading_screen(screen, clock, assets):
+    # 메뉴에 필요한 에셋이 반영될 때까지 진행률 표시 - 창을 닫으면 False
+    ui_manager = UIManager()
+    while not assets.is_ready():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+
+        ui_manager.draw_loading(screen, assets.get_load_progress())
+        pygame.display.flip()
+        clock.tick(FPS)
+    return True
 
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Darkspire - Tower of Darkness")
-clock = pygame.time.Clock()
+
+def start_trace(args):
+    tracer = TraceRecorder(args.trace, args.trace_buffer)
+    get_profiler().set_tracer(tracer)
+    # 정상 종료/예외 종료 모두에서 파일로 남김
+    atexit.register(tracer.flush)
+    return tracer
 
 
 def main():
-    game = Game()
+    args = parse_args()
+
+    if args.trace:
+        start_trace(args)
+
+    if args.replay:
+        enable_headless()
+        run_replay(args)
+        sys.exit()
+
+    if args.headless or is_headless():
+        enable_headless()
+        run_headless(args)
+        sys.exit()
+
+    pygame.init()
+
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Darkspire - Tower of Darkness")
+    clock = pygame.time.Clock()
+
+    # 에셋은 스레드 풀에서 읽고, 보스/후반 배경은 메뉴를 띄운 뒤에도 계속 읽음
+    assets = start_asset_loading()
+    if not show_loading_screen(screen, clock, assets):
+        pygame.quit()
+        sys.exit()
+
+    game = create_game(args)
+    loop = FixedTimestepLoop()
+    last_time = time.perf_counter()
     running = True
 
+    recorder = None
+    # R/ESC로 게임을 새로 만들 때마다 세션 번호를 올려 파일을 따로 저장
+    session = 0
+    dash_pending = False
+
+    profiler = get_profiler()
+    profiler.set_enabled(args.profile)
+
     while running:
+        profiler.begin_frame()
+        now = time.perf_counter()
+        frame_time = now - last_time
+        last_time = now
+
         keys = pygame.key.get_pressed()
+        assets.poll()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle()
+
             if game.game_state == GAME_STATE_MENU:
                 result = game.handle_menu_input(event)
                 if result == "quit":
                     running = False
 
             elif game.game_state == GAME_STATE_PLAYING:
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                    dash_pending = True
                 game.handle_game_input(event)
 
             elif game.game_state == GAME_STATE_DEV_MENU:
-                game.handle_dev_menu_input(event)
+                stage = game.handle_dev_menu_input(event)
+                if stage is not None and recorder and recorder.game is game:
+                    recorder.record_stage_jump(stage)
 
             elif game.game_state in [GAME_STATE_VICTORY, GAME_STATE_GAME_OVER]:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
-                        game = Game()
+                        game = create_game(args)
                         game.start_game()
                     elif event.key == pygame.K_ESCAPE:
-                        game = Game()  # 메인 메뉴로 돌아가기
-
-        if game.game_state == GAME_STATE_PLAYING:
-            game.update(keys)
-
-        game.draw(screen)
-
-        pygame.display.flip()
+                        game = create_game(args)  # 메인 메뉴로 돌아가기
+
+        # 렌더링 속도와 무관하게 TICK_RATE 고정 간격으로 시뮬레이션
+        for _ in range(loop.advance(frame_time)):
+            if game.game_state == GAME_STATE_PLAYING:
+                if args.record:
+                    if recorder is None or recorder.game is not game:
+                        if recorder:
+                            recorder.save(get_session_path(args.record, session))
+                        recorder = ReplayRecorder(game)
+                        session += 1
+                    recorder.record_tick(keys, dash_pending)
+                    dash_pending = False
+
+                game.update(keys)
+
+                if recorder:
+                    recorder.after_tick()
+
+        dirty_rects = game.draw(screen, loop.get_alpha())
+
+        with profiler.scope("present"):
+            if dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+
+        profiler.end_frame()
         clock.tick(FPS)
 
+    if recorder:
+        recorder.save(get_session_path(args.record, session))
+
     pygame.quit()
     sys.exit()
 
@@ -1,5 +1,3 @@
-import random
-
 from patterns.base_pattern import BasePattern
 
 
@@ -9,7 +7,7 @@ class TeleportPattern(BasePattern):
 
         if self.phase == 0:
             if self.timer >= 20:
-                offset = 80 if random.random() > 0.5 else -80
+                offset = 80 if self.boss.rng.random() > 0.5 else -80
                 self.boss.x = player.x + offset
                 self.boss.y = player.y - 100
                 self.phase = 1
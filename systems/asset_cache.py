@@ -0,0 +1,214 @@
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from config import ASSET_CACHE_PATH
+
+ASSET_CACHE_MAGIC = b"DSPR"
+ASSET_CACHE_VERSION = 1
+
+# 헤더: 매직, 버전, 항목 수
+HEADER_FORMAT = "<4sHI"
+# 항목: 이름 길이, 픽셀 포맷 번호, 가로/세로, 원본 파일 크기/mtime(ns), 픽셀 데이터 오프셋/길이
+ENTRY_FORMAT = "<HBHHQqQQ"
+# 픽셀 데이터 시작 위치 정렬 (바이트)
+DATA_ALIGNMENT = 16
+
+PIXEL_FORMATS = ("BGRA", "RGBA", "ARGB")
+# convert_alpha 결과의 (R, G, B, A) 마스크 -> 리틀 엔디언 바이트 순서
+MASK_FORMATS = {
+    (0xFF0000, 0xFF00, 0xFF, 0xFF000000): "BGRA",
+    (0xFF, 0xFF00, 0xFF0000, 0xFF000000): "RGBA",
+    (0xFF00, 0xFF0000, 0xFF000000, 0xFF): "ARGB",
+}
+
+SourceStamp = Tuple[int, int]
+# (원본 크기/mtime, 스프라이트 크기, 픽셀 포맷, 오프셋, 길이)
+CacheEntry = Tuple[SourceStamp, Tuple[int, int], str, int, int]
+
+
+def get_source_stamp(path: str) -> Optional[SourceStamp]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def get_pixel_format(surface: pygame.Surface) -> Optional[str]:
+    if sys.byteorder != "little" or surface.get_bitsize() != 32:
+        return None
+    return MASK_FORMATS.get(tuple(surface.get_masks()))
+
+
+class AssetCache:
+    # 스케일/디스플레이 포맷 변환까지 끝난 픽셀을 파일 하나에 모아 두고 mmap으로 바로 씀
+    def __init__(self, path: str = ASSET_CACHE_PATH):
+        self.path = path
+        self.entries: Dict[str, CacheEntry] = {}
+        self.buffer: Optional[mmap.mmap] = None
+        self.view: Optional[memoryview] = None
+        # 이번 실행에서 쓴 항목 (저장할 때 남길 것) / 새로 만든 픽셀
+        self.used: Dict[str, CacheEntry] = {}
+        self.added: Dict[str, Tuple[SourceStamp, Tuple[int, int], str, bytes]] = {}
+        self.display_format: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self._open()
+
+    def _open(self):
+        try:
+            with open(self.path, "rb") as f:
+                # 쓰기 시에만 복사되도록 ACCESS_COPY - 서피스를 고쳐도 파일은 그대로
+                self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            self.view = memoryview(self.buffer)
+            self.entries = self._read_index(self.view)
+        except (OSError, ValueError, struct.error, UnicodeDecodeError):
+            # 없거나 깨졌으면 빈 캐시로 시작하고 다 읽은 뒤 새로 씀
+            self.entries = {}
+
+    def _read_index(self, view: memoryview) -> Dict[str, CacheEntry]:
+        magic, version, count = struct.unpack_from(HEADER_FORMAT, view, 0)
+        if magic != ASSET_CACHE_MAGIC:
+            raise ValueError(f"{self.path}: not an asset cache")
+        if version != ASSET_CACHE_VERSION:
+            raise ValueError(f"{self.path}: unsupported version {version}")
+
+        entries = {}
+        position = struct.calcsize(HEADER_FORMAT)
+        entry_size = struct.calcsize(ENTRY_FORMAT)
+        for _ in range(count):
+            (
+                name_length,
+                pixel_format,
+                width,
+                height,
+                source_size,
+                source_mtime,
+                offset,
+                length,
+            ) = struct.unpack_from(ENTRY_FORMAT, view, position)
+            position += entry_size
+            name = bytes(view[position : position + name_length]).decode("utf-8")
+            position += name_length
+
+            if offset + length > len(view) or length != width * height * 4:
+                raise ValueError(f"{self.path}: entry {name!r} out of range")
+            entries[name] = (
+                (source_size, source_mtime),
+                (width, height),
+                PIXEL_FORMATS[pixel_format],
+                offset,
+                length,
+            )
+        return entries
+
+    def _get_display_format(self) -> Optional[str]:
+        # 디스플레이가 없으면 convert_alpha가 안 되므로 캐시도 쓰지 않음
+        if pygame.display.get_surface() is None:
+            return None
+        if self.display_format is None:
+            probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            self.display_format = get_pixel_format(probe)
+        return self.display_format
+
+    def get(
+        self, name: str, path: str, size: Optional[Tuple[int, int]] = None
+    ) -> Optional[pygame.Surface]:
+        # size가 None이면 크기는 확인하지 않음 (스프라이트 시트처럼 프레임 수를 모를 때)
+        entry = self.entries.get(name)
+        display_format = self._get_display_format()
+        if (
+            entry is None
+            or display_format is None
+            or entry[0] != get_source_stamp(path)
+            or (size is not None and entry[1] != size)
+            or entry[2] != display_format
+        ):
+            self.misses += 1
+            return None
+
+        _, size, pixel_format, offset, length = entry
+        surface = pygame.image.frombuffer(
+            self.view[offset : offset + length], size, pixel_format
+        )
+        self.used[name] = entry
+        self.hits += 1
+        return surface
+
+    def store(
+        self, name: str, path: str, size: Tuple[int, int], surface: pygame.Surface
+    ):
+        stamp = get_source_stamp(path)
+        pixel_format = get_pixel_format(surface)
+        if stamp is None or pixel_format is None or surface.get_size() != size:
+            return
+        pixels = pygame.image.tobytes(surface, pixel_format)
+        self.added[name] = (stamp, size, pixel_format, pixels)
+
+    def is_dirty(self) -> bool:
+        return bool(self.added)
+
+    def _pack(self) -> List[bytes]:
+        records = []
+        for name, (stamp, size, pixel_format, offset, length) in self.used.items():
+            records.append(
+                (name, stamp, size, pixel_format, self.view[offset : offset + length])
+            )
+        for name, (stamp, size, pixel_format, pixels) in self.added.items():
+            records.append((name, stamp, size, pixel_format, pixels))
+
+        names = [name.encode("utf-8") for name, *_ in records]
+        index_size = struct.calcsize(HEADER_FORMAT) + sum(
+            struct.calcsize(ENTRY_FORMAT) + len(name) for name in names
+        )
+
+        chunks = [
+            struct.pack(
+                HEADER_FORMAT, ASSET_CACHE_MAGIC, ASSET_CACHE_VERSION, len(records)
+            )
+        ]
+        data = []
+        offset = index_size
+        for encoded, (_, stamp, size, pixel_format, pixels) in zip(names, records):
+            padding = -offset % DATA_ALIGNMENT
+            offset += padding
+            chunks.append(
+                struct.pack(
+                    ENTRY_FORMAT,
+                    len(encoded),
+                    PIXEL_FORMATS.index(pixel_format),
+                    size[0],
+                    size[1],
+                    stamp[0],
+                    stamp[1],
+                    offset,
+                    len(pixels),
+                )
+            )
+            chunks.append(encoded)
+            data.append(b"\0" * padding)
+            data.append(pixels)
+            offset += len(pixels)
+        return chunks + data
+
+    def save(self):
+        # 새로 디코딩한 스프라이트가 있을 때만 다시 씀 (안 쓰는 항목은 이때 정리)
+        if not self.is_dirty():
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "wb") as f:
+                for chunk in self._pack():
+                    f.write(chunk)
+            # 지금 매핑된 파일은 이미 연 상태라 교체해도 기존 서피스는 그대로 유효
+            os.replace(temp_path, self.path)
+        except OSError:
+            # 읽기 전용 환경에서는 캐시 없이 진행
+            return
+        self.added.clear()
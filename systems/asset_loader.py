@@ -0,0 +1,137 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from utils.constants import ASSET_LOAD_WORKERS
+from utils.profiler import get_profiler
+
+
+class AssetLoader:
+    # 파일 읽기/디코딩은 스레드 풀에서 하고, 결과 반영(finish)은 메인 스레드에서 함
+    def __init__(
+        self,
+        workers: int = ASSET_LOAD_WORKERS,
+        on_complete: Optional[Callable] = None,
+    ):
+        self.workers = workers
+        # 제출한 에셋이 모두 반영되면 메인 스레드에서 한 번 불림
+        self.on_complete = on_complete
+        # seal() 이후에만 완료로 봄 (제출 도중 비는 순간은 완료가 아님)
+        self.sealed = False
+        self.completed = False
+        self.executor: Optional[ThreadPoolExecutor] = None
+        # key: (종류, 이름) - 제출 순서대로 반영하도록 삽입 순서를 유지
+        self.pending: Dict[Hashable, Future] = {}
+        self.finishers: Dict[Hashable, Callable] = {}
+        # 필수 에셋이 다 끝난 뒤에 디코딩을 시작하는 나머지 에셋
+        self.deferred: Dict[Hashable, Tuple[Callable, Callable]] = {}
+        self.critical: set = set()
+        self.total = 0
+        self.finished = 0
+
+    def _start(self, key: Hashable, decode: Callable, finish: Callable):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="asset"
+            )
+        self.pending[key] = self.executor.submit(decode)
+        self.finishers[key] = finish
+
+    def submit(
+        self,
+        key: Hashable,
+        decode: Callable,
+        finish: Callable,
+        deferred: bool = False,
+    ):
+        # decode()는 워커 스레드, finish(결과 또는 None)는 메인 스레드에서 불림
+        if deferred:
+            self.deferred[key] = (decode, finish)
+        else:
+            self._start(key, decode, finish)
+            self.critical.add(key)
+        self.total += 1
+
+    def _start_deferred(self):
+        if self.critical:
+            return
+        deferred = self.deferred
+        self.deferred = {}
+        for key, (decode, finish) in deferred.items():
+            self._start(key, decode, finish)
+
+    def is_pending(self, key: Hashable) -> bool:
+        return key in self.pending or key in self.deferred
+
+    def _finish(self, key: Hashable):
+        future = self.pending.pop(key)
+        finish = self.finishers.pop(key)
+        try:
+            result = future.result()
+        except:
+            result = None
+
+        with get_profiler().scope(f"asset.{key[1]}"):
+            finish(result)
+        self.finished += 1
+
+        if key in self.critical:
+            self.critical.discard(key)
+            self._start_deferred()
+        self._check_complete()
+
+    def _check_complete(self):
+        if self.pending or self.deferred:
+            return
+        self.shutdown()
+        if self.sealed and not self.completed:
+            self.completed = True
+            if self.on_complete:
+                self.on_complete()
+
+    def seal(self):
+        # 더 제출할 것이 없음 - 이미 다 끝났으면 바로 완료 처리
+        self.sealed = True
+        self._check_complete()
+
+    def poll(self) -> int:
+        # 디코딩이 끝난 것만 반영 - 매 프레임 불러도 기다리지 않음
+        self._start_deferred()
+        done = [key for key, future in self.pending.items() if future.done()]
+        for key in done:
+            self._finish(key)
+        return len(done)
+
+    def wait(self, key: Hashable) -> bool:
+        if key in self.deferred:
+            # 순서를 기다리던 에셋이 바로 필요해지면 먼저 시작
+            self._start(key, *self.deferred.pop(key))
+        if key not in self.pending:
+            return False
+        with get_profiler().scope("asset.wait"):
+            # 실패한 디코딩도 여기서 예외를 내지 않음 - _finish가 finish(None)으로 넘김
+            wait_futures([self.pending[key]])
+            self._finish(key)
+        return True
+
+    def wait_all(self, critical_only: bool = False):
+        for key in list(self.critical):
+            self.wait(key)
+        if not critical_only:
+            self._start_deferred()
+            for key in list(self.pending):
+                self.wait(key)
+
+    def is_ready(self) -> bool:
+        # 메뉴를 띄우는 데 필요한 에셋이 모두 반영됐는지 (나머지는 백그라운드)
+        return not self.critical
+
+    def get_progress(self) -> float:
+        if self.total == 0:
+            return 1.0
+        return self.finished / self.total
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
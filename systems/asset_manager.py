@@ -1,27 +1,81 @@
 import os
-from typing import Dict, Optional, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
 
 import pygame
 
+from config import HEADLESS_ENV_VAR, HIT_FLASH_TINT
+from systems.asset_cache import AssetCache
+from systems.asset_loader import AssetLoader
+from systems.sprite_atlas import SpriteAtlas
+from utils.profiler import get_profiler
+
+# 좌우 반전/틴트 변형을 로드 시점에 미리 만들어 두는 스프라이트
+VARIANT_SPRITE_PREFIXES = ("player", "slime", "skeleton", "boss")
+VARIANT_TINTS = (None, HIT_FLASH_TINT)
+# 메뉴를 띄운 뒤 백그라운드에서 마저 읽는 스프라이트 (2~3스테이지 배경, 엔딩, 보스)
+DEFERRED_SPRITE_PREFIXES = ("bg_stage2", "bg_stage3", "cutscene_", "boss_")
+
+SpriteVariantKey = Tuple[str, bool, Optional[Tuple[int, ...]]]
+
+
+def _decode_image(path: str, size: Tuple[int, int]) -> pygame.Surface:
+    # 워커 스레드에서 실행 - 디스플레이 포맷 변환은 메인 스레드에서
+    image = pygame.image.load(path)
+    if image.get_size() != size:
+        image = pygame.transform.scale(image, size)
+    return image
+
+
+def get_sheet_frame_count(
+    source_size: Tuple[int, int], frame_size: Tuple[int, int]
+) -> int:
+    # 시트는 프레임을 가로로 이어 붙인 것 - 원본 프레임도 frame_size와 같은 비율로 봄
+    source_frame_width = source_size[1] * frame_size[0] / frame_size[1]
+    return max(1, round(source_size[0] / source_frame_width))
+
+
+def _decode_sheet(path: str, frame_size: Tuple[int, int]) -> pygame.Surface:
+    image = pygame.image.load(path)
+    frame_count = get_sheet_frame_count(image.get_size(), frame_size)
+    size = (frame_size[0] * frame_count, frame_size[1])
+    if image.get_size() != size:
+        image = pygame.transform.scale(image, size)
+    return image
+
+
+def get_frame_key(name: str, index: int) -> str:
+    # 시트의 첫 프레임은 시트 이름 그대로 - 한 장짜리 시트는 예전 스프라이트와 같음
+    return name if index == 0 else f"{name}#{index}"
+
 
 class AssetManager:
     _instance = None
 
-    def __new__(cls):
+    def __new__(cls, wait: bool = True):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, wait: bool = True):
         if self._initialized:
             return
 
         self._initialized = True
         self.sprites: Dict[str, pygame.Surface] = {}
+        self.sprite_variants: Dict[SpriteVariantKey, pygame.Surface] = {}
+        # 시트 이름 -> 프레임 스프라이트 키들 / (시트, 반전, 틴트) -> 공유 프레임 리스트
+        self.sheets: Dict[str, List[str]] = {}
+        self.frame_lists: Dict[SpriteVariantKey, List[pygame.Surface]] = {}
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.music_paths: Dict[str, str] = {}
+        self.current_music: Optional[str] = None
         self.base_path = "assets"
+        # 이전 실행에서 변환해 둔 픽셀이 있으면 디코딩 없이 바로 씀
+        self.cache = AssetCache()
+        self.loader = AssetLoader(on_complete=self._on_assets_loaded)
+        self.atlas: Optional[SpriteAtlas] = None
 
         self.dummy_colors = {
             "player": (100, 150, 255),
@@ -38,11 +92,69 @@ class AssetManager:
             "default": (150, 150, 150),
         }
 
-        self._load_all_assets()
-
-    def _load_all_assets(self):
-        self._load_sprites()
-        self._load_audio()
+        self._load_all_assets(wait)
+
+    def _load_all_assets(self, wait: bool = True):
+        # 파일 디코딩은 스레드 풀에 맡기고, wait이면 전부 반영될 때까지 기다림
+        profiler = get_profiler()
+        with profiler.scope("asset.sprites"):
+            self._load_sprites()
+        with profiler.scope("asset.audio"):
+            self._load_audio()
+        self.loader.seal()
+        if wait:
+            self.wait_until_loaded()
+
+    def _on_assets_loaded(self):
+        self.cache.save()
+        self._build_atlas()
+
+    def _build_atlas(self):
+        # 다 읽은 뒤 작은 스프라이트와 미리 만든 변형을 아틀라스 페이지로 옮김
+        atlas = SpriteAtlas()
+        packed = {}
+        for name, sprite in self.sprites.items():
+            if atlas.can_pack(sprite):
+                packed[name] = sprite
+        for key, variant in self.sprite_variants.items():
+            if atlas.can_pack(variant):
+                packed[key] = variant
+
+        for key, subsurface in atlas.build(packed).items():
+            if isinstance(key, str):
+                self.sprites[key] = subsurface
+            else:
+                self.sprite_variants[key] = subsurface
+        self.atlas = atlas
+
+        # 애니메이션이 들고 있는 리스트를 그대로 두고 내용만 아틀라스 쪽으로 바꿈
+        for (name, flip_x, tint), frames in self.frame_lists.items():
+            frames[:] = self._collect_frames(name, flip_x, tint)
+
+    def get_sprite_region(
+        self,
+        name: str,
+        flip_x: bool = False,
+        tint: Optional[Tuple[int, ...]] = None,
+    ) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        # 배치 그리기용 (아틀라스 페이지, 영역) - 아틀라스에 없으면 None
+        if self.atlas is None:
+            return None
+        key = name if not flip_x and not tint else (name, flip_x, tint)
+        return self.atlas.get_region(key)
+
+    def poll(self) -> int:
+        return self.loader.poll()
+
+    def is_ready(self) -> bool:
+        self.loader.poll()
+        return self.loader.is_ready()
+
+    def get_load_progress(self) -> float:
+        return self.loader.get_progress()
+
+    def wait_until_loaded(self, critical_only: bool = False):
+        self.loader.wait_all(critical_only)
 
     def _load_sprites(self):
         # UI 하트
@@ -58,79 +170,73 @@ class AssetManager:
         self._load_sprite("icon_health", "ui/icons/health.png", (30, 30))
 
         # 플레이어
-        self._load_sprite("player_idle", "sprites/player/idle.png", (64, 64))
-        self._load_sprite("player_run", "sprites/player/run.png", (64, 64))
-        self._load_sprite("player_jump", "sprites/player/jump.png", (64, 64))
-        self._load_sprite("player_fall", "sprites/player/fall.png", (64, 64))
-        self._load_sprite("player_dash", "sprites/player/dash.png", (64, 64))
-        self._load_sprite("player_attack", "sprites/player/attack.png", (64, 64))
-        self._load_sprite("player_hit", "sprites/player/hit.png", (64, 64))
-        self._load_sprite("player_death", "sprites/player/death.png", (64, 64))
+        self._load_sheet("player_idle", "sprites/player/idle.png", (64, 64))
+        self._load_sheet("player_run", "sprites/player/run.png", (64, 64))
+        self._load_sheet("player_jump", "sprites/player/jump.png", (64, 64))
+        self._load_sheet("player_fall", "sprites/player/fall.png", (64, 64))
+        self._load_sheet("player_dash", "sprites/player/dash.png", (64, 64))
+        self._load_sheet("player_attack", "sprites/player/attack.png", (64, 64))
+        self._load_sheet("player_hit", "sprites/player/hit.png", (64, 64))
+        self._load_sheet("player_death", "sprites/player/death.png", (64, 64))
 
         # 슬라임 (파랑)
-        self._load_sprite(
+        self._load_sheet(
             "slime_blue_idle", "sprites/enemies/slime/blue_idle.png", (48, 48)
         )
-        self._load_sprite(
+        self._load_sheet(
             "slime_blue_jump", "sprites/enemies/slime/blue_jump.png", (48, 48)
         )
-        self._load_sprite(
+        self._load_sheet(
             "slime_blue_hurt", "sprites/enemies/slime/blue_hurt.png", (48, 48)
         )
-        self._load_sprite(
+        self._load_sheet(
             "slime_blue_death", "sprites/enemies/slime/blue_death.png", (48, 48)
         )
 
         # 슬라임 (초록)
-        self._load_sprite(
+        self._load_sheet(
             "slime_green_idle", "sprites/enemies/slime/green_idle.png", (48, 48)
         )
-        self._load_sprite(
+        self._load_sheet(
             "slime_green_jump", "sprites/enemies/slime/green_jump.png", (48, 48)
         )
-        self._load_sprite(
+        self._load_sheet(
             "slime_green_hurt", "sprites/enemies/slime/green_hurt.png", (48, 48)
         )
-        self._load_sprite(
+        self._load_sheet(
             "slime_green_death", "sprites/enemies/slime/green_death.png", (48, 48)
         )
 
         # 슬라임 (빨강)
-        self._load_sprite(
+        self._load_sheet(
             "slime_red_idle", "sprites/enemies/slime/red_idle.png", (48, 48)
         )
-        self._load_sprite(
+        self._load_sheet(
             "slime_red_jump", "sprites/enemies/slime/red_jump.png", (48, 48)
         )
-        self._load_sprite(
+        self._load_sheet(
             "slime_red_hurt", "sprites/enemies/slime/red_hurt.png", (48, 48)
         )
-        self._load_sprite(
+        self._load_sheet(
             "slime_red_death", "sprites/enemies/slime/red_death.png", (48, 48)
         )
 
         # 스켈레톤
-        self._load_sprite(
-            "skeleton_idle", "sprites/enemies/skeleton/idle.png", (48, 48)
-        )
-        self._load_sprite(
-            "skeleton_walk", "sprites/enemies/skeleton/walk.png", (48, 48)
-        )
-        self._load_sprite(
+        self._load_sheet("skeleton_idle", "sprites/enemies/skeleton/idle.png", (48, 48))
+        self._load_sheet("skeleton_walk", "sprites/enemies/skeleton/walk.png", (48, 48))
+        self._load_sheet(
             "skeleton_attack", "sprites/enemies/skeleton/attack.png", (48, 48)
         )
-        self._load_sprite(
-            "skeleton_hurt", "sprites/enemies/skeleton/hurt.png", (48, 48)
-        )
-        self._load_sprite(
+        self._load_sheet("skeleton_hurt", "sprites/enemies/skeleton/hurt.png", (48, 48))
+        self._load_sheet(
             "skeleton_death", "sprites/enemies/skeleton/death.png", (48, 48)
         )
 
         # 보스
-        self._load_sprite("boss_idle", "sprites/boss/idle.png", (96, 96))
-        self._load_sprite("boss_attack", "sprites/boss/attack.png", (96, 96))
-        self._load_sprite("boss_hurt", "sprites/boss/hurt.png", (96, 96))
-        self._load_sprite("boss_death", "sprites/boss/death.png", (96, 96))
+        self._load_sheet("boss_idle", "sprites/boss/idle.png", (96, 96))
+        self._load_sheet("boss_attack", "sprites/boss/attack.png", (96, 96))
+        self._load_sheet("boss_hurt", "sprites/boss/hurt.png", (96, 96))
+        self._load_sheet("boss_death", "sprites/boss/death.png", (96, 96))
 
         # 아이템
         self._load_sprite("item_health", "sprites/items/health_potion.png", (30, 30))
@@ -184,16 +290,92 @@ class AssetManager:
 
     def _load_sprite(self, name: str, path: str, size: Tuple[int, int]):
         full_path = os.path.join(self.base_path, path)
+        if not os.path.exists(full_path):
+            self._create_dummy_sprite(name, size)
+            return
+
+        cached = self.cache.get(name, full_path, size)
+        if cached is not None:
+            self._set_sprite(name, cached)
+            return
+
+        self.loader.submit(
+            ("sprite", name),
+            partial(_decode_image, full_path, size),
+            partial(self._finish_sprite, name, full_path, size),
+            deferred=name.startswith(DEFERRED_SPRITE_PREFIXES),
+        )
+
+    def _load_sheet(self, name: str, path: str, frame_size: Tuple[int, int]):
+        # 가로 스프라이트 시트 - 프레임 수는 파일을 읽어 봐야 알 수 있음
+        full_path = os.path.join(self.base_path, path)
+        if not os.path.exists(full_path):
+            self._create_dummy_sprite(name, frame_size)
+            self.sheets[name] = [name]
+            return
+
+        cached = self.cache.get(name, full_path)
+        if (
+            cached is not None
+            and cached.get_height() == frame_size[1]
+            and cached.get_width() % frame_size[0] == 0
+        ):
+            self._set_sheet(name, cached, frame_size)
+            return
+
+        self.loader.submit(
+            ("sprite", name),
+            partial(_decode_sheet, full_path, frame_size),
+            partial(self._finish_sheet, name, full_path, frame_size),
+            deferred=name.startswith(DEFERRED_SPRITE_PREFIXES),
+        )
+
+    def _finish_sheet(
+        self,
+        name: str,
+        path: str,
+        frame_size: Tuple[int, int],
+        image: Optional[pygame.Surface],
+    ):
         try:
-            if os.path.exists(full_path):
-                sprite = pygame.image.load(full_path).convert_alpha()
-                if sprite.get_size() != size:
-                    sprite = pygame.transform.scale(sprite, size)
-                self.sprites[name] = sprite
+            sheet = image.convert_alpha()
+        except:
+            self._create_dummy_sprite(name, frame_size)
+            self.sheets[name] = [name]
+            return
+        self._set_sheet(name, sheet, frame_size)
+        self.cache.store(name, path, sheet.get_size(), sheet)
+
+    def _set_sheet(self, name: str, sheet: pygame.Surface, frame_size: Tuple[int, int]):
+        frame_width, frame_height = frame_size
+        frame_count = sheet.get_width() // frame_width
+        keys = []
+        for index in range(frame_count):
+            if frame_count == 1:
+                frame = sheet
             else:
-                self._create_dummy_sprite(name, size)
+                frame = sheet.subsurface(
+                    (index * frame_width, 0, frame_width, frame_height)
+                )
+            key = get_frame_key(name, index)
+            self._set_sprite(key, frame)
+            keys.append(key)
+        self.sheets[name] = keys
+
+    def _finish_sprite(
+        self,
+        name: str,
+        path: str,
+        size: Tuple[int, int],
+        image: Optional[pygame.Surface],
+    ):
+        try:
+            sprite = image.convert_alpha()
         except:
             self._create_dummy_sprite(name, size)
+            return
+        self._set_sprite(name, sprite)
+        self.cache.store(name, path, size, sprite)
 
     def _create_dummy_sprite(self, name: str, size: Tuple[int, int]):
         sprite_type = name.split("_")[0]
@@ -201,7 +383,30 @@ class AssetManager:
         surface = pygame.Surface(size, pygame.SRCALPHA)
         surface.fill(color)
         pygame.draw.rect(surface, (0, 0, 0), surface.get_rect(), 2)
-        self.sprites[name] = surface
+        self._set_sprite(name, surface)
+
+    def _set_sprite(self, name: str, sprite: pygame.Surface):
+        self.sprites[name] = sprite
+        if name.startswith(VARIANT_SPRITE_PREFIXES):
+            self._build_sprite_variants(name)
+
+    def _build_sprite_variants(self, name: str):
+        for flip_x in (False, True):
+            for tint in VARIANT_TINTS:
+                self.get_sprite_variant(name, flip_x, tint)
+
+    def _create_sprite_variant(
+        self,
+        sprite: pygame.Surface,
+        flip_x: bool,
+        tint: Optional[Tuple[int, ...]],
+    ) -> pygame.Surface:
+        if flip_x:
+            sprite = pygame.transform.flip(sprite, True, False)
+        if tint:
+            sprite = sprite.copy()
+            sprite.fill(tint, special_flags=pygame.BLEND_RGBA_MULT)
+        return sprite
 
     def _register_music(self, name: str, path: str):
         full_path = os.path.join(self.base_path, path)
@@ -209,17 +414,75 @@ class AssetManager:
 
     def _load_sound(self, name: str, path: str):
         full_path = os.path.join(self.base_path, path)
-        try:
-            if os.path.exists(full_path):
-                self.sounds[name] = pygame.mixer.Sound(full_path)
-        except:
-            pass
+        if os.path.exists(full_path):
+            self.loader.submit(
+                ("sound", name),
+                partial(pygame.mixer.Sound, full_path),
+                partial(self._finish_sound, name),
+            )
+
+    def _finish_sound(self, name: str, sound: Optional[pygame.mixer.Sound]):
+        if sound is not None:
+            self.sounds[name] = sound
 
     def get_sprite(self, name: str) -> Optional[pygame.Surface]:
-        return self.sprites.get(name)
+        sprite = self.sprites.get(name)
+        # 아직 백그라운드에서 읽는 중이면 그 파일만 기다림
+        if sprite is None and self.loader.wait(("sprite", name)):
+            sprite = self.sprites.get(name)
+        return sprite
+
+    def get_sprite_variant(
+        self,
+        name: str,
+        flip_x: bool = False,
+        tint: Optional[Tuple[int, ...]] = None,
+    ) -> Optional[pygame.Surface]:
+        if not flip_x and not tint:
+            return self.sprites.get(name)
+
+        key = (name, flip_x, tint)
+        variant = self.sprite_variants.get(key)
+        if variant is None:
+            sprite = self.get_sprite(name)
+            if sprite is None:
+                return None
+            variant = self._create_sprite_variant(sprite, flip_x, tint)
+            get_profiler().count("surfaces")
+            self.sprite_variants[key] = variant
+        return variant
+
+    def _collect_frames(
+        self, name: str, flip_x: bool, tint: Optional[Tuple[int, ...]]
+    ) -> List[pygame.Surface]:
+        frames = []
+        for key in self.sheets.get(name, ()):
+            frame = self.get_sprite_variant(key, flip_x, tint)
+            if frame is not None:
+                frames.append(frame)
+        return frames
+
+    def get_frames(
+        self,
+        name: str,
+        flip_x: bool = False,
+        tint: Optional[Tuple[int, ...]] = None,
+    ) -> List[pygame.Surface]:
+        # 같은 시트/변형은 항상 같은 리스트를 돌려줌 - 모든 인스턴스가 프레임을 공유
+        key = (name, flip_x, tint)
+        frames = self.frame_lists.get(key)
+        if frames is None:
+            if name not in self.sheets:
+                self.loader.wait(("sprite", name))
+            frames = self._collect_frames(name, flip_x, tint)
+            self.frame_lists[key] = frames
+        return frames
 
     def get_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
-        return self.sounds.get(name)
+        sound = self.sounds.get(name)
+        if sound is None and self.loader.wait(("sound", name)):
+            sound = self.sounds.get(name)
+        return sound
 
     def get_music_path(self, name: str) -> Optional[str]:
         return self.music_paths.get(name)
@@ -234,18 +497,116 @@ class AssetManager:
         music_path = self.get_music_path(name)
         if music_path:
             try:
+                # 같은 곡이 이미 재생 중이면 파일을 다시 읽지 않음
+                if name == self.current_music and pygame.mixer.music.get_busy():
+                    pygame.mixer.music.set_volume(volume)
+                    return
+
                 pygame.mixer.music.load(music_path)
                 pygame.mixer.music.set_volume(volume)
                 pygame.mixer.music.play(loops)
+                self.current_music = name
             except:
-                pass
+                self.current_music = None
 
     def stop_music(self):
+        self.current_music = None
         pygame.mixer.music.stop()
 
     def fade_out_music(self, milliseconds: int = 1000):
+        self.current_music = None
         pygame.mixer.music.fadeout(milliseconds)
 
 
-def get_asset_manager() -> AssetManager:
+class NullAssetManager:
+    # 헤드리스 모드용 - 파일을 읽지 않고 소리도 내지 않음
+    def __init__(self):
+        self.sprites: Dict[str, pygame.Surface] = {}
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.music_paths: Dict[str, str] = {}
+
+    def poll(self) -> int:
+        return 0
+
+    def is_ready(self) -> bool:
+        return True
+
+    def get_load_progress(self) -> float:
+        return 1.0
+
+    def wait_until_loaded(self, critical_only: bool = False):
+        pass
+
+    def get_sprite_region(
+        self,
+        name: str,
+        flip_x: bool = False,
+        tint: Optional[Tuple[int, ...]] = None,
+    ) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        return None
+
+    def get_sprite(self, name: str) -> Optional[pygame.Surface]:
+        return None
+
+    def get_sprite_variant(
+        self,
+        name: str,
+        flip_x: bool = False,
+        tint: Optional[Tuple[int, ...]] = None,
+    ) -> Optional[pygame.Surface]:
+        return None
+
+    def get_frames(
+        self,
+        name: str,
+        flip_x: bool = False,
+        tint: Optional[Tuple[int, ...]] = None,
+    ) -> List[pygame.Surface]:
+        return []
+
+    def get_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
+        return None
+
+    def get_music_path(self, name: str) -> Optional[str]:
+        return None
+
+    def play_sound(self, name: str, volume: float = 1.0):
+        pass
+
+    def play_music(self, name: str, loops: int = -1, volume: float = 0.5):
+        pass
+
+    def stop_music(self):
+        pass
+
+    def fade_out_music(self, milliseconds: int = 1000):
+        pass
+
+
+_headless = os.environ.get(HEADLESS_ENV_VAR, "") not in ("", "0")
+_null_asset_manager: Optional[NullAssetManager] = None
+
+
+def set_headless(enabled: bool = True):
+    global _headless
+    _headless = enabled
+
+
+def is_headless() -> bool:
+    return _headless
+
+
+def get_asset_manager() -> Union[AssetManager, NullAssetManager]:
+    global _null_asset_manager
+    if _headless:
+        if _null_asset_manager is None:
+            _null_asset_manager = NullAssetManager()
+        return _null_asset_manager
     return AssetManager()
+
+
+def start_asset_loading() -> Union[AssetManager, NullAssetManager]:
+    # 창을 띄운 직후 호출 - 기다리지 않고 바로 돌려줌 (is_ready/poll로 진행 확인)
+    if _headless:
+        return get_asset_manager()
+    return AssetManager(wait=False)
@@ -0,0 +1,38 @@
+import pygame
+
+from config import *
+
+
+class Camera:
+    # 가로 스크롤 전용 - 스테이지 높이는 화면 높이와 같음
+    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT):
+        self.width = width
+        self.height = height
+        self.x = 0
+        self.world_width = width
+
+    def set_world(self, world_width: int):
+        self.world_width = max(world_width, self.width)
+        self.x = 0
+
+    def is_scrolling(self) -> bool:
+        return self.world_width > self.width
+
+    def get_target_x(self, target) -> int:
+        # 대상을 화면 가운데에 두되 월드 밖은 보이지 않게 고정
+        x = int(target.x + target.width / 2 - self.width / 2)
+        return max(0, min(x, self.world_width - self.width))
+
+    def follow(self, target):
+        self.x = self.get_target_x(target)
+
+    def get_view_rect(self, margin: int = 0) -> pygame.Rect:
+        return pygame.Rect(
+            self.x - margin, -margin, self.width + margin * 2, self.height + margin * 2
+        )
+
+    def world_to_screen(self, x: float, y: float):
+        return (x - self.x, y)
+
+    def screen_to_world(self, x: float, y: float):
+        return (x + self.x, y)
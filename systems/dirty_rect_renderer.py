@@ -0,0 +1,91 @@
+from typing import Iterable, List, Optional, Tuple
+
+import pygame
+
+from config import *
+
+# 매 프레임 다시 그리는 HUD 영역 (상단 HUD/보스 HUD/아이템 메시지, 좌하단 통계)
+HUD_RECTS = [
+    pygame.Rect(0, 0, SCREEN_WIDTH, 125),
+    pygame.Rect(0, SCREEN_HEIGHT - 65, 400, 65),
+]
+
+
+class DirtyRectRenderer:
+    def __init__(self, stage_render_cache):
+        self.cache = stage_render_cache
+        self.screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.previous_rects: List[pygame.Rect] = []
+        self.current_rects: List[pygame.Rect] = []
+        self.full_redraw = True
+        self.force_full = True
+        self.last_shake_offset = (0, 0)
+        self.last_camera_x = 0
+
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self):
+        self.force_full = True
+
+    def _clip(self, rects: Iterable[pygame.Rect]) -> List[pygame.Rect]:
+        clipped = []
+        for rect in rects:
+            rect = rect.clip(self.screen_rect)
+            if rect.width > 0 and rect.height > 0:
+                clipped.append(rect)
+        return clipped
+
+    def begin_frame(
+        self,
+        screen: pygame.Surface,
+        stage: int,
+        platforms,
+        entities: Iterable,
+        shake_offset: Tuple[int, int] = (0, 0),
+        extra_rects: Iterable[pygame.Rect] = (),
+        camera_x: int = 0,
+    ):
+        rebuilt = self.cache.update(stage, platforms, camera_x)
+
+        # 엔티티 좌표는 월드 기준, extra_rects는 이미 화면 기준
+        offset = (shake_offset[0] - camera_x, shake_offset[1])
+        rects = [entity.get_draw_rect(offset) for entity in entities]
+        rects.extend(extra_rects)
+        rects.extend(HUD_RECTS)
+        self.current_rects = self._clip(rects)
+
+        # 화면 흔들림/스크롤 중이거나 막 끝난 프레임은 전체를 다시 그림
+        self.full_redraw = (
+            self.force_full
+            or rebuilt
+            or shake_offset != (0, 0)
+            or self.last_shake_offset != (0, 0)
+            or camera_x != self.last_camera_x
+            or not self.cache.is_composed()
+        )
+        self.force_full = False
+        self.last_shake_offset = shake_offset
+        self.last_camera_x = camera_x
+
+        if self.full_redraw:
+            self.cache.draw_static(screen, shake_offset)
+        else:
+            # 이전 위치(지우기)와 현재 위치(다시 그리기)만 캐시에서 복원
+            for rect in self.previous_rects:
+                self.cache.restore(screen, rect)
+            for rect in self.current_rects:
+                self.cache.restore(screen, rect)
+
+        self.cache.draw_dynamic(screen, shake_offset)
+
+    def end_frame(self) -> Optional[List[pygame.Rect]]:
+        if self.full_redraw:
+            self.full_frames += 1
+            rects = None
+        else:
+            self.partial_frames += 1
+            rects = self.previous_rects + self.current_rects
+
+        self.previous_rects = self.current_rects
+        return rects
@@ -1,4 +1,5 @@
 import os
+import random
 import sys
 import time
 
@@ -9,33 +10,53 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import *
 from entities.boss import Boss
 from entities.player import Player
-from entities.projectile import Fire, Projectile
+from entities.projectile import Fire
 from systems.asset_manager import get_asset_manager
+from systems.camera import Camera
+from systems.render_queue import RenderQueue
+from systems.dirty_rect_renderer import DirtyRectRenderer
+from systems.projectile_pool import ProjectilePool
 from systems.stage_manager import StageManager
+from systems.stage_render_cache import StageRenderCache
 from systems.ui_manager import UIManager
 from utils import (
+    ParticleSystem,
     check_collision,
     check_rect_collision,
-    create_particle_burst,
-    draw_particles,
     get_attack_box,
     get_entity_box,
     shake_screen,
-    update_particles,
 )
+from utils.profiler import get_profiler
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None):
+        # 리플레이 재현을 위해 게임 로직의 난수는 전부 이 RNG를 사용
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
         self.assets = get_asset_manager()
         self.player = Player(100, 500)
         self.stage_manager = StageManager()
+        self.stage_manager.rng = self.rng
         self.ui_manager = UIManager()
+        self.stage_render_cache = StageRenderCache()
+        self.camera = Camera()
+        self.screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.render_queue = RenderQueue()
+        self.profiler = get_profiler()
+        # None이면 매 프레임 전체를 그림
+        self.dirty_rect_renderer = None
 
         self.boss = None
-        self.projectiles = []
+        # 스테이지 시작 직후 보스 상태 (재시작 때 제자리 복원용)
+        self.boss_snapshot = None
+        self.projectiles = ProjectilePool()
         self.fires = []
-        self.particles = []
+        self.particles = ParticleSystem()
 
         self.game_state = GAME_STATE_MENU
         self.deaths = 0
@@ -60,6 +81,7 @@ class Game:
         self.assets.stop_music()
 
     def start_game(self):
+        self.rng.seed(self.seed)
         self.game_state = GAME_STATE_PLAYING
         self.deaths = 0
         self.start_time = time.time()
@@ -68,8 +90,13 @@ class Game:
         self.stage_checkpoints = {1: False, 2: False, 3: False}
         self.load_stage(1)
 
+    @get_profiler().profiled("stage.load")
     def load_stage(self, stage_num):
         self.stage_manager.load_stage(stage_num, self.player)
+        self.reset_camera()
+        self.stage_render_cache.invalidate()
+        if self.dirty_rect_renderer:
+            self.dirty_rect_renderer.invalidate()
 
         if (
             stage_num not in self.stage_checkpoints
@@ -78,32 +105,135 @@ class Game:
             self.stage_checkpoints[stage_num] = True
             self.checkpoint_stage = stage_num
 
-        if stage_num in [1, 2]:
-            self.play_music()
-        elif stage_num == 3:
-            self.assets.play_music("boss_bgm", loops=-1, volume=0.5)
+        definition = self.stage_manager.definition
+        self.assets.play_music(definition.music, loops=-1, volume=0.5)
 
-        if stage_num == 3:
-            self.boss = Boss(SCREEN_WIDTH // 2 - 48, 480)
+        if definition.boss_position is not None:
+            self.boss = Boss(*definition.boss_position)
+            self.boss.rng = self.rng
             self.platform_collapse_triggered = False
         else:
             self.boss = None
 
-        self.projectiles = []
+        self.projectiles.clear()
         self.fires = []
-        self.particles = []
+        self.particles.clear()
+        self.snapshot_stage()
+
+    def snapshot_stage(self):
+        # 스테이지 엔티티의 시작 상태는 StageManager 템플릿이 들고 있음
+        self.boss_snapshot = self.boss.clone() if self.boss else None
+
+    @get_profiler().profiled("stage.restore")
+    def restore_stage(self):
+        # 같은 스테이지에서 죽었으면 다시 로드하지 않고 기존 객체를 되돌림
+        if self.stage_manager.current_stage != self.checkpoint_stage:
+            return False
+        if (self.boss is None) != (self.boss_snapshot is None):
+            return False
+        if not self.stage_manager.restore_stage(self.player):
+            return False
+        self.reset_camera()
+
+        self.stage_render_cache.invalidate()
+        if self.dirty_rect_renderer:
+            self.dirty_rect_renderer.invalidate()
+
+        definition = self.stage_manager.definition
+        self.assets.play_music(definition.music, loops=-1, volume=0.5)
+
+        if self.boss:
+            self.boss.restore_state(self.boss_snapshot)
+            self.boss.rng = self.rng
+            self.platform_collapse_triggered = False
+
+        self.projectiles.clear()
+        self.fires.clear()
+        self.particles.clear()
+        return True
+
+    def reset_camera(self):
+        self.camera.set_world(self.stage_manager.get_world_width())
+        self.update_camera()
+
+    def update_camera(self):
+        # 카메라가 움직이면 깨어 있는 청크 범위도 같이 옮김
+        self.camera.follow(self.player)
+        self.stage_manager.set_view(self.camera.x, self.camera.x + self.camera.width)
 
     def restart_stage(self):
         self.deaths += 1
         self.player.health = self.player.max_health
         self.player.invincible_time = 60
-        self.load_stage(self.checkpoint_stage)
+        if not self.restore_stage():
+            self.load_stage(self.checkpoint_stage)
+
+    def get_interpolated_entities(self):
+        entities = [self.player]
+        entities.extend(self.stage_manager.get_active_enemies())
+        entities.extend(self.stage_manager.get_active_traps())
+        entities.extend(self.projectiles)
+        if self.boss:
+            entities.append(self.boss)
+        return entities
+
+    def save_previous_positions(self):
+        for entity in self.get_interpolated_entities():
+            entity.save_previous_position()
+
+    def _count_sleeping(self):
+        world = self.stage_manager.world
+        sleeping = world.get_sleeping_count()
+        awake = len(world.enemies.get_active()) + len(world.traps.get_active())
+        self.profiler.count("entities.awake", awake)
+        self.profiler.count("entities.sleeping", sleeping)
 
     def update(self, keys):
         if self.game_state != GAME_STATE_PLAYING:
             return
 
-        self.player.update(keys, self.stage_manager.platforms)
+        profiler = self.profiler
+        self.save_previous_positions()
+
+        platform_grid = self.stage_manager.platform_grid
+        enemy_grid = self.stage_manager.enemy_grid
+
+        with profiler.scope("update.player"):
+            self._update_player(keys, platform_grid)
+        self.update_camera()
+        if profiler.enabled:
+            self._count_sleeping()
+        with profiler.scope("update.enemies"):
+            self._update_enemies(platform_grid, enemy_grid)
+        with profiler.scope("update.projectiles"):
+            self._update_projectiles(platform_grid, enemy_grid)
+        with profiler.scope("update.fires"):
+            self._update_fires()
+        with profiler.scope("update.traps"):
+            self._update_traps()
+        self._update_checkpoints()
+        if self.boss:
+            with profiler.scope("update.boss"):
+                self._update_boss(platform_grid)
+        with profiler.scope("update.particles"):
+            self.particles.update()
+
+        if self.screen_shake_timer > 0:
+            self.screen_shake_timer -= 1
+
+        if self.item_message_timer > 0:
+            self.item_message_timer -= 1
+
+        if self.player.health <= 0 or self.player.y > SCREEN_HEIGHT:
+            self.restart_stage()
+
+        if self.stage_manager.is_at_exit(self.player):
+            next_stage = self.stage_manager.get_next_stage()
+            if next_stage:
+                self.load_stage(next_stage)
+
+    def _update_player(self, keys, platform_grid):
+        self.player.update(keys, platform_grid, self.camera.world_width)
 
         if keys[pygame.K_x]:
             self.ranged_attack()
@@ -112,8 +242,18 @@ class Game:
 
         self.stage_manager.update_platforms(self.player)
 
-        for enemy in self.stage_manager.enemies:
-            enemy.update(self.stage_manager.platforms, self.player)
+    def _update_enemies(self, platform_grid, enemy_grid):
+        world_width = self.camera.world_width
+        relocate = self.stage_manager.world.enemies.relocate
+        # 카메라에서 먼 청크의 적은 잠든 상태로 두고 업데이트하지 않음
+        for enemy in self.stage_manager.get_active_enemies():
+            enemy.update(platform_grid, self.player, world_width)
+
+            if enemy.alive:
+                enemy_grid.move(enemy)
+                relocate(enemy)
+            else:
+                enemy_grid.remove(enemy)
 
             if enemy.alive and self.player.invincible_time <= 0:
                 if check_rect_collision(
@@ -128,35 +268,36 @@ class Game:
                 ):
                     self.player.take_damage()
 
-        for projectile in self.projectiles[:]:
-            projectile.update()
+    def _update_projectiles(self, platform_grid, enemy_grid):
+        projectiles = self.projectiles
+        active = projectiles.active
+        min_x = self.camera.x - 50
+        max_x = self.camera.x + self.camera.width + 50
+        index = 0
+        # release가 마지막 투사체를 현재 자리로 옮기므로 index를 그대로 두고 다시 처리
+        while index < len(active):
+            projectile = active[index]
+            projectile.update(min_x, max_x)
 
             if not projectile.active:
-                self.projectiles.remove(projectile)
+                projectiles.release(projectile)
                 continue
+            index += 1
 
             if projectile.from_player:
-                for enemy in self.stage_manager.enemies:
-                    if enemy.alive and check_rect_collision(
-                        projectile.x,
-                        projectile.y,
-                        projectile.width,
-                        projectile.height,
-                        enemy.x,
-                        enemy.y,
-                        enemy.width,
-                        enemy.height,
-                    ):
+                for enemy in enemy_grid.query(
+                    projectile.x, projectile.y, projectile.width, projectile.height
+                ):
+                    if enemy.alive:
                         enemy.alive = False
+                        enemy_grid.remove(enemy)
                         projectile.active = False
                         self.assets.play_sound("enemy_death", volume=0.5)
-                        self.particles.extend(
-                            create_particle_burst(
-                                enemy.x + enemy.width // 2,
-                                enemy.y + enemy.height // 2,
-                                15,
-                                [YELLOW, ORANGE, WHITE],
-                            )
+                        self.particles.emit(
+                            enemy.x + enemy.width // 2,
+                            enemy.y + enemy.height // 2,
+                            15,
+                            [YELLOW, ORANGE, WHITE],
                         )
                         break
 
@@ -173,13 +314,11 @@ class Game:
                     if self.boss.take_damage(5):
                         projectile.active = False
                         self.assets.play_sound("boss_hit", volume=0.6)
-                        self.particles.extend(
-                            create_particle_burst(
-                                self.boss.x + self.boss.width // 2,
-                                self.boss.y + self.boss.height // 2,
-                                10,
-                                [RED, ORANGE, YELLOW],
-                            )
+                        self.particles.emit(
+                            self.boss.x + self.boss.width // 2,
+                            self.boss.y + self.boss.height // 2,
+                            10,
+                            [RED, ORANGE, YELLOW],
                         )
                         if self.boss.health <= 0:
                             self.victory_time = time.time()
@@ -188,10 +327,8 @@ class Game:
                             self.assets.play_sound("victory", volume=0.7)
                     else:
                         projectile.active = False
-                        self.particles.extend(
-                            create_particle_burst(
-                                projectile.x, projectile.y, 5, [WHITE, LIGHT_BLUE]
-                            )
+                        self.particles.emit(
+                            projectile.x, projectile.y, 5, [WHITE, LIGHT_BLUE]
                         )
             else:
                 if self.player.invincible_time <= 0 and check_rect_collision(
@@ -209,7 +346,7 @@ class Game:
 
             if projectile.type == "fireball" and projectile.active:
                 platform, fire_x, fire_y = projectile.check_platform_collision(
-                    self.stage_manager.platforms
+                    platform_grid
                 )
                 if platform:
                     projectile.active = False
@@ -217,6 +354,7 @@ class Game:
                     self.assets.play_sound("explosion", volume=0.5)
                     self.start_screen_shake(5)
 
+    def _update_fires(self):
         for fire in self.fires[:]:
             fire.update()
             if not fire.active:
@@ -236,13 +374,14 @@ class Game:
                 if fire.can_damage():
                     self.player.take_damage()
 
-        for trap in self.stage_manager.traps:
+    def _update_traps(self):
+        relocate = self.stage_manager.world.traps.relocate
+        for trap in self.stage_manager.get_active_traps():
             fire_signal = trap.update(self.player)
+            relocate(trap)
             if fire_signal:
                 direction = 1 if self.player.x > trap.x else -1
-                self.projectiles.append(
-                    Projectile(trap.x, trap.y, direction, "fireball")
-                )
+                self.projectiles.acquire(trap.x, trap.y, direction, "fireball")
 
             if trap.active and self.player.invincible_time <= 0:
                 if check_rect_collision(
@@ -260,66 +399,49 @@ class Game:
                     else:
                         self.player.take_damage()
 
-        for checkpoint in self.stage_manager.checkpoints:
+    def _update_checkpoints(self):
+        for checkpoint in self.stage_manager.get_active_checkpoints():
             if checkpoint.check_activation(self.player):
                 self.assets.play_sound("checkpoint", volume=0.5)
-                self.particles.extend(
-                    create_particle_burst(
-                        checkpoint.x + checkpoint.width // 2,
-                        checkpoint.y + checkpoint.height // 2,
-                        20,
-                        [GREEN, YELLOW, WHITE],
-                    )
+                self.particles.emit(
+                    checkpoint.x + checkpoint.width // 2,
+                    checkpoint.y + checkpoint.height // 2,
+                    20,
+                    [GREEN, YELLOW, WHITE],
                 )
 
-        if self.boss:
-            pattern, actions = self.boss.update(
-                self.player, self.stage_manager.platforms, self.projectiles
-            )
-
-            if actions:
-                for action in actions:
-                    self.handle_boss_action(action)
-
-            if self.player.invincible_time <= 0 and check_rect_collision(
-                self.player.x,
-                self.player.y,
-                self.player.width,
-                self.player.height,
-                self.boss.x,
-                self.boss.y,
-                self.boss.width,
-                self.boss.height,
-            ):
-                self.player.take_damage()
-
-            if (
-                not self.platform_collapse_triggered
-                and self.boss.health <= PLATFORM_COLLAPSE_HP_THRESHOLD
-            ):
-                self.trigger_platform_collapse()
-
-            if self.boss.health <= 0:
-                self.victory_time = time.time()
-                self.game_state = GAME_STATE_VICTORY
-                self.stop_music()
-                self.assets.play_sound("victory", volume=0.7)
-
-        update_particles(self.particles)
+    def _update_boss(self, platform_grid):
+        pattern, actions = self.boss.update(
+            self.player, platform_grid, self.projectiles
+        )
 
-        if self.screen_shake_timer > 0:
-            self.screen_shake_timer -= 1
+        if actions:
+            for action in actions:
+                self.handle_boss_action(action)
 
-        if self.item_message_timer > 0:
-            self.item_message_timer -= 1
+        if self.player.invincible_time <= 0 and check_rect_collision(
+            self.player.x,
+            self.player.y,
+            self.player.width,
+            self.player.height,
+            self.boss.x,
+            self.boss.y,
+            self.boss.width,
+            self.boss.height,
+        ):
+            self.player.take_damage()
 
-        if self.player.health <= 0 or self.player.y > SCREEN_HEIGHT:
-            self.restart_stage()
+        if (
+            not self.platform_collapse_triggered
+            and self.boss.health <= PLATFORM_COLLAPSE_HP_THRESHOLD
+        ):
+            self.trigger_platform_collapse()
 
-        if self.stage_manager.is_at_exit(self.player):
-            next_stage = self.stage_manager.get_next_stage()
-            if next_stage:
-                self.load_stage(next_stage)
+        if self.boss.health <= 0:
+            self.victory_time = time.time()
+            self.game_state = GAME_STATE_VICTORY
+            self.stop_music()
+            self.assets.play_sound("victory", volume=0.7)
 
     def handle_boss_action(self, action):
         action_type, data = action
@@ -332,23 +454,19 @@ class Game:
                     self.player.take_damage()
 
             for i in range(3):
-                self.particles.extend(
-                    create_particle_burst(data["x"], data["y"], 20, [YELLOW, ORANGE])
-                )
+                self.particles.emit(data["x"], data["y"], 20, [YELLOW, ORANGE])
 
             self.start_screen_shake(10)
 
         elif action_type == "flame":
             direction = data["direction"]
             angle = data.get("angle", 0)
-            self.projectiles.append(
-                Projectile(
-                    self.boss.x + 48,
-                    self.boss.y + 48,
-                    direction,
-                    "fireball",
-                    angle=angle,
-                )
+            self.projectiles.acquire(
+                self.boss.x + 48,
+                self.boss.y + 48,
+                direction,
+                "fireball",
+                angle=angle,
             )
 
         elif action_type == "slash":
@@ -374,24 +492,20 @@ class Game:
                     self.player.take_damage()
 
             if data.get("num", 0) == 2:
-                self.projectiles.append(
-                    Projectile(
-                        self.boss.x + 48,
-                        self.boss.y + 48,
-                        direction,
-                        "sword_beam",
-                        from_player=False,
-                    )
+                self.projectiles.acquire(
+                    self.boss.x + 48,
+                    self.boss.y + 48,
+                    direction,
+                    "sword_beam",
+                    from_player=False,
                 )
 
         elif action_type == "teleport":
-            self.particles.extend(
-                create_particle_burst(
-                    self.boss.x + self.boss.width // 2,
-                    self.boss.y + self.boss.height // 2,
-                    30,
-                    [PURPLE, PINK, CYAN],
-                )
+            self.particles.emit(
+                self.boss.x + self.boss.width // 2,
+                self.boss.y + self.boss.height // 2,
+                30,
+                [PURPLE, PINK, CYAN],
             )
 
     def melee_attack(self):
@@ -407,19 +521,25 @@ class Game:
             PLAYER_ATTACK_RANGE,
         )
 
-        for enemy in self.stage_manager.enemies:
+        enemy_grid = self.stage_manager.enemy_grid
+        attack_left, attack_top, attack_right, attack_bottom = attack_box
+        for enemy in enemy_grid.query(
+            attack_left,
+            attack_top,
+            attack_right - attack_left,
+            attack_bottom - attack_top,
+        ):
             if enemy.alive:
                 enemy_box = get_entity_box(enemy.x, enemy.y, enemy.width, enemy.height)
                 if check_collision(attack_box, enemy_box):
                     enemy.alive = False
+                    enemy_grid.remove(enemy)
                     self.assets.play_sound("enemy_death", volume=0.5)
-                    self.particles.extend(
-                        create_particle_burst(
-                            enemy.x + enemy.width // 2,
-                            enemy.y + enemy.height // 2,
-                            15,
-                            [YELLOW, WHITE],
-                        )
+                    self.particles.emit(
+                        enemy.x + enemy.width // 2,
+                        enemy.y + enemy.height // 2,
+                        15,
+                        [YELLOW, WHITE],
                     )
 
         if self.boss:
@@ -429,13 +549,11 @@ class Game:
             if check_collision(attack_box, boss_box):
                 if self.boss.take_damage(1):
                     self.assets.play_sound("boss_hit", volume=0.6)
-                    self.particles.extend(
-                        create_particle_burst(
-                            self.boss.x + self.boss.width // 2,
-                            self.boss.y + self.boss.height // 2,
-                            15,
-                            [RED, ORANGE, YELLOW],
-                        )
+                    self.particles.emit(
+                        self.boss.x + self.boss.width // 2,
+                        self.boss.y + self.boss.height // 2,
+                        15,
+                        [RED, ORANGE, YELLOW],
                     )
                     self.start_screen_shake(5)
 
@@ -445,13 +563,11 @@ class Game:
                         self.stop_music()
                         self.assets.play_sound("victory", volume=0.7)
                 else:
-                    self.particles.extend(
-                        create_particle_burst(
-                            self.boss.x + self.boss.width // 2,
-                            self.boss.y + self.boss.height // 2,
-                            10,
-                            [WHITE, LIGHT_BLUE, PURPLE],
-                        )
+                    self.particles.emit(
+                        self.boss.x + self.boss.width // 2,
+                        self.boss.y + self.boss.height // 2,
+                        10,
+                        [WHITE, LIGHT_BLUE, PURPLE],
                     )
 
     def ranged_attack(self):
@@ -466,10 +582,8 @@ class Game:
         )
         projectile_y = self.player.y + 15
 
-        self.projectiles.append(
-            Projectile(
-                projectile_x, projectile_y, direction, "player_energy", from_player=True
-            )
+        self.projectiles.acquire(
+            projectile_x, projectile_y, direction, "player_energy", from_player=True
         )
 
     def collect_item(self, item):
@@ -495,10 +609,8 @@ class Game:
         self.item_message_timer = 120
         self.assets.play_sound("item_collect", volume=0.5)
 
-        self.particles.extend(
-            create_particle_burst(
-                item.x + item.width // 2, item.y + item.height // 2, 20, [GOLD, YELLOW]
-            )
+        self.particles.emit(
+            item.x + item.width // 2, item.y + item.height // 2, 20, [GOLD, YELLOW]
         )
 
     def trigger_platform_collapse(self):
@@ -516,42 +628,117 @@ class Game:
             return shake_screen(self.screen_shake_intensity)
         return (0, 0)
 
-    def draw_game_screen(self, screen):
-        screen.fill(BLACK)
-
-        bg_sprite = self.assets.get_sprite(
-            f"bg_stage{self.stage_manager.current_stage}"
+    def draw_game_screen(self, screen, alpha=1.0):
+        # 이전/현재 틱 사이 위치로 잠시 옮겨서 그린 뒤 복원
+        restore = []
+        if alpha < 1.0:
+            for entity in self.get_interpolated_entities():
+                restore.append((entity, entity.x, entity.y))
+                entity.x, entity.y = entity.get_render_position(alpha)
+
+        rects = self._draw_game_layers(screen)
+
+        for entity, x, y in restore:
+            entity.x = x
+            entity.y = y
+
+        return rects
+
+    def enable_dirty_rects(self):
+        self.dirty_rect_renderer = DirtyRectRenderer(self.stage_render_cache)
+
+    def _cull(self, entities, offset):
+        # 화면 밖 엔티티는 그리지 않음 (그리기 영역 기준)
+        view = self.screen_rect
+        visible = [entity for entity in entities if entity.is_visible(view, offset)]
+        self.profiler.count("entities.culled", len(entities) - len(visible))
+        return visible
+
+    def get_visible_layers(self, offset):
+        stage_manager = self.stage_manager
+        return (
+            self._cull(stage_manager.get_active_traps(), offset),
+            self._cull(stage_manager.get_active_checkpoints(), offset),
+            self._cull(self.fires, offset),
+            self._cull(stage_manager.get_active_enemies(), offset),
+            self._cull(self.projectiles, offset),
         )
-        if bg_sprite:
-            screen.blit(bg_sprite, (0, 0))
-
-        shake_offset = self.get_shake_offset()
-
-        for platform in self.stage_manager.platforms:
-            platform.draw(screen, shake_offset)
 
-        for trap in self.stage_manager.traps:
-            trap.draw(screen, shake_offset)
+    def get_drawn_entities(self, layers):
+        entities = [self.player]
+        for layer in layers:
+            entities.extend(layer)
+        entities.extend(self.stage_render_cache.get_visible_dynamic_platforms())
+        if self.boss:
+            entities.append(self.boss)
+        return entities
 
-        for checkpoint in self.stage_manager.checkpoints:
-            checkpoint.draw(screen, shake_offset)
+    def _draw_game_layers(self, screen):
+        shake_offset = self.get_shake_offset()
+        renderer = self.dirty_rect_renderer
+        profiler = self.profiler
+        stage_manager = self.stage_manager
+
+        # 보간된 플레이어 위치 기준 카메라 - 엔티티는 카메라 + 흔들림 오프셋으로 그림
+        camera_x = self.camera.get_target_x(self.player)
+        offset = (shake_offset[0] - camera_x, shake_offset[1])
+        layers = self.get_visible_layers(offset)
+        traps, checkpoints, fires, enemies, projectiles = layers
+
+        # 배경과 고정 발판은 캐시된 레이어 한 장으로 그림
+        with profiler.scope("draw.stage"):
+            if renderer:
+                extra_rects = []
+                particle_bounds = self.particles.get_bounds((-camera_x, 0))
+                if particle_bounds:
+                    extra_rects.append(particle_bounds)
+                if profiler.enabled:
+                    extra_rects.append(self.ui_manager.get_profiler_rect(profiler))
+                renderer.begin_frame(
+                    screen,
+                    stage_manager.current_stage,
+                    stage_manager.platforms,
+                    self.get_drawn_entities(layers),
+                    shake_offset,
+                    extra_rects,
+                    camera_x,
+                )
+            else:
+                self.stage_render_cache.draw(
+                    screen,
+                    stage_manager.current_stage,
+                    stage_manager.platforms,
+                    shake_offset,
+                    camera_x,
+                )
 
-        for fire in self.fires:
-            fire.draw(screen, shake_offset)
+        # 엔티티는 레이어별 큐에 쌓고, 레이어마다 스프라이트를 blits 한 번으로 그림
+        queue = self.render_queue
+        with profiler.scope("draw.submit"):
+            for layer in layers:
+                for entity in layer:
+                    entity.submit(queue, offset)
+            if self.boss:
+                self.boss.submit(queue, offset)
+            self.player.submit(queue, offset)
 
-        for enemy in self.stage_manager.enemies:
-            enemy.draw(screen, shake_offset)
+        queue.flush(screen)
 
-        for projectile in self.projectiles:
-            projectile.draw(screen, shake_offset)
+        with profiler.scope("draw.particles"):
+            self.particles.draw(screen, (-camera_x, 0))
 
-        if self.boss:
-            self.boss.draw(screen, shake_offset)
+        with profiler.scope("draw.ui"):
+            self._draw_ui(screen)
 
-        self.player.draw(screen, shake_offset)
+        if profiler.enabled:
+            self.ui_manager.draw_profiler(screen, profiler)
 
-        draw_particles(screen, self.particles)
+        # 바뀐 영역 목록, 전체를 다시 그렸으면 None
+        if renderer:
+            return renderer.end_frame()
+        return None
 
+    def _draw_ui(self, screen):
         self.ui_manager.draw_hud(
             screen,
             self.player,
@@ -587,17 +774,28 @@ class Game:
                 screen, self.deaths, elapsed, self.items_collected
             )
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        if self.game_state != GAME_STATE_PLAYING:
+            return self._draw_overlay_state(screen)
+
+        return self.draw_game_screen(screen, alpha)
+
+    def _draw_overlay_state(self, screen):
+        # 메뉴/오버레이는 화면 전체를 덮으므로 이번 프레임과 다음 프레임 모두 전체 갱신
+        if self.dirty_rect_renderer:
+            self.dirty_rect_renderer.invalidate()
+
         if self.game_state == GAME_STATE_MENU:
             self.ui_manager.draw_menu(screen)
-            return
-
-        if self.game_state == GAME_STATE_DEV_MENU:
+        elif self.game_state == GAME_STATE_DEV_MENU:
             self.draw_game_screen(screen)
             self.ui_manager.draw_dev_menu(screen)
-            return
+        else:
+            self.draw_game_screen(screen)
 
-        self.draw_game_screen(screen)
+        if self.dirty_rect_renderer:
+            self.dirty_rect_renderer.invalidate()
+        return None
 
     def handle_menu_input(self, event):
         if event.type == pygame.KEYDOWN:
@@ -645,13 +843,18 @@ class Game:
                 if selection == 0:
                     self.load_stage(1)
                     self.game_state = GAME_STATE_PLAYING
+                    return 1
                 elif selection == 1:
                     self.load_stage(2)
                     self.game_state = GAME_STATE_PLAYING
+                    return 2
                 elif selection == 2:
                     self.load_stage(3)
                     self.game_state = GAME_STATE_PLAYING
+                    return 3
                 elif selection == 3:
                     self.game_state = GAME_STATE_PLAYING
             elif event.key == pygame.K_ESCAPE:
                 self.game_state = GAME_STATE_PLAYING
+        # 불러온 스테이지 번호 (리플레이 기록용), 스테이지를 바꾸지 않았으면 None
+        return None
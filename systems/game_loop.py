@@ -0,0 +1,30 @@
+from config import MAX_CATCH_UP_STEPS, TICK_RATE
+
+
+class FixedTimestepLoop:
+    def __init__(self, tick_rate: int = TICK_RATE, max_steps: int = MAX_CATCH_UP_STEPS):
+        self.tick_rate = tick_rate
+        self.step_time = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+
+    def advance(self, elapsed: float) -> int:
+        self.accumulator += max(0.0, elapsed)
+
+        steps = int(self.accumulator // self.step_time)
+        if steps > self.max_steps:
+            # 너무 밀렸으면 따라잡기를 포기하고 남은 시간은 버림
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_time
+
+        self.ticks += steps
+        return steps
+
+    def get_alpha(self) -> float:
+        return min(1.0, self.accumulator / self.step_time)
+
+    def reset(self):
+        self.accumulator = 0.0
@@ -0,0 +1,184 @@
+import os
+from typing import Callable, Dict, Iterable, List, Optional
+
+import pygame
+
+from config import *
+from systems.asset_manager import set_headless
+from systems.game import Game
+
+
+def enable_headless():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    set_headless(True)
+
+
+class SyntheticKeys:
+    # pygame.key.get_pressed() 대신 Game.update에 넘기는 키 상태
+    def __init__(self, pressed: Iterable[int] = ()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+def idle_policy(game) -> Iterable[int]:
+    return ()
+
+
+# 플레이어 점프로 발이 올라가는 최대 높이 (px)
+JUMP_HEIGHT = PLAYER_JUMP_POWER**2 / (2 * PLAYER_GRAVITY)
+
+
+def _overlaps_x(player, platform) -> bool:
+    return (
+        player.x + player.width > platform.x and player.x < platform.x + platform.width
+    )
+
+
+def _is_under_platform(player, platforms) -> bool:
+    # 점프 높이 안에 발판 밑면이 있으면 머리를 부딪쳐 보스 높이까지 못 올라감
+    for platform in platforms:
+        bottom = platform.y + platform.height
+        if (
+            platform.visible
+            and _overlaps_x(player, platform)
+            and player.y - JUMP_HEIGHT < bottom <= player.y
+        ):
+            return True
+    return False
+
+
+def _climb_policy(player, platforms, target_x: float) -> List[int]:
+    # 한 층 위 발판 중 target_x에 가장 가까운 것을 골라 옆에서 점프해 올라감
+    feet = player.y + player.height
+    steps = [
+        platform
+        for platform in platforms
+        if platform.visible and feet - JUMP_HEIGHT + 10 < platform.y < feet - 10
+    ]
+    if not steps:
+        return [pygame.K_RIGHT if target_x > player.x else pygame.K_LEFT]
+
+    step = min(steps, key=lambda p: abs(p.x + p.width / 2 - target_x))
+    center = player.x + player.width / 2
+    step_center = step.x + step.width / 2
+    inward = pygame.K_RIGHT if step_center > center else pygame.K_LEFT
+    outward = pygame.K_LEFT if step_center > center else pygame.K_RIGHT
+
+    if _overlaps_x(player, step):
+        # 공중이면 발판 위로 들어가고, 발판 밑에 서 있으면 가까운 가장자리 밖으로 나감
+        if not player.on_ground:
+            return [inward]
+        if center < step_center:
+            return [pygame.K_LEFT]
+        return [pygame.K_RIGHT]
+
+    if player.x + player.width <= step.x:
+        gap = step.x - (player.x + player.width)
+    else:
+        gap = player.x - (step.x + step.width)
+    if not player.on_ground:
+        return [inward]
+    if gap < HEADLESS_JUMP_GAP[0]:
+        # 너무 붙으면 올라가는 도중 밑면에 부딪힘 - 도움닫기 거리를 둠
+        return [outward]
+    if gap <= HEADLESS_JUMP_GAP[1]:
+        return [inward, pygame.K_SPACE]
+    return [inward]
+
+
+def boss_fight_policy(game) -> Iterable[int]:
+    player = game.player
+    boss = game.boss
+    pressed = []
+
+    if boss is None:
+        pressed.append(pygame.K_RIGHT)
+        return pressed
+
+    platforms = game.stage_manager.platforms
+    boss_center = boss.x + boss.width / 2
+    distance = boss_center - (player.x + player.width / 2)
+    toward = pygame.K_RIGHT if distance > 0 else pygame.K_LEFT
+    away = pygame.K_LEFT if distance > 0 else pygame.K_RIGHT
+    shot_y = player.y + 15
+
+    if boss.y + boss.height < shot_y - JUMP_HEIGHT:
+        # 점프해서 쏴도 보스 아래로 지나감 - 한 층씩 올라감
+        pressed.extend(_climb_policy(player, platforms, boss_center))
+    elif shot_y < boss.y:
+        # 보스가 더 아래에 있으면 발판에서 내려감
+        pressed.append(toward)
+    else:
+        # 같은 높이: 원거리 공격 거리를 유지 (가까우면 물러나고 멀면 다가감)
+        under_platform = _is_under_platform(player, platforms)
+        if abs(distance) > HEADLESS_RANGED_DISTANCE[1]:
+            pressed.append(toward)
+        elif abs(distance) < HEADLESS_RANGED_DISTANCE[0] and not boss.can_be_damaged():
+            pressed.append(away)
+        elif under_platform and shot_y > boss.y + boss.height:
+            # 발판 밑이면 점프할 자리로 빠져나옴
+            pressed.append(away)
+        elif player.facing_right != (distance > 0):
+            pressed.append(toward)
+
+        # 투사체가 보스 높이보다 아래면 점프해서 높이를 맞춤
+        if shot_y > boss.y + boss.height and player.on_ground and not under_platform:
+            pressed.append(pygame.K_SPACE)
+
+    if boss.can_be_damaged() and abs(distance) < boss.width:
+        pressed.append(pygame.K_z)
+
+    # 투사체가 보스 높이를 지날 때만 쏨
+    if boss.y <= shot_y <= boss.y + boss.height:
+        pressed.append(pygame.K_x)
+
+    # 충격파는 점프로 피함
+    if boss.pattern == "jump" and boss.velocity_y > 0:
+        pressed.append(pygame.K_SPACE)
+
+    return pressed
+
+
+class HeadlessSimulation:
+    def __init__(self, stage: int = 1, seed: Optional[int] = None):
+        enable_headless()
+
+        self.game = Game(seed)
+        self.game.start_game()
+        if stage != 1:
+            self.game.load_stage(stage)
+        self.ticks = 0
+
+    def step(self, pressed: Iterable[int] = (), dash: bool = False):
+        # 대시는 KEYDOWN 이벤트로 처리되므로 키 상태와 따로 받음
+        if dash:
+            self.game.player.start_dash()
+        self.game.update(SyntheticKeys(pressed))
+        self.ticks += 1
+
+    def is_finished(self) -> bool:
+        return self.game.game_state != GAME_STATE_PLAYING
+
+    def run(
+        self,
+        policy: Callable = idle_policy,
+        max_ticks: int = HEADLESS_MAX_TICKS,
+    ) -> Dict:
+        while self.ticks < max_ticks and not self.is_finished():
+            self.step(policy(self.game))
+
+        return self.get_result()
+
+    def get_result(self) -> Dict:
+        game = self.game
+        return {
+            "ticks": self.ticks,
+            "stage": game.stage_manager.current_stage,
+            "victory": game.game_state == GAME_STATE_VICTORY,
+            "deaths": game.deaths,
+            "player_health": game.player.health,
+            "boss_health": game.boss.health if game.boss else None,
+        }
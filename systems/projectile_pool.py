@@ -0,0 +1,55 @@
+from typing import Iterator, List, Optional
+
+from config import *
+from entities.projectile import Projectile
+
+
+class ProjectilePool:
+    def __init__(self, capacity: int = PROJECTILE_POOL_SIZE):
+        self.capacity = capacity
+        # 미리 만들어 둔 슬롯 - 게임 중에는 새 Projectile을 만들지 않음
+        self.free: List[Projectile] = [Projectile(0, 0, 1) for _ in range(capacity)]
+        # 활성 투사체, 제거는 마지막 원소와 자리를 바꿔서 O(1)
+        self.active: List[Projectile] = []
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __iter__(self) -> Iterator[Projectile]:
+        return iter(self.active)
+
+    def __getitem__(self, index: int) -> Projectile:
+        return self.active[index]
+
+    def acquire(
+        self, x, y, direction, proj_type="magic", from_player=False, angle=0
+    ) -> Optional[Projectile]:
+        if not self.free:
+            # 슬롯이 다 차면 새로 만들지 않고 버림
+            self.dropped += 1
+            return None
+
+        projectile = self.free.pop()
+        projectile.reset(x, y, direction, proj_type, from_player, angle)
+        projectile.pool_index = len(self.active)
+        self.active.append(projectile)
+        return projectile
+
+    def release(self, projectile: Projectile):
+        index = projectile.pool_index
+        last = self.active.pop()
+        if last is not projectile:
+            self.active[index] = last
+            last.pool_index = index
+
+        projectile.active = False
+        projectile.pool_index = -1
+        self.free.append(projectile)
+
+    def clear(self):
+        for projectile in self.active:
+            projectile.active = False
+            projectile.pool_index = -1
+            self.free.append(projectile)
+        self.active.clear()
@@ -0,0 +1,73 @@
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+from config import RENDER_LAYER_NAMES
+from utils.profiler import get_profiler
+
+
+class _DrawCommand:
+    # 스프라이트 한 장으로 표현할 수 없는 그리기 (도형, 이펙트 등)
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable, args: tuple):
+        self.func = func
+        self.args = args
+
+
+class RenderQueue:
+    # 엔티티가 그리기 명령을 레이어별로 쌓고, flush에서 레이어 순서대로 그림
+    def __init__(self, layer_names: Tuple[str, ...] = RENDER_LAYER_NAMES):
+        self.layer_names = layer_names
+        self.scope_names = [f"draw.{name}" for name in layer_names]
+        # 레이어별 실행 목록 - blit 명령 리스트(blits 한 번) 또는 _DrawCommand
+        self.layers: List[list] = [[] for _ in layer_names]
+        # 레이어마다 아직 이어 붙일 수 있는 마지막 blit 리스트
+        self.open_runs: List[Optional[list]] = [None] * len(layer_names)
+
+    def __len__(self) -> int:
+        return sum(
+            len(run) if run.__class__ is list else 1
+            for runs in self.layers
+            for run in runs
+        )
+
+    def blit(
+        self,
+        layer: int,
+        surface: pygame.Surface,
+        dest: Tuple[float, float],
+        area: Optional[pygame.Rect] = None,
+    ):
+        run = self.open_runs[layer]
+        if run is None:
+            run = []
+            self.layers[layer].append(run)
+            self.open_runs[layer] = run
+        if area is None:
+            run.append((surface, dest))
+        else:
+            run.append((surface, dest, area))
+
+    def draw(self, layer: int, func: Callable, *args):
+        # func(target, *args)를 flush 때 이 자리 순서대로 호출 - 앞뒤 blit 묶음이 나뉨
+        self.layers[layer].append(_DrawCommand(func, args))
+        self.open_runs[layer] = None
+
+    def flush(self, target: pygame.Surface):
+        profiler = get_profiler()
+        for layer, runs in enumerate(self.layers):
+            if not runs:
+                continue
+            with profiler.scope(self.scope_names[layer]):
+                for run in runs:
+                    if run.__class__ is list:
+                        target.blits(run, doreturn=False)
+                    else:
+                        run.func(target, *run.args)
+        self.clear()
+
+    def clear(self):
+        for runs in self.layers:
+            runs.clear()
+        self.open_runs = [None] * len(self.layer_names)
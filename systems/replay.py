@@ -0,0 +1,248 @@
+import struct
+import zlib
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+from config import *
+from systems.headless import HeadlessSimulation
+
+REPLAY_MAGIC = b"DSRP"
+REPLAY_VERSION = 2
+
+# 헤더: 매직, 버전, 시드, 시작 스테이지, 체크섬 간격, 입력 런 개수, 체크섬 개수, 스테이지 이동 개수
+HEADER_FORMAT = "<4sHIHHIII"
+RUN_FORMAT = "<HH"
+CHECKSUM_FORMAT = "<I"
+# 스테이지 이동 (개발자 메뉴): 이 틱을 시뮬레이션하기 직전에 불러올 스테이지
+STAGE_JUMP_FORMAT = "<IH"
+MAX_RUN_LENGTH = 0xFFFF
+
+# 비트 순서가 곧 파일 포맷이므로 순서를 바꾸면 안 됨
+REPLAY_KEYS = [
+    pygame.K_LEFT,
+    pygame.K_a,
+    pygame.K_RIGHT,
+    pygame.K_d,
+    pygame.K_SPACE,
+    pygame.K_UP,
+    pygame.K_x,
+    pygame.K_z,
+]
+DASH_BIT = 1 << len(REPLAY_KEYS)
+
+
+def encode_input(keys, dash: bool = False) -> int:
+    mask = 0
+    for bit, key in enumerate(REPLAY_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    if dash:
+        mask |= DASH_BIT
+    return mask
+
+
+def decode_input(mask: int) -> Tuple[List[int], bool]:
+    pressed = [key for bit, key in enumerate(REPLAY_KEYS) if mask & (1 << bit)]
+    return pressed, bool(mask & DASH_BIT)
+
+
+def get_session_path(path: str, session: int) -> str:
+    # 첫 세션은 path 그대로, 이후는 session.rep -> session.2.rep, session.3.rep ...
+    if session <= 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{session}{ext}"
+
+
+def compute_state_checksum(game) -> int:
+    player = game.player
+    state = [
+        game.game_state,
+        game.stage_manager.current_stage,
+        game.deaths,
+        player.x,
+        player.y,
+        player.velocity_x,
+        player.velocity_y,
+        player.health,
+        player.dash_cooldown,
+        len(game.projectiles),
+        len(game.fires),
+        hash(game.rng.getstate()[1]),
+    ]
+
+    for enemy in game.stage_manager.enemies:
+        state.extend((enemy.x, enemy.y, enemy.alive))
+
+    for projectile in game.projectiles:
+        state.extend((projectile.x, projectile.y))
+
+    if game.boss:
+        boss = game.boss
+        state.extend((boss.x, boss.y, boss.health, boss.pattern, boss.stunned))
+
+    return zlib.crc32(repr(state).encode())
+
+
+class Replay:
+    def __init__(
+        self,
+        seed: int,
+        start_stage: int = 1,
+        checksum_interval: int = REPLAY_CHECKSUM_INTERVAL,
+    ):
+        self.seed = seed
+        self.start_stage = start_stage
+        self.checksum_interval = checksum_interval
+        # (입력 비트마스크, 반복 틱 수) 런 렝스 인코딩
+        self.runs: List[List[int]] = []
+        self.checksums: List[int] = []
+        # (틱, 스테이지) - 입력 비트마스크로는 표현되지 않는 스테이지 이동
+        self.stage_jumps: List[Tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return sum(length for _, length in self.runs)
+
+    def append_input(self, mask: int):
+        if self.runs and self.runs[-1][0] == mask:
+            if self.runs[-1][1] < MAX_RUN_LENGTH:
+                self.runs[-1][1] += 1
+                return
+        self.runs.append([mask, 1])
+
+    def iter_inputs(self) -> Iterable[int]:
+        for mask, length in self.runs:
+            for _ in range(length):
+                yield mask
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(
+                struct.pack(
+                    HEADER_FORMAT,
+                    REPLAY_MAGIC,
+                    REPLAY_VERSION,
+                    self.seed,
+                    self.start_stage,
+                    self.checksum_interval,
+                    len(self.runs),
+                    len(self.checksums),
+                    len(self.stage_jumps),
+                )
+            )
+            for mask, length in self.runs:
+                f.write(struct.pack(RUN_FORMAT, mask, length))
+            for checksum in self.checksums:
+                f.write(struct.pack(CHECKSUM_FORMAT, checksum))
+            for tick, stage in self.stage_jumps:
+                f.write(struct.pack(STAGE_JUMP_FORMAT, tick, stage))
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            data = f.read()
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        (
+            magic,
+            version,
+            seed,
+            start_stage,
+            checksum_interval,
+            run_count,
+            checksum_count,
+            stage_jump_count,
+        ) = struct.unpack_from(HEADER_FORMAT, data)
+
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"Not a replay file: {path}")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}: {path}")
+
+        replay = cls(seed, start_stage, checksum_interval)
+        runs_size = run_count * struct.calcsize(RUN_FORMAT)
+        checksums_size = checksum_count * struct.calcsize(CHECKSUM_FORMAT)
+        runs_data = data[header_size : header_size + runs_size]
+        checksums_data = data[
+            header_size + runs_size : header_size + runs_size + checksums_size
+        ]
+        stage_jumps_offset = header_size + runs_size + checksums_size
+        stage_jumps_data = data[
+            stage_jumps_offset : stage_jumps_offset
+            + stage_jump_count * struct.calcsize(STAGE_JUMP_FORMAT)
+        ]
+
+        replay.runs = [
+            [mask, length] for mask, length in struct.iter_unpack(RUN_FORMAT, runs_data)
+        ]
+        replay.checksums = [
+            checksum
+            for (checksum,) in struct.iter_unpack(CHECKSUM_FORMAT, checksums_data)
+        ]
+        replay.stage_jumps = list(
+            struct.iter_unpack(STAGE_JUMP_FORMAT, stage_jumps_data)
+        )
+        return replay
+
+
+class ReplayRecorder:
+    def __init__(self, game, checksum_interval: int = REPLAY_CHECKSUM_INTERVAL):
+        self.game = game
+        self.replay = Replay(
+            game.seed, game.stage_manager.current_stage, checksum_interval
+        )
+        self.ticks = 0
+
+    def record_tick(self, keys, dash: bool = False):
+        # Game.update 직전에 호출
+        self.replay.append_input(encode_input(keys, dash))
+
+    def record_stage_jump(self, stage: int):
+        # 개발자 메뉴에서 스테이지를 바꿨을 때 - 다음 틱 전에 불러온 것으로 기록
+        self.replay.stage_jumps.append((self.ticks, stage))
+
+    def after_tick(self):
+        # Game.update 직후에 호출
+        self.ticks += 1
+        if self.ticks % self.replay.checksum_interval == 0:
+            self.replay.checksums.append(compute_state_checksum(self.game))
+
+    def save(self, path: str):
+        self.replay.save(path)
+
+
+class ReplayPlayer:
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self.simulation = HeadlessSimulation(replay.start_stage, seed=replay.seed)
+
+    def run(self) -> Dict:
+        simulation = self.simulation
+        interval = self.replay.checksum_interval
+        checksums = self.replay.checksums
+        decoded: Dict[int, Tuple[List[int], bool]] = {}
+        desync_tick: Optional[int] = None
+        stage_jumps = iter(self.replay.stage_jumps)
+        next_jump = next(stage_jumps, None)
+
+        for mask in self.replay.iter_inputs():
+            while next_jump is not None and next_jump[0] == simulation.ticks:
+                simulation.game.load_stage(next_jump[1])
+                next_jump = next(stage_jumps, None)
+
+            if mask not in decoded:
+                decoded[mask] = decode_input(mask)
+            pressed, dash = decoded[mask]
+            simulation.step(pressed, dash)
+
+            if simulation.ticks % interval == 0:
+                index = simulation.ticks // interval - 1
+                if index < len(checksums) and desync_tick is None:
+                    if checksums[index] != compute_state_checksum(simulation.game):
+                        desync_tick = simulation.ticks
+
+        result = simulation.get_result()
+        result["desync_tick"] = desync_tick
+        return result
@@ -0,0 +1,117 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from config import SPATIAL_HASH_CELL_SIZE
+
+
+class SpatialHash:
+    def __init__(
+        self,
+        entities: Optional[Iterable] = None,
+        cell_size: int = SPATIAL_HASH_CELL_SIZE,
+    ):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Set] = {}
+        self.entity_cells: Dict[object, Tuple[int, int, int, int]] = {}
+        # 삽입 순서 - 조회 결과를 원래 리스트 순서대로 돌려주기 위함
+        self.order: Dict[object, int] = {}
+        self.next_order = 0
+
+        if entities is not None:
+            for entity in entities:
+                self.insert(entity)
+
+    def __len__(self) -> int:
+        return len(self.entity_cells)
+
+    def __contains__(self, entity) -> bool:
+        return entity in self.entity_cells
+
+    def _cell_range(
+        self, x: float, y: float, width: float, height: float
+    ) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            int(x // size),
+            int(y // size),
+            int((x + width) // size),
+            int((y + height) // size),
+        )
+
+    def _add_to_cells(self, entity, cell_range: Tuple[int, int, int, int]):
+        left, top, right, bottom = cell_range
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is None:
+                    cell = self.cells[(cx, cy)] = set()
+                cell.add(entity)
+
+    def _remove_from_cells(self, entity, cell_range: Tuple[int, int, int, int]):
+        left, top, right, bottom = cell_range
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(entity)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+
+    def insert(self, entity):
+        if entity in self.entity_cells:
+            self.move(entity)
+            return
+
+        cell_range = self._cell_range(entity.x, entity.y, entity.width, entity.height)
+        self.entity_cells[entity] = cell_range
+        self.order[entity] = self.next_order
+        self.next_order += 1
+        self._add_to_cells(entity, cell_range)
+
+    def remove(self, entity):
+        cell_range = self.entity_cells.pop(entity, None)
+        if cell_range is None:
+            return
+
+        del self.order[entity]
+        self._remove_from_cells(entity, cell_range)
+
+    def move(self, entity):
+        old_range = self.entity_cells.get(entity)
+        if old_range is None:
+            self.insert(entity)
+            return
+
+        new_range = self._cell_range(entity.x, entity.y, entity.width, entity.height)
+        if new_range == old_range:
+            return
+
+        self._remove_from_cells(entity, old_range)
+        self._add_to_cells(entity, new_range)
+        self.entity_cells[entity] = new_range
+
+    def query(self, x: float, y: float, width: float, height: float) -> List:
+        left, top, right, bottom = self._cell_range(x, y, width, height)
+
+        found = set()
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+
+        hits = [
+            entity
+            for entity in found
+            if x < entity.x + entity.width
+            and x + width > entity.x
+            and y < entity.y + entity.height
+            and y + height > entity.y
+        ]
+        hits.sort(key=self.order.__getitem__)
+        return hits
+
+    def clear(self):
+        self.cells.clear()
+        self.entity_cells.clear()
+        self.order.clear()
+        self.next_order = 0
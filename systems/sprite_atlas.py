@@ -0,0 +1,126 @@
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+from utils.constants import ATLAS_MAX_SPRITE_SIZE, ATLAS_PAGE_SIZE
+from utils.profiler import get_profiler
+
+# (페이지 번호, 페이지 안의 영역)
+AtlasRegion = Tuple[int, pygame.Rect]
+
+
+class SpriteAtlas:
+    # 작은 스프라이트들을 큰 페이지 몇 장에 선반(shelf) 방식으로 채워 넣음
+    def __init__(
+        self,
+        page_size: int = ATLAS_PAGE_SIZE,
+        max_sprite_size: int = ATLAS_MAX_SPRITE_SIZE,
+    ):
+        self.page_size = page_size
+        self.max_sprite_size = max_sprite_size
+        self.pages: List[pygame.Surface] = []
+        self.regions: Dict[Hashable, AtlasRegion] = {}
+
+    def can_pack(self, sprite: pygame.Surface) -> bool:
+        width, height = sprite.get_size()
+        return 0 < width <= self.max_sprite_size and 0 < height <= self.max_sprite_size
+
+    def _layout(self, sizes: Dict[Hashable, Tuple[int, int]]) -> List[int]:
+        # 키 높은 것부터 한 줄(선반)씩 왼쪽에서 오른쪽으로 채우고, 넘치면 다음 페이지로
+        order = sorted(sizes, key=lambda key: (-sizes[key][1], -sizes[key][0]))
+        page_heights = [0]
+        shelf_x = shelf_y = shelf_height = 0
+
+        for key in order:
+            width, height = sizes[key]
+            if shelf_x + width > self.page_size:
+                shelf_x = 0
+                shelf_y += shelf_height
+                shelf_height = 0
+            if shelf_y + height > self.page_size:
+                page_heights.append(0)
+                shelf_x = shelf_y = shelf_height = 0
+
+            page = len(page_heights) - 1
+            self.regions[key] = (page, pygame.Rect(shelf_x, shelf_y, width, height))
+            shelf_x += width
+            shelf_height = max(shelf_height, height)
+            page_heights[page] = shelf_y + shelf_height
+        return page_heights
+
+    def build(
+        self, sprites: Dict[Hashable, pygame.Surface]
+    ) -> Dict[Hashable, pygame.Surface]:
+        # 반환값: 키 -> 페이지의 서브서피스 (원래 스프라이트와 픽셀이 같음)
+        with get_profiler().scope("asset.atlas"):
+            sizes = {key: sprite.get_size() for key, sprite in sprites.items()}
+            page_heights = self._layout(sizes)
+
+            for height in page_heights:
+                # 마지막 페이지는 쓴 높이만큼만 만듦
+                page = pygame.Surface((self.page_size, max(1, height)), pygame.SRCALPHA)
+                if pygame.display.get_surface() is not None:
+                    page = page.convert_alpha()
+                page.fill((0, 0, 0, 0))
+                self.pages.append(page)
+                get_profiler().count("surfaces")
+
+            subsurfaces = {}
+            for key, sprite in sprites.items():
+                page_index, rect = self.regions[key]
+                page = self.pages[page_index]
+                # 투명한 페이지에 MAX 블렌드 = 알파 섞임 없이 그대로 복사
+                page.blit(sprite, rect, special_flags=pygame.BLEND_RGBA_MAX)
+                subsurfaces[key] = page.subsurface(rect)
+        return subsurfaces
+
+    def get_region(self, key: Hashable) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        region = self.regions.get(key)
+        if region is None:
+            return None
+        return self.pages[region[0]], region[1]
+
+
+class SpriteBatch:
+    # 한 번에 그릴 스프라이트를 모았다가 Surface.blits 한 번으로 그림
+    def __init__(self):
+        self.commands: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def add(
+        self,
+        sprite: pygame.Surface,
+        dest: Tuple[float, float],
+        area: Optional[pygame.Rect] = None,
+    ):
+        if area is None:
+            self.commands.append((sprite, dest))
+        else:
+            self.commands.append((sprite, dest, area))
+
+    def add_sprite(
+        self,
+        assets,
+        name: str,
+        dest: Tuple[float, float],
+        flip_x: bool = False,
+        tint: Optional[Tuple[int, ...]] = None,
+    ) -> bool:
+        # 아틀라스에 있으면 (페이지, 영역)으로 넣음 - 서브서피스보다 blit이 가벼움
+        region = assets.get_sprite_region(name, flip_x, tint)
+        if region is not None:
+            self.commands.append((region[0], dest, region[1]))
+            return True
+
+        sprite = assets.get_sprite_variant(name, flip_x, tint)
+        if sprite is None:
+            return False
+        self.commands.append((sprite, dest))
+        return True
+
+    def flush(self, target: pygame.Surface):
+        if self.commands:
+            target.blits(self.commands, doreturn=False)
+            self.commands.clear()
@@ -1,7 +1,10 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pygame
 
+from config import ANIMATION_CLIPS
+from utils.profiler import get_profiler
+
 
 class Animation:
     def __init__(
@@ -33,7 +36,114 @@ class Animation:
     def get_current_frame(self) -> pygame.Surface:
         return self.frames[self.current_frame]
 
+    def get_frame_at(self, tick: int) -> pygame.Surface:
+        # 커서 상태 없이 경과 틱으로 프레임을 고름 - 여러 엔티티가 한 애니메이션을 같이 씀
+        index = tick // self.frame_duration
+        if self.loop:
+            index %= len(self.frames)
+        else:
+            index = max(0, min(index, len(self.frames) - 1))
+        return self.frames[index]
+
     def reset(self):
         self.current_frame = 0
         self.frame_timer = 0
         self.finished = False
+
+
+class AnimationSet:
+    # 엔티티 종류 하나가 같이 쓰는 애니메이션 묶음 - 인스턴스는 상태 이름과 경과 틱만 가짐
+    def __init__(self, prefix: str, clips: Dict[str, Tuple[int, bool]]):
+        # 시트 이름은 f"{prefix}_{상태}" (예: slime_blue_idle)
+        self.prefix = prefix
+        # 상태 -> (프레임당 틱, 반복 여부)
+        self.clips = clips
+        self.animations: Dict[tuple, Animation] = {}
+
+    def get(
+        self,
+        assets,
+        state: str,
+        flip_x: bool = False,
+        tint: Optional[Tuple[int, ...]] = None,
+    ) -> Optional[Animation]:
+        key = (state, flip_x, tint)
+        animation = self.animations.get(key)
+        if animation is not None:
+            return animation
+
+        clip = self.clips.get(state)
+        if clip is None:
+            return None
+        # 프레임 리스트는 에셋 매니저가 가진 것을 그대로 씀 (복사하지 않음)
+        frames = assets.get_frames(f"{self.prefix}_{state}", flip_x, tint)
+        if not frames:
+            return None
+
+        frame_duration, loop = clip
+        animation = Animation(frames, frame_duration, loop)
+        self.animations[key] = animation
+        return animation
+
+
+_animation_sets: Dict[str, AnimationSet] = {}
+
+
+def get_animation_set(prefix: str) -> AnimationSet:
+    # 클립 표는 종류(prefix의 첫 단어)로 찾음 - slime_blue, slime_red는 slime 표를 같이 씀
+    animation_set = _animation_sets.get(prefix)
+    if animation_set is None:
+        clips = ANIMATION_CLIPS.get(prefix.split("_")[0], {})
+        animation_set = AnimationSet(prefix, clips)
+        _animation_sets[prefix] = animation_set
+    return animation_set
+
+
+class SpriteBaker:
+    # 매 프레임 도형으로 그리던 애니메이션을 프레임 서피스로 한 번만 구워 둠
+    def __init__(self):
+        self.animations: Dict[str, Animation] = {}
+
+    def get(self, key: str) -> Optional[Animation]:
+        return self.animations.get(key)
+
+    def bake(
+        self,
+        key: str,
+        size: Tuple[int, int],
+        frame_count: int,
+        draw_frame: Callable[[pygame.Surface, int], None],
+        frame_duration: int = 1,
+        loop: bool = True,
+    ) -> Animation:
+        # draw_frame(서피스, 프레임 번호)로 투명 서피스에 한 장씩 그림
+        animation = self.animations.get(key)
+        if animation is not None:
+            return animation
+
+        with get_profiler().scope("asset.bake"):
+            frames = []
+            for index in range(frame_count):
+                frame = pygame.Surface(size, pygame.SRCALPHA)
+                draw_frame(frame, index)
+                if pygame.display.get_surface() is not None:
+                    frame = frame.convert_alpha()
+                frames.append(frame)
+                get_profiler().count("surfaces")
+
+        animation = Animation(frames, frame_duration, loop)
+        self.animations[key] = animation
+        return animation
+
+    def clear(self):
+        self.animations.clear()
+
+
+_sprite_baker: Optional[SpriteBaker] = None
+
+
+def get_sprite_baker() -> SpriteBaker:
+    global _sprite_baker
+    if _sprite_baker is None:
+        _sprite_baker = SpriteBaker()
+    return _sprite_baker
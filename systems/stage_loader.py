@@ -0,0 +1,446 @@
+import hashlib
+import json
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from config import *
+from entities.enemy import Enemy
+from entities.items import (
+    Checkpoint,
+    Chest,
+    Item,
+    Platform,
+    Trap,
+    get_trap_animations,
+)
+
+STAGE_MAGIC = b"DSTG"
+STAGE_VERSION = 2
+
+# 헤더: 매직, 버전, 스테이지 번호, 월드 폭, 플레이어 x/y, 검 보유, 보스 유무, 보스 x/y,
+# 출구 x (-1이면 없음), 발판 붕괴 여부, 음악 문자열 번호,
+# 문자열/발판/적/함정/상자/체크포인트 개수
+HEADER_FORMAT = "<4sHHIiiBBiiiBHHHHHHH"
+STRING_LENGTH_FORMAT = "<H"
+PLATFORM_FORMAT = "<iiiiB"
+# 종류/색상은 문자열 테이블 번호로 저장
+ENEMY_FORMAT = "<iiHH"
+TRAP_FORMAT = "<iiH"
+CHEST_FORMAT = "<iiH"
+CHECKPOINT_FORMAT = "<ii"
+# 좌표/크기(i), 스테이지 번호(H), 월드 폭(I)이 담을 수 있는 범위
+INT32_RANGE = (-(2**31), 2**31 - 1)
+STAGE_NUMBER_RANGE = (1, 2**16 - 1)
+UINT32_MAX = 2**32 - 1
+
+ENEMY_TYPES = ("slime", "skeleton")
+ENEMY_COLORS = ("blue", "green", "red")
+TRAP_TYPES = ("blade", "spike", "fireball")
+ITEM_TYPES = ("health", "max_health", "speed", "sword")
+
+PlatformRecord = Tuple[int, int, int, int, bool]
+EnemyRecord = Tuple[int, int, str, str]
+TrapRecord = Tuple[int, int, str]
+ChestRecord = Tuple[int, int, str]
+CheckpointRecord = Tuple[int, int]
+
+
+class StageDefinition:
+    def __init__(self, stage: int):
+        self.stage = stage
+        # 월드 가로 폭 - 화면보다 넓으면 카메라가 스크롤함
+        self.width = SCREEN_WIDTH
+        self.music = "bgm"
+        self.player_start: Tuple[int, int] = (100, 500)
+        self.player_has_sword = False
+        self.boss_position: Optional[Tuple[int, int]] = None
+        # 플레이어 x가 이 값을 넘으면 다음 스테이지로 (None이면 출구 없음)
+        self.exit_x: Optional[int] = None
+        self.collapsible_platforms = False
+
+        self.platforms: List[PlatformRecord] = []
+        self.enemies: List[EnemyRecord] = []
+        self.traps: List[TrapRecord] = []
+        self.chests: List[ChestRecord] = []
+        self.checkpoints: List[CheckpointRecord] = []
+
+    def pack(self) -> bytes:
+        strings: List[str] = []
+        string_index: Dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            if value not in string_index:
+                string_index[value] = len(strings)
+                strings.append(value)
+            return string_index[value]
+
+        music = intern(self.music)
+        enemies = [
+            struct.pack(ENEMY_FORMAT, x, y, intern(enemy_type), intern(color))
+            for x, y, enemy_type, color in self.enemies
+        ]
+        traps = [
+            struct.pack(TRAP_FORMAT, x, y, intern(trap_type))
+            for x, y, trap_type in self.traps
+        ]
+        chests = [
+            struct.pack(CHEST_FORMAT, x, y, intern(item_type))
+            for x, y, item_type in self.chests
+        ]
+
+        boss_x, boss_y = self.boss_position or (0, 0)
+        parts = [
+            struct.pack(
+                HEADER_FORMAT,
+                STAGE_MAGIC,
+                STAGE_VERSION,
+                self.stage,
+                self.width,
+                self.player_start[0],
+                self.player_start[1],
+                self.player_has_sword,
+                self.boss_position is not None,
+                boss_x,
+                boss_y,
+                -1 if self.exit_x is None else self.exit_x,
+                self.collapsible_platforms,
+                music,
+                len(strings),
+                len(self.platforms),
+                len(self.enemies),
+                len(self.traps),
+                len(self.chests),
+                len(self.checkpoints),
+            )
+        ]
+        for value in strings:
+            encoded = value.encode("utf-8")
+            parts.append(struct.pack(STRING_LENGTH_FORMAT, len(encoded)))
+            parts.append(encoded)
+        parts.extend(struct.pack(PLATFORM_FORMAT, *p) for p in self.platforms)
+        parts.extend(enemies)
+        parts.extend(traps)
+        parts.extend(chests)
+        parts.extend(struct.pack(CHECKPOINT_FORMAT, *c) for c in self.checkpoints)
+        return b"".join(parts)
+
+    @classmethod
+    def unpack(cls, data: bytes, path: str = "<memory>") -> "StageDefinition":
+        (
+            magic,
+            version,
+            stage,
+            width,
+            player_x,
+            player_y,
+            has_sword,
+            has_boss,
+            boss_x,
+            boss_y,
+            exit_x,
+            collapsible,
+            music,
+            string_count,
+            platform_count,
+            enemy_count,
+            trap_count,
+            chest_count,
+            checkpoint_count,
+        ) = struct.unpack_from(HEADER_FORMAT, data)
+
+        if magic != STAGE_MAGIC:
+            raise ValueError(f"Not a compiled stage: {path}")
+        if version != STAGE_VERSION:
+            raise ValueError(f"Unsupported stage version {version}: {path}")
+
+        offset = struct.calcsize(HEADER_FORMAT)
+        strings = []
+        for _ in range(string_count):
+            (length,) = struct.unpack_from(STRING_LENGTH_FORMAT, data, offset)
+            offset += struct.calcsize(STRING_LENGTH_FORMAT)
+            strings.append(data[offset : offset + length].decode("utf-8"))
+            offset += length
+
+        def read(record_format: str, count: int) -> List[tuple]:
+            nonlocal offset
+            size = struct.calcsize(record_format) * count
+            records = list(
+                struct.iter_unpack(record_format, data[offset : offset + size])
+            )
+            offset += size
+            return records
+
+        definition = cls(stage)
+        definition.width = width
+        definition.music = strings[music]
+        definition.player_start = (player_x, player_y)
+        definition.player_has_sword = bool(has_sword)
+        definition.boss_position = (boss_x, boss_y) if has_boss else None
+        definition.exit_x = None if exit_x < 0 else exit_x
+        definition.collapsible_platforms = bool(collapsible)
+
+        definition.platforms = [
+            (x, y, width, height, bool(disappearing))
+            for x, y, width, height, disappearing in read(
+                PLATFORM_FORMAT, platform_count
+            )
+        ]
+        definition.enemies = [
+            (x, y, strings[enemy_type], strings[color])
+            for x, y, enemy_type, color in read(ENEMY_FORMAT, enemy_count)
+        ]
+        definition.traps = [
+            (x, y, strings[trap_type])
+            for x, y, trap_type in read(TRAP_FORMAT, trap_count)
+        ]
+        definition.chests = [
+            (x, y, strings[item_type])
+            for x, y, item_type in read(CHEST_FORMAT, chest_count)
+        ]
+        definition.checkpoints = read(CHECKPOINT_FORMAT, checkpoint_count)
+        return definition
+
+
+def _require_int(
+    entry: Dict,
+    key: str,
+    where: str,
+    default: Optional[int] = None,
+    bounds: Tuple[int, int] = INT32_RANGE,
+):
+    value = entry.get(key, default)
+    # bool은 int의 하위 타입이라 따로 걸러냄
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"{where}: '{key}' must be an integer")
+    # 범위를 벗어나면 pack에서 struct.error가 나므로 여기서 막음
+    if not bounds[0] <= value <= bounds[1]:
+        raise ValueError(
+            f"{where}: '{key}' must be between {bounds[0]} and {bounds[1]}"
+        )
+    return value
+
+
+def _require_choice(
+    entry: Dict, key: str, choices: Tuple[str, ...], where: str, default=None
+):
+    value = entry.get(key, default)
+    if value not in choices:
+        raise ValueError(f"{where}: '{key}' must be one of {', '.join(choices)}")
+    return value
+
+
+def _require_list(data: Dict, key: str, path: str) -> List[Dict]:
+    entries = data.get(key, [])
+    if not isinstance(entries, list) or not all(isinstance(e, dict) for e in entries):
+        raise ValueError(f"{path}: '{key}' must be a list of objects")
+    return entries
+
+
+def parse_stage(data: Dict, path: str = "<memory>") -> StageDefinition:
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: stage file must contain an object")
+
+    definition = StageDefinition(
+        _require_int(data, "stage", path, bounds=STAGE_NUMBER_RANGE)
+    )
+    definition.width = _require_int(
+        data, "width", path, SCREEN_WIDTH, (SCREEN_WIDTH, UINT32_MAX)
+    )
+
+    music = data.get("music", "bgm")
+    if not isinstance(music, str):
+        raise ValueError(f"{path}: 'music' must be a string")
+    definition.music = music
+
+    player = data.get("player", {})
+    if not isinstance(player, dict):
+        raise ValueError(f"{path}: 'player' must be an object")
+    definition.player_start = (
+        _require_int(player, "x", f"{path} player", 100),
+        _require_int(player, "y", f"{path} player", 500),
+    )
+    definition.player_has_sword = bool(player.get("has_sword", False))
+
+    boss = data.get("boss")
+    if boss is not None:
+        if not isinstance(boss, dict):
+            raise ValueError(f"{path}: 'boss' must be an object")
+        definition.boss_position = (
+            _require_int(boss, "x", f"{path} boss"),
+            _require_int(boss, "y", f"{path} boss"),
+        )
+
+    if data.get("exit_x") is not None:
+        definition.exit_x = _require_int(data, "exit_x", path)
+    definition.collapsible_platforms = bool(data.get("collapsible_platforms", False))
+
+    platforms = _require_list(data, "platforms", path)
+    if not platforms:
+        raise ValueError(f"{path}: stage needs at least one platform")
+    for i, entry in enumerate(platforms):
+        where = f"{path} platforms[{i}]"
+        definition.platforms.append(
+            (
+                _require_int(entry, "x", where),
+                _require_int(entry, "y", where),
+                _require_int(entry, "width", where, bounds=(1, INT32_RANGE[1])),
+                _require_int(entry, "height", where, bounds=(1, INT32_RANGE[1])),
+                bool(entry.get("disappearing", False)),
+            )
+        )
+
+    for i, entry in enumerate(_require_list(data, "enemies", path)):
+        where = f"{path} enemies[{i}]"
+        definition.enemies.append(
+            (
+                _require_int(entry, "x", where),
+                _require_int(entry, "y", where),
+                _require_choice(entry, "type", ENEMY_TYPES, where),
+                _require_choice(entry, "color", ENEMY_COLORS, where, "blue"),
+            )
+        )
+
+    for i, entry in enumerate(_require_list(data, "traps", path)):
+        where = f"{path} traps[{i}]"
+        definition.traps.append(
+            (
+                _require_int(entry, "x", where),
+                _require_int(entry, "y", where),
+                _require_choice(entry, "type", TRAP_TYPES, where),
+            )
+        )
+
+    for i, entry in enumerate(_require_list(data, "chests", path)):
+        where = f"{path} chests[{i}]"
+        definition.chests.append(
+            (
+                _require_int(entry, "x", where),
+                _require_int(entry, "y", where),
+                _require_choice(entry, "item", ITEM_TYPES, where),
+            )
+        )
+
+    for i, entry in enumerate(_require_list(data, "checkpoints", path)):
+        where = f"{path} checkpoints[{i}]"
+        definition.checkpoints.append(
+            (_require_int(entry, "x", where), _require_int(entry, "y", where))
+        )
+
+    return definition
+
+
+class StageTemplate:
+    # 스테이지 원본 엔티티 - 재시작 때는 파일을 다시 읽지 않고 복제만 함
+    def __init__(self, definition: StageDefinition):
+        self.definition = definition
+        self.platforms = [
+            Platform(x, y, width, height, disappearing=disappearing)
+            for x, y, width, height, disappearing in definition.platforms
+        ]
+        self.enemies = [
+            Enemy(x, y, enemy_type, color)
+            for x, y, enemy_type, color in definition.enemies
+        ]
+        self.traps = [Trap(x, y, trap_type) for x, y, trap_type in definition.traps]
+        if self.traps:
+            # 함정 애니메이션은 첫 프레임이 아니라 로드할 때 구워 둠
+            get_trap_animations()
+        self.chests = [
+            Chest(x, y, Item(x, y, item_type)) for x, y, item_type in definition.chests
+        ]
+        self.checkpoints = [Checkpoint(x, y) for x, y in definition.checkpoints]
+
+    def restore(self, platforms, enemies, traps, chests, checkpoints) -> bool:
+        # 살아있는 엔티티를 템플릿 값으로 되돌림 - 개수가 다르면 (외부에서 추가 등) 실패
+        pairs = (
+            (platforms, self.platforms),
+            (enemies, self.enemies),
+            (traps, self.traps),
+            (chests, self.chests),
+            (checkpoints, self.checkpoints),
+        )
+        if any(len(live) != len(source) for live, source in pairs):
+            return False
+
+        for live, source in pairs:
+            for entity, original in zip(live, source):
+                entity.restore_state(original)
+        return True
+
+    def instantiate(self):
+        return (
+            [platform.clone() for platform in self.platforms],
+            [enemy.clone() for enemy in self.enemies],
+            [trap.clone() for trap in self.traps],
+            [chest.clone() for chest in self.chests],
+            [checkpoint.clone() for checkpoint in self.checkpoints],
+        )
+
+
+class StageLoader:
+    def __init__(self, stage_dir: str = STAGE_DIR, cache_dir: str = STAGE_CACHE_DIR):
+        self.stage_dir = stage_dir
+        self.cache_dir = cache_dir
+        # 스테이지 번호 -> (원본 파일 해시, 정의)
+        self.definitions: Dict[int, Tuple[str, StageDefinition]] = {}
+        self.cache_hits = 0
+        self.compiles = 0
+
+    def get_path(self, stage_num: int) -> str:
+        return os.path.join(self.stage_dir, f"stage{stage_num}.json")
+
+    def get_cache_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, f"{digest}.stage")
+
+    def has_stage(self, stage_num: int) -> bool:
+        return os.path.isfile(self.get_path(stage_num))
+
+    def load(self, stage_num: int) -> StageDefinition:
+        path = self.get_path(stage_num)
+        with open(path, "rb") as f:
+            source = f.read()
+        digest = hashlib.sha1(source).hexdigest()
+
+        loaded = self.definitions.get(stage_num)
+        if loaded and loaded[0] == digest:
+            return loaded[1]
+
+        definition = self._load_compiled(digest)
+        if definition is None:
+            try:
+                data = json.loads(source)
+            except ValueError as e:
+                raise ValueError(f"{path}: invalid JSON ({e})") from e
+            definition = parse_stage(data, path)
+            self.compiles += 1
+            self._save_compiled(digest, definition)
+        else:
+            self.cache_hits += 1
+
+        if definition.stage != stage_num:
+            raise ValueError(f"{path}: declares stage {definition.stage}")
+
+        self.definitions[stage_num] = (digest, definition)
+        return definition
+
+    def _load_compiled(self, digest: str) -> Optional[StageDefinition]:
+        cache_path = self.get_cache_path(digest)
+        try:
+            with open(cache_path, "rb") as f:
+                return StageDefinition.unpack(f.read(), cache_path)
+        except (OSError, ValueError, struct.error, IndexError, UnicodeDecodeError):
+            # 없거나 깨졌거나 버전이 다르면 원본에서 다시 컴파일
+            return None
+
+    def _save_compiled(self, digest: str, definition: StageDefinition):
+        cache_path = self.get_cache_path(digest)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(definition.pack())
+            os.replace(temp_path, cache_path)
+        except (OSError, struct.error):
+            # 읽기 전용 환경에서는 캐시 없이 진행
+            pass
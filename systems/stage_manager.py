@@ -1,12 +1,14 @@
 
+import random
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import *
-from entities.enemy import Enemy
-from entities.items import Platform, Trap, Item, Chest, Checkpoint
+from systems.spatial_hash import SpatialHash
+from systems.stage_loader import StageLoader, StageTemplate
+from systems.world_chunks import ChunkedWorld
 
 
 class StageManager:
@@ -18,139 +20,120 @@ class StageManager:
         self.chests = []
         self.checkpoints = []  # 체크포인트
         self.collapsed_platforms = set()  # 붕괴된 발판 인덱스
+        self.rng = random  # Game이 게임별 RNG로 교체함
+        self.platform_grid = SpatialHash()
+        self.enemy_grid = SpatialHash()
+        self.loader = StageLoader()
+        self.templates = {}  # 스테이지 번호 -> StageTemplate
+        self.definition = None
+        self.world = ChunkedWorld()  # 카메라 근처 청크의 엔티티만 깨움
 
     def load_stage(self, stage_num, player):
         
         self.current_stage = stage_num
-        self.platforms = []
-        self.enemies = []
-        self.traps = []
-        self.chests = []
-        self.checkpoints = []
 
-        if stage_num == 1:
-            self._load_stage_1(player)
-        elif stage_num == 2:
-            self._load_stage_2(player)
-        elif stage_num == 3:
-            self._load_stage_3(player)
-
-    def _load_stage_1(self, player):
+        # 처음 한 번만 파일을 읽어 템플릿을 만들고, 재시작할 때는 복제만 함
+        template = self.templates.get(stage_num)
+        if template is None:
+            template = StageTemplate(self.loader.load(stage_num))
+            self.templates[stage_num] = template
+        self.definition = template.definition
+
+        (
+            self.platforms,
+            self.enemies,
+            self.traps,
+            self.chests,
+            self.checkpoints,
+        ) = template.instantiate()
+
+        player.x, player.y = self.definition.player_start
+        player.has_sword = self.definition.player_has_sword
+
+        for enemy in self.enemies:
+            enemy.rng = self.rng
+
+        # 충돌 검사용 공간 해시
+        self.platform_grid = SpatialHash(self.platforms)
+        self.enemy_grid = SpatialHash(self.enemies)
+        self._build_world()
+
+    def restore_stage(self, player):
         
-        player.x = 100
-        player.y = 500
-        player.has_sword = False
-
-        # 발판
-        self.platforms = [
-            Platform(0, 650, SCREEN_WIDTH, 50),  # 바닥
-            Platform(200, 550, 150, 20),
-            Platform(420, 470, 130, 20),
-            Platform(620, 390, 130, 20),
-            Platform(400, 310, 150, 20),
-            Platform(150, 230, 150, 20),
-            Platform(450, 150, 150, 20),
-            Platform(750, 150, 200, 20),  # 출구
-        ]
+        # 현재 스테이지를 다시 만들지 않고 기존 객체를 시작 상태로 되돌림
+        template = self.templates.get(self.current_stage)
+        if template is None or template.definition is not self.definition:
+            return False
 
-        # 적
-        self.enemies = [
-            Enemy(250, 500, "skeleton"),
-            Enemy(500, 400, "slime"),
-        ]
+        if not template.restore(
+            self.platforms, self.enemies, self.traps, self.chests, self.checkpoints
+        ):
+            return False
 
-        # 상자
-        self.chests = [
-            Chest(470, 430, Item(470, 430, "health")),
-            Chest(250, 510, Item(250, 510, "speed")),
-        ]
-        
-        # 체크포인트 (스테이지 시작 지점)
-        self.checkpoints = [
-            Checkpoint(50, 590)
-        ]
+        player.x, player.y = self.definition.player_start
+        player.has_sword = self.definition.player_has_sword
 
-    def _load_stage_2(self, player):
+        for enemy in self.enemies:
+            enemy.rng = self.rng
+
+        # 발판은 원래 위치로 돌아왔으므로 platform_grid는 그대로 사용
+        self.enemy_grid.clear()
+        for enemy in self.enemies:
+            self.enemy_grid.insert(enemy)
+        self._build_world()
+        return True
+
+    def _build_world(self):
         
-        player.x = 50
-        player.y = 500
-        player.has_sword = False
-
-        # 발판
-        self.platforms = [
-            Platform(0, 650, 250, 50),  # 시작 바닥
-            Platform(280, 580, 120, 20),
-            Platform(450, 500, 120, 20, disappearing=True),
-            Platform(620, 420, 120, 20),
-            Platform(480, 340, 120, 20),
-            Platform(280, 260, 120, 20, disappearing=True),
-            Platform(100, 180, 150, 20),
-            Platform(320, 120, 150, 20),
-            Platform(550, 80, 150, 20),
-            Platform(780, 50, 200, 20),  # 출구
-        ]
+        self.world.build(
+            self.definition.width,
+            self.platforms,
+            self.enemies,
+            self.traps,
+            self.checkpoints,
+        )
+
+    def get_world_width(self):
+        
+        if self.definition is None:
+            return SCREEN_WIDTH
+        return self.definition.width
 
-        # 적
-        self.enemies = [
-            Enemy(300, 530, "skeleton"),
-            Enemy(640, 370, "slime"),
-        ]
+    def set_view(self, left, right):
+        
+        # 카메라가 보는 범위가 바뀌면 깨어 있는 청크를 다시 고름
+        return self.world.set_view(left, right)
 
-        # 함정
-        self.traps = [
-            Trap(550, 360, "blade"),
-            Trap(250, 200, "spike"),
-            Trap(400, 80, "spike"),
-            Trap(480, 280, "fireball"),
-        ]
+    def add_enemy(self, enemy):
+        
+        # 스테이지 로드 후에 적을 추가할 때 (목록, 공간 해시, 청크 모두 등록)
+        enemy.rng = self.rng
+        self.enemies.append(enemy)
+        self.enemy_grid.insert(enemy)
+        self.world.enemies.insert(enemy)
 
-        # 상자
-        self.chests = [
-            Chest(820, 10, Item(820, 10, "sword")),  # 검 획득
-            Chest(140, 140, Item(140, 140, "max_health")),
-        ]
+    def get_active_enemies(self):
         
-        # 체크포인트 (스테이지 시작 지점)
-        self.checkpoints = [
-            Checkpoint(10, 590)
-        ]
+        return self.world.enemies.get_active()
 
-    def _load_stage_3(self, player):
+    def get_active_traps(self):
         
-        player.x = 100
-        player.y = 500
-        player.has_sword = True  # 보스전에서는 검 기본 제공
-
-        # 발판
-        self.platforms = [
-            Platform(0, 650, SCREEN_WIDTH, 50),  # 바닥
-            Platform(200, 550, 600, 30),  # 중앙 메인 발판
-            Platform(50, 450, 130, 20),  # 왼쪽 회피 발판
-            Platform(820, 450, 130, 20),  # 오른쪽 회피 발판
-            Platform(100, 350, 150, 20),  # 왼쪽 중간
-            Platform(425, 350, 150, 20),  # 중앙 중간
-            Platform(750, 350, 150, 20),  # 오른쪽 중간
-            Platform(250, 250, 150, 20),  # 왼쪽 상단
-            Platform(550, 250, 150, 20),  # 오른쪽 상단
-        ]
+        return self.world.traps.get_active()
 
-        # 보스전에는 일반 적 없음
-        self.enemies = []
-        self.traps = []
-        self.chests = []
+    def get_active_checkpoints(self):
+        
+        return self.world.checkpoints.get_active()
 
-        # 체크포인트 (스테이지 시작 지점)
-        self.checkpoints = [
-            Checkpoint(50, 590)
-        ]
+    def reload_stages(self):
+        
+        # 스테이지 파일을 고친 뒤 다음 로드에서 템플릿을 다시 만들도록 비움
+        self.templates.clear()
 
     def collapse_platforms(self):
         
-        if self.current_stage != 3:
+        if self.definition is None or not self.definition.collapsible_platforms:
             return []
 
-        import random
-
         # 바닥을 제외한 발판 중에서 랜덤 선택
         collapsible = [
             i
@@ -162,7 +145,7 @@ class StageManager:
             return []
 
         # 랜덤으로 선택
-        to_collapse = random.sample(collapsible, PLATFORM_COLLAPSE_COUNT)
+        to_collapse = self.rng.sample(collapsible, PLATFORM_COLLAPSE_COUNT)
 
         collapsed = []
         for idx in to_collapse:
@@ -174,7 +157,7 @@ class StageManager:
 
     def update_platforms(self, player):
         
-        for platform in self.platforms:
+        for platform in self.world.platforms.get_active():
             if platform.disappearing:
                 platform.update(player)
             if platform.collapsing:
@@ -182,18 +165,14 @@ class StageManager:
 
     def get_next_stage(self):
         
-        if self.current_stage < 3:
+        if self.loader.has_stage(self.current_stage + 1):
             return self.current_stage + 1
         return None
 
     def is_at_exit(self, player):
         
-        # 보스 스테이지(3)에서는 출구 없음
-        if self.current_stage == 3:
+        # 보스 스테이지처럼 출구가 없는 스테이지
+        if self.definition is None or self.definition.exit_x is None:
             return False
         
-        # 스테이지 1, 2에서만 출구 체크
-        if self.current_stage in [1, 2]:
-            return player.x > SCREEN_WIDTH - 50
-        
-        return False
+        return player.x > self.definition.exit_x
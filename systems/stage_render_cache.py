@@ -0,0 +1,184 @@
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from config import *
+from systems.asset_manager import get_asset_manager
+from systems.world_chunks import ChunkGroup
+from utils.profiler import get_profiler
+
+
+class StageRenderCache:
+    def __init__(self, chunk_width: int = WORLD_CHUNK_WIDTH):
+        self.assets = get_asset_manager()
+        self.chunk_width = chunk_width
+        # 배경 + 고정 발판을 합친 화면 한 장 (surface_camera_x 위치 기준)
+        self.surface: Optional[pygame.Surface] = None
+        self.surface_camera_x: Optional[int] = None
+        # 청크별 고정 발판 투명 레이어 - 카메라 근처 청크만 만들어 둠
+        self.chunk_layers: Dict[int, pygame.Surface] = {}
+        self.chunk_platforms: Dict[int, List] = {}
+        self.stage = None
+        self.platforms = None
+        self.static_platforms: List = []
+        self.dynamic_platforms: List = []
+        # 사라지는/붕괴 발판은 매 프레임 그리므로 화면 근처 청크 것만 고름
+        self.dynamic_chunks = ChunkGroup((), chunk_width)
+        self.camera_x = 0
+        self.dirty = True
+        self.rebuilds = 0
+
+    def invalidate(self):
+        self.dirty = True
+
+    def is_static(self, platform) -> bool:
+        return (
+            platform.visible and not platform.disappearing and not platform.collapsing
+        )
+
+    def _is_valid(self, stage: int, platforms) -> bool:
+        if self.dirty or self.stage != stage or self.platforms is not platforms:
+            return False
+
+        # 붕괴 시작/가시성 변경된 고정 발판이 있으면 다시 만듦
+        for platform in self.static_platforms:
+            if not self.is_static(platform):
+                return False
+        return True
+
+    def build(self, stage: int, platforms):
+        self.stage = stage
+        self.platforms = platforms
+        self.static_platforms = [p for p in platforms if self.is_static(p)]
+        self.dynamic_platforms = [p for p in platforms if not self.is_static(p)]
+
+        self.dynamic_chunks = ChunkGroup(self.dynamic_platforms, self.chunk_width)
+
+        # 발판이 걸친 청크마다 등록 (이펙트가 삐져나오는 폭 포함)
+        self.chunk_platforms = {}
+        for platform in self.static_platforms:
+            margin = platform.draw_margin
+            first = int((platform.x - margin) // self.chunk_width)
+            last = int((platform.x + platform.width + margin) // self.chunk_width)
+            for chunk in range(first, last + 1):
+                self.chunk_platforms.setdefault(chunk, []).append(platform)
+
+        self.chunk_layers = {}
+        self.surface = None
+        self.surface_camera_x = None
+        self.dirty = False
+        self.rebuilds += 1
+
+    def _get_chunk_layer(self, chunk: int) -> pygame.Surface:
+        layer = self.chunk_layers.get(chunk)
+        if layer is None:
+            layer = pygame.Surface((self.chunk_width, SCREEN_HEIGHT), pygame.SRCALPHA)
+            offset = (-chunk * self.chunk_width, 0)
+            for platform in self.chunk_platforms.get(chunk, ()):
+                platform.draw(layer, offset)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert_alpha()
+            self.chunk_layers[chunk] = layer
+            get_profiler().count("surfaces")
+        return layer
+
+    def _get_visible_chunks(self, left: int) -> range:
+        # left: 화면 왼쪽 끝의 월드 x 좌표
+        first = int(left // self.chunk_width)
+        last = int((left + SCREEN_WIDTH - 1) // self.chunk_width)
+        return range(first, last + 1)
+
+    def _stream_chunks(self):
+        # 화면 근처 청크만 남기고 멀어진 레이어는 버림
+        visible = self._get_visible_chunks(self.camera_x)
+        first = visible.start - WORLD_STREAM_CHUNKS
+        last = visible.stop - 1 + WORLD_STREAM_CHUNKS
+        for chunk in [c for c in self.chunk_layers if c < first or c > last]:
+            del self.chunk_layers[chunk]
+        for chunk in range(first, last + 1):
+            if chunk in self.chunk_platforms:
+                self._get_chunk_layer(chunk)
+        self.dynamic_chunks.set_active_range(first, last)
+
+    def get_visible_dynamic_platforms(self) -> List:
+        return self.dynamic_chunks.get_active()
+
+    def _blit_platforms(self, target: pygame.Surface, offset: Tuple[int, int]):
+        # offset은 카메라 + 흔들림을 합친 화면 오프셋
+        for chunk in self._get_visible_chunks(-offset[0]):
+            if chunk in self.chunk_platforms:
+                target.blit(
+                    self._get_chunk_layer(chunk),
+                    (chunk * self.chunk_width + offset[0], offset[1]),
+                )
+
+    def _draw_background(self, target: pygame.Surface):
+        target.fill(BLACK)
+        bg_sprite = self.assets.get_sprite(f"bg_stage{self.stage}")
+        if bg_sprite:
+            target.blit(bg_sprite, (0, 0))
+
+    def _compose(self):
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._draw_background(surface)
+        self._blit_platforms(surface, (-self.camera_x, 0))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self.surface = surface
+        self.surface_camera_x = self.camera_x
+        get_profiler().count("surfaces")
+
+    def update(self, stage: int, platforms, camera_x: int = 0) -> bool:
+        rebuilt = not self._is_valid(stage, platforms)
+        if rebuilt:
+            self.build(stage, platforms)
+
+        # 스크롤 중에는 합성하지 않고, 카메라가 멈춘 프레임에 한 장으로 합침
+        settled = camera_x == self.camera_x
+        self.camera_x = camera_x
+        self._stream_chunks()
+        if self.surface is None or (settled and self.surface_camera_x != camera_x):
+            self._compose()
+        return rebuilt
+
+    def is_composed(self) -> bool:
+        return self.surface is not None and self.surface_camera_x == self.camera_x
+
+    def draw_static(
+        self, screen: pygame.Surface, shake_offset: Tuple[int, int] = (0, 0)
+    ):
+        if shake_offset == (0, 0) and self.is_composed():
+            screen.blit(self.surface, (0, 0))
+        else:
+            self._draw_background(screen)
+            self._blit_platforms(
+                screen, (shake_offset[0] - self.camera_x, shake_offset[1])
+            )
+
+    def restore(self, screen: pygame.Surface, rect: pygame.Rect):
+        screen.blit(self.surface, rect, rect)
+
+    def draw_dynamic(
+        self, screen: pygame.Surface, shake_offset: Tuple[int, int] = (0, 0)
+    ):
+        offset = (shake_offset[0] - self.camera_x, shake_offset[1])
+        view = screen.get_rect()
+        culled = 0
+        for platform in self.get_visible_dynamic_platforms():
+            if platform.is_visible(view, offset):
+                platform.draw(screen, offset)
+            else:
+                culled += 1
+        get_profiler().count("entities.culled", culled)
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        stage: int,
+        platforms,
+        shake_offset: Tuple[int, int] = (0, 0),
+        camera_x: int = 0,
+    ):
+        self.update(stage, platforms, camera_x)
+        self.draw_static(screen, shake_offset)
+        self.draw_dynamic(screen, shake_offset)
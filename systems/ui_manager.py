@@ -4,7 +4,17 @@ import pygame
 
 from config import *
 from systems.asset_manager import get_asset_manager
+from systems.sprite_atlas import SpriteBatch
 from utils.effects import draw_health_bar, draw_text, draw_text_outline, format_time
+from utils.constants import (
+    PROFILER_ALLOC_COUNTERS,
+    PROFILER_FONT_SIZE,
+    PROFILER_GRAPH_HEIGHT,
+    PROFILER_GRAPH_MAX_MS,
+    PROFILER_LINE_HEIGHT,
+    PROFILER_OVERLAY_WIDTH,
+)
+from utils.surface_cache import get_effect_surface_cache
 
 
 class UIManager:
@@ -12,20 +22,21 @@ class UIManager:
         self.assets = get_asset_manager()
         self.menu_selection = 0
         self.dev_menu_selection = 0
+        self.sprite_batch = SpriteBatch()
 
     def draw_hearts(self, surface, player, x, y):
+        # 하트 스프라이트는 모아서 한 번에 그림
+        batch = self.sprite_batch
         for i in range(player.max_health):
             heart_x = x + i * (HEART_SIZE + HEART_SPACING)
             heart_y = y
 
             if i < player.health:
-                sprite = self.assets.get_sprite("ui_heart_full")
+                sprite_key = "ui_heart_full"
             else:
-                sprite = self.assets.get_sprite("ui_heart_empty")
+                sprite_key = "ui_heart_empty"
 
-            if sprite:
-                surface.blit(sprite, (heart_x, heart_y))
-            else:
+            if not batch.add_sprite(self.assets, sprite_key, (heart_x, heart_y)):
                 filled = i < player.health
                 color = RED if filled else DARK_GRAY
 
@@ -51,6 +62,7 @@ class UIManager:
                     (heart_x + HEART_SIZE // 2, heart_y + HEART_SIZE),
                 ]
                 pygame.draw.polygon(surface, color, points)
+        batch.flush(surface)
 
     def draw_hud(self, surface, player, stage, deaths, start_time, checkpoint_stage):
         self.draw_hearts(surface, player, UI_PADDING, UI_PADDING)
@@ -161,6 +173,38 @@ class UIManager:
                 center=True,
             )
 
+    def draw_loading(self, surface, progress):
+        surface.fill((20, 20, 40))
+
+        draw_text_outline(
+            surface,
+            "DARKSPIRE",
+            SCREEN_WIDTH // 2,
+            150,
+            FONT_TITLE,
+            WHITE,
+            BLACK,
+            center=True,
+        )
+
+        bar_width = 400
+        bar_x = SCREEN_WIDTH // 2 - bar_width // 2
+        bar_y = 400
+        pygame.draw.rect(surface, DARK_GRAY, (bar_x, bar_y, bar_width, 20))
+        pygame.draw.rect(surface, PURPLE, (bar_x, bar_y, int(bar_width * progress), 20))
+        pygame.draw.rect(surface, WHITE, (bar_x - 2, bar_y - 2, bar_width + 4, 24), 2)
+
+        draw_text_outline(
+            surface,
+            f"Loading... {int(progress * 100)}%",
+            SCREEN_WIDTH // 2,
+            450,
+            FONT_SMALL,
+            GRAY,
+            BLACK,
+            center=True,
+        )
+
     def draw_menu(self, surface):
         surface.fill((20, 20, 40))
 
@@ -249,8 +293,9 @@ class UIManager:
         )
 
     def draw_game_over(self, surface, deaths, elapsed):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = get_effect_surface_cache().fill(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 180
+        )
         surface.blit(overlay, (0, 0))
 
         screen_img = self.assets.get_sprite("screen_gameover")
@@ -312,8 +357,9 @@ class UIManager:
         )
 
     def draw_victory(self, surface, deaths, elapsed, items_collected):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
+        overlay = get_effect_surface_cache().fill(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 150
+        )
         surface.blit(overlay, (0, 0))
 
         victory_img = self.assets.get_sprite("screen_victory")
@@ -413,8 +459,9 @@ class UIManager:
         )
 
     def draw_dev_menu(self, surface):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
+        overlay = get_effect_surface_cache().fill(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200
+        )
         surface.blit(overlay, (0, 0))
 
         menu_width = 400
@@ -478,3 +525,74 @@ class UIManager:
     def _get_rank_color(self, rank):
         rank_colors = {"S": GOLD, "A": CYAN, "B": GREEN, "C": YELLOW, "D": GRAY}
         return rank_colors.get(rank, WHITE)
+
+    def get_profiler_rect(self, profiler):
+        lines = 1 + len(profiler.samples) + len(profiler.counters)
+        height = UI_PADDING * 3 + lines * PROFILER_LINE_HEIGHT + PROFILER_GRAPH_HEIGHT
+        return pygame.Rect(
+            SCREEN_WIDTH - PROFILER_OVERLAY_WIDTH - UI_PADDING,
+            130,
+            PROFILER_OVERLAY_WIDTH,
+            height,
+        )
+
+    def draw_profiler(self, surface, profiler):
+        rect = self.get_profiler_rect(profiler)
+        panel = get_effect_surface_cache().fill(rect.size, BLACK, 170)
+        surface.blit(panel, rect.topleft)
+
+        x = rect.x + UI_PADDING
+        y = rect.y + UI_PADDING
+        history = profiler.frame_history
+        frame_ms = sum(history) / len(history) if history else 0.0
+        draw_text(
+            surface, f"frame {frame_ms:5.2f} ms", x, y, PROFILER_FONT_SIZE, YELLOW
+        )
+        y += PROFILER_LINE_HEIGHT
+
+        for name in profiler.get_scope_names():
+            draw_text(surface, name, x, y, PROFILER_FONT_SIZE, WHITE)
+            draw_text(
+                surface,
+                f"{profiler.get_average(name):6.3f} ms",
+                rect.right - 90,
+                y,
+                PROFILER_FONT_SIZE,
+                WHITE,
+            )
+            y += PROFILER_LINE_HEIGHT
+
+        for name in sorted(profiler.counters):
+            label = f"alloc {name}" if name in PROFILER_ALLOC_COUNTERS else name
+            draw_text(surface, label, x, y, PROFILER_FONT_SIZE, CYAN)
+            draw_text(
+                surface,
+                str(profiler.get_latest_count(name)),
+                rect.right - 90,
+                y,
+                PROFILER_FONT_SIZE,
+                CYAN,
+            )
+            y += PROFILER_LINE_HEIGHT
+
+        # 프레임 시간 그래프 (가운데 선이 60fps 기준)
+        graph = pygame.Rect(
+            x, y + UI_PADDING, rect.width - UI_PADDING * 2, PROFILER_GRAPH_HEIGHT
+        )
+        pygame.draw.rect(surface, DARK_GRAY, graph, 1)
+        budget_y = graph.bottom - int(
+            graph.height * (1000 / FPS) / PROFILER_GRAPH_MAX_MS
+        )
+        pygame.draw.line(
+            surface, GREEN, (graph.x, budget_y), (graph.right - 1, budget_y)
+        )
+
+        if len(history) > 1:
+            step = graph.width / (profiler.history - 1)
+            points = []
+            for i, ms in enumerate(history):
+                ratio = min(ms / PROFILER_GRAPH_MAX_MS, 1.0)
+                points.append(
+                    (graph.x + i * step, graph.bottom - 1 - ratio * (graph.height - 1))
+                )
+            pygame.draw.lines(surface, YELLOW, False, points)
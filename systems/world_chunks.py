@@ -0,0 +1,135 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import *
+
+
+class ChunkGroup:
+    # 한 종류의 엔티티를 걸쳐 있는 청크 버킷마다 넣어 둠 (긴 발판은 여러 청크)
+    def __init__(self, entities: Iterable = (), chunk_width: int = WORLD_CHUNK_WIDTH):
+        self.chunk_width = chunk_width
+        self.buckets: Dict[int, List] = {}
+        self.entity_chunks: Dict[object, Tuple[int, int]] = {}
+        # 원래 리스트 순서 - 깨어 있는 목록을 스테이지 정의 순서대로 돌려주기 위함
+        self.order: Dict[object, int] = {}
+        self.next_order = 0
+
+        self.active_range: Optional[Tuple[int, int]] = None
+        self.active: List = []
+        self.dirty = True
+
+        for entity in entities:
+            self.insert(entity)
+
+    def __len__(self) -> int:
+        return len(self.entity_chunks)
+
+    def get_chunks(self, entity) -> Tuple[int, int]:
+        size = self.chunk_width
+        return (int(entity.x // size), int((entity.x + entity.width) // size))
+
+    def _overlaps_active(self, chunks: Tuple[int, int]) -> bool:
+        if self.active_range is None:
+            return False
+        return chunks[0] <= self.active_range[1] and chunks[1] >= self.active_range[0]
+
+    def _add_to_buckets(self, entity, chunks: Tuple[int, int]):
+        for chunk in range(chunks[0], chunks[1] + 1):
+            self.buckets.setdefault(chunk, []).append(entity)
+
+    def _remove_from_buckets(self, entity, chunks: Tuple[int, int]):
+        for chunk in range(chunks[0], chunks[1] + 1):
+            bucket = self.buckets[chunk]
+            bucket.remove(entity)
+            if not bucket:
+                del self.buckets[chunk]
+
+    def insert(self, entity):
+        chunks = self.get_chunks(entity)
+        self.entity_chunks[entity] = chunks
+        self.order[entity] = self.next_order
+        self.next_order += 1
+        self._add_to_buckets(entity, chunks)
+        if self._overlaps_active(chunks):
+            self.dirty = True
+
+    def relocate(self, entity):
+        # 움직이는 엔티티는 업데이트 후 호출 - 청크가 바뀌었을 때만 버킷 이동
+        old = self.entity_chunks.get(entity)
+        if old is None:
+            return
+        new = self.get_chunks(entity)
+        if old == new:
+            return
+
+        self._remove_from_buckets(entity, old)
+        self._add_to_buckets(entity, new)
+        self.entity_chunks[entity] = new
+        if self._overlaps_active(old) != self._overlaps_active(new):
+            self.dirty = True
+
+    def set_active_range(self, first: int, last: int):
+        if self.active_range != (first, last):
+            self.active_range = (first, last)
+            self.dirty = True
+
+    def get_active(self) -> List:
+        if self.dirty:
+            first, last = self.active_range or (0, -1)
+            found = set()
+            for chunk in range(first, last + 1):
+                bucket = self.buckets.get(chunk)
+                if bucket:
+                    found.update(bucket)
+            self.active = sorted(found, key=self.order.__getitem__)
+            self.dirty = False
+        return self.active
+
+
+class ChunkedWorld:
+    def __init__(
+        self,
+        chunk_width: int = WORLD_CHUNK_WIDTH,
+        active_margin: int = WORLD_ACTIVE_MARGIN,
+    ):
+        self.chunk_width = chunk_width
+        self.active_margin = active_margin
+        self.width = SCREEN_WIDTH
+        self.active_range: Tuple[int, int] = (0, -1)
+
+        self.platforms = ChunkGroup((), chunk_width)
+        self.enemies = ChunkGroup((), chunk_width)
+        self.traps = ChunkGroup((), chunk_width)
+        self.checkpoints = ChunkGroup((), chunk_width)
+
+    def build(self, width: int, platforms, enemies, traps, checkpoints):
+        self.width = width
+        self.platforms = ChunkGroup(platforms, self.chunk_width)
+        self.enemies = ChunkGroup(enemies, self.chunk_width)
+        self.traps = ChunkGroup(traps, self.chunk_width)
+        self.checkpoints = ChunkGroup(checkpoints, self.chunk_width)
+        self.active_range = (0, -1)
+
+    def get_chunk_count(self) -> int:
+        return max(1, -(-self.width // self.chunk_width))
+
+    def get_chunk_range(self, left: float, right: float) -> Tuple[int, int]:
+        return (int(left // self.chunk_width), int((right - 1) // self.chunk_width))
+
+    def set_view(self, left: float, right: float) -> bool:
+        # 화면 + 여유 거리에 걸친 청크만 깨움 - 범위가 바뀌었으면 True
+        active_range = self.get_chunk_range(
+            left - self.active_margin, right + self.active_margin
+        )
+        if active_range == self.active_range:
+            return False
+
+        self.active_range = active_range
+        for group in (self.platforms, self.enemies, self.traps, self.checkpoints):
+            group.set_active_range(*active_range)
+        return True
+
+    def get_sleeping_count(self) -> int:
+        return sum(
+            len(group) - len(group.get_active())
+            for group in (self.platforms, self.enemies, self.traps, self.checkpoints)
+        )
@@ -29,6 +29,10 @@ from utils.geometry import (
     lerp,
     point_in_rect,
 )
+from utils.particles import ParticleSystem
+from utils.profiler import FrameProfiler, get_profiler
+from utils.surface_cache import EffectSurfaceCache, get_effect_surface_cache
+from utils.text_cache import TextCache, get_font, get_text_cache
 
 __all__ = [
     "check_collision",
@@ -40,6 +44,14 @@ __all__ = [
     "clamp",
     "angle_between",
     "point_in_rect",
+    "ParticleSystem",
+    "FrameProfiler",
+    "get_profiler",
+    "EffectSurfaceCache",
+    "get_effect_surface_cache",
+    "TextCache",
+    "get_font",
+    "get_text_cache",
     "create_particle_burst",
     "update_particles",
     "draw_particles",
@@ -5,8 +5,12 @@ PARTICLE_MIN_SIZE = 2
 PARTICLE_MAX_SIZE = 5
 PARTICLE_MIN_LIFETIME = 15
 PARTICLE_MAX_LIFETIME = 30
+PARTICLE_CAPACITY = 20000
 
 TEXT_OUTLINE_OFFSET = 2
+TEXT_CACHE_SIZE = 256
+# 반투명 이펙트 서피스 캐시 메모리 상한 (바이트)
+EFFECT_SURFACE_CACHE_BYTES = 32 * 1024 * 1024
 
 COOLDOWN_CIRCLE_START_ANGLE = -90
 
@@ -24,3 +28,24 @@ SWORD_SLASH_INNER_WIDTH = 2
 SHIELD_ALPHA_DEFAULT = 128
 SHIELD_INNER_ALPHA_DIVISOR = 2
 SHIELD_BORDER_WIDTH = 3
+
+# 에셋 파일을 동시에 디코딩할 스레드 수
+ASSET_LOAD_WORKERS = 4
+# 스프라이트 아틀라스 페이지 한 변 길이, 이보다 큰 스프라이트(배경 등)는 따로 둠
+ATLAS_PAGE_SIZE = 1024
+ATLAS_MAX_SPRITE_SIZE = 256
+
+# 회전 칼날 함정 - 틱당 10도씩 한 바퀴를 미리 구워 둘 프레임 수와 프레임 한 변 길이
+TRAP_BLADE_FRAMES = 36
+TRAP_BLADE_FRAME_SIZE = 56
+
+PROFILER_HISTORY_FRAMES = 120
+PROFILER_OVERLAY_WIDTH = 300
+PROFILER_GRAPH_HEIGHT = 60
+PROFILER_GRAPH_MAX_MS = 33.3
+PROFILER_LINE_HEIGHT = 16
+PROFILER_FONT_SIZE = 18
+# 오버레이에서 "alloc"을 붙여 보여주는 할당 카운터 (나머지는 이름 그대로)
+PROFILER_ALLOC_COUNTERS = ("surfaces", "projectiles")
+# 트레이스 링 버퍼에 보관할 최대 이벤트 수
+TRACE_BUFFER_EVENTS = 200000
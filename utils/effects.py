@@ -1,10 +1,14 @@
 import math
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import pygame
 
 from config import *
+from utils.constants import TEXT_OUTLINE_OFFSET
+from utils.particles import ParticleSystem
+from utils.surface_cache import get_effect_surface_cache
+from utils.text_cache import get_text_cache
 
 
 def create_particle_burst(
@@ -42,18 +46,27 @@ def create_particle_burst(
     return particles
 
 
-def update_particles(particles: List[Dict]):
-    for particle in particles[:]:
+def update_particles(particles: Union[ParticleSystem, List[Dict]]):
+    if isinstance(particles, ParticleSystem):
+        particles.update()
+        return
+
+    for particle in particles:
         particle["x"] += particle["vx"]
         particle["y"] += particle["vy"]
         particle["vy"] += 0.3
         particle["lifetime"] -= 1
 
-        if particle["lifetime"] <= 0:
-            particles.remove(particle)
+    particles[:] = [particle for particle in particles if particle["lifetime"] > 0]
 
 
-def draw_particles(surface: pygame.Surface, particles: List[Dict]):
+def draw_particles(
+    surface: pygame.Surface, particles: Union[ParticleSystem, List[Dict]]
+):
+    if isinstance(particles, ParticleSystem):
+        particles.draw(surface)
+        return
+
     for particle in particles:
         alpha = particle["lifetime"] / particle["max_lifetime"]
         size = max(1, int(particle["size"] * alpha))
@@ -78,8 +91,7 @@ def draw_text(
     color: Tuple[int, int, int] = WHITE,
     center: bool = False,
 ) -> pygame.Rect:
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
+    text_surface = get_text_cache().render(text, size, color)
 
     if center:
         text_rect = text_surface.get_rect(center=(x, y))
@@ -100,24 +112,13 @@ def draw_text_outline(
     outline_color: Tuple[int, int, int] = BLACK,
     center: bool = False,
 ):
-    font = pygame.font.Font(None, size)
-
-    for dx in [-2, 0, 2]:
-        for dy in [-2, 0, 2]:
-            if dx != 0 or dy != 0:
-                outline_surface = font.render(text, True, outline_color)
-                if center:
-                    outline_rect = outline_surface.get_rect(center=(x + dx, y + dy))
-                    surface.blit(outline_surface, outline_rect)
-                else:
-                    surface.blit(outline_surface, (x + dx, y + dy))
-
-    text_surface = font.render(text, True, color)
+    text_surface = get_text_cache().render(text, size, color, outline_color)
+
     if center:
         text_rect = text_surface.get_rect(center=(x, y))
         surface.blit(text_surface, text_rect)
     else:
-        surface.blit(text_surface, (x, y))
+        surface.blit(text_surface, (x - TEXT_OUTLINE_OFFSET, y - TEXT_OUTLINE_OFFSET))
 
 
 def draw_circle_outline(
@@ -271,9 +272,16 @@ def draw_sword_slash(
 def draw_shield(
     surface: pygame.Surface, x: float, y: float, size: int, alpha: int = 128
 ):
-    shield_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-    pygame.draw.circle(shield_surface, (*PURPLE, alpha), (size, size), size)
-    pygame.draw.circle(shield_surface, (*LIGHT_BLUE, alpha // 2), (size, size), size, 3)
+    shield_surface = get_effect_surface_cache().circle(
+        (size * 2, size * 2),
+        (size, size),
+        size,
+        PURPLE,
+        alpha,
+        LIGHT_BLUE,
+        alpha // 2,
+        3,
+    )
     surface.blit(shield_surface, (x - size, y - size))
 
 
@@ -0,0 +1,179 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from config import *
+from utils.constants import (
+    PARTICLE_CAPACITY,
+    PARTICLE_GRAVITY,
+    PARTICLE_MAX_LIFETIME,
+    PARTICLE_MAX_SIZE,
+    PARTICLE_MAX_SPEED,
+    PARTICLE_MIN_LIFETIME,
+    PARTICLE_MIN_SIZE,
+    PARTICLE_MIN_SPEED,
+)
+
+
+class ParticleSystem:
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.float32)
+        self.max_lifetime = np.ones(capacity, dtype=np.float32)
+        self.color_index = np.zeros(capacity, dtype=np.uint16)
+
+        self._arrays = (
+            self.x,
+            self.y,
+            self.vx,
+            self.vy,
+            self.size,
+            self.lifetime,
+            self.max_lifetime,
+            self.color_index,
+        )
+
+        # 색상 팔레트 - 파티클은 색 대신 팔레트 인덱스만 저장
+        self.palette: List[Tuple[int, int, int]] = []
+        self.palette_index: Dict[Tuple[int, int, int], int] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _get_color_index(self, color: Tuple[int, int, int]) -> int:
+        color = tuple(color)
+        index = self.palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self.palette_index[color] = index
+        return index
+
+    def _reserve(self, count: int) -> slice:
+        # 용량 초과분은 버림
+        count = max(0, min(count, self.capacity - self.count))
+        start = self.count
+        self.count += count
+        return slice(start, start + count)
+
+    def emit(
+        self,
+        x: float,
+        y: float,
+        count: int = 10,
+        colors: Optional[List[Tuple[int, int, int]]] = None,
+    ):
+        if colors is None:
+            colors = [YELLOW, ORANGE, RED]
+
+        span = self._reserve(count)
+        count = span.stop - span.start
+        if count == 0:
+            return
+
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(PARTICLE_MIN_SPEED, PARTICLE_MAX_SPEED, count)
+        lifetime = rng.integers(PARTICLE_MIN_LIFETIME, PARTICLE_MAX_LIFETIME + 1, count)
+        color_indices = np.array(
+            [self._get_color_index(color) for color in colors], dtype=np.uint16
+        )
+
+        self.x[span] = x
+        self.y[span] = y
+        self.vx[span] = np.cos(angle) * speed
+        self.vy[span] = np.sin(angle) * speed
+        self.size[span] = rng.integers(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE + 1, count)
+        self.lifetime[span] = lifetime
+        self.max_lifetime[span] = lifetime
+        self.color_index[span] = color_indices[rng.integers(0, len(colors), count)]
+
+    def extend(self, particles: List[Dict]):
+        # create_particle_burst가 만든 dict 리스트 호환용
+        span = self._reserve(len(particles))
+        for i, particle in zip(range(span.start, span.stop), particles):
+            self.x[i] = particle["x"]
+            self.y[i] = particle["y"]
+            self.vx[i] = particle["vx"]
+            self.vy[i] = particle["vy"]
+            self.size[i] = particle["size"]
+            self.lifetime[i] = particle["lifetime"]
+            self.max_lifetime[i] = particle["max_lifetime"]
+            self.color_index[i] = self._get_color_index(particle["color"])
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += PARTICLE_GRAVITY
+        self.lifetime[:n] -= 1
+
+        dead = self.lifetime[:n] <= 0
+        dead_count = int(np.count_nonzero(dead))
+        if dead_count == 0:
+            return
+
+        # swap-remove: 앞쪽의 빈 자리를 뒤쪽의 살아있는 파티클로 채움
+        new_count = n - dead_count
+        holes = np.flatnonzero(dead[:new_count])
+        if holes.size:
+            survivors = np.flatnonzero(~dead[new_count:]) + new_count
+            for array in self._arrays:
+                array[holes] = array[survivors]
+
+        self.count = new_count
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0)):
+        n = self.count
+        if n == 0:
+            return
+
+        alpha = self.lifetime[:n] / self.max_lifetime[:n]
+        sizes = np.maximum(1, (self.size[:n] * alpha).astype(np.int32))
+        palette = self.palette
+        draw_circle = pygame.draw.circle
+
+        xs = self.x[:n].astype(np.int32)
+        ys = self.y[:n].astype(np.int32)
+        if offset != (0, 0):
+            xs += offset[0]
+            ys += offset[1]
+
+        for x, y, size, color_index in zip(
+            xs.tolist(),
+            ys.tolist(),
+            sizes.tolist(),
+            self.color_index[:n].tolist(),
+        ):
+            draw_circle(surface, palette[color_index], (x, y), size)
+
+    def get_bounds(self, offset: Tuple[int, int] = (0, 0)) -> Optional[pygame.Rect]:
+        # 살아있는 파티클 전체를 감싸는 사각형 (dirty rect용)
+        n = self.count
+        if n == 0:
+            return None
+
+        radius = int(self.size[:n].max()) + 1
+        left = int(self.x[:n].min()) - radius
+        top = int(self.y[:n].min()) - radius
+        right = int(self.x[:n].max()) + radius + 1
+        bottom = int(self.y[:n].max()) + radius + 1
+        return pygame.Rect(
+            left + offset[0], top + offset[1], right - left, bottom - top
+        )
+
+    def clear(self):
+        self.count = 0
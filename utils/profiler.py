@@ -0,0 +1,162 @@
+import time
+from collections import deque
+from functools import wraps
+from typing import Callable, Deque, Dict, List, Optional
+
+from utils.constants import PROFILER_HISTORY_FRAMES
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _TimingScope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    def __init__(self, history: int = PROFILER_HISTORY_FRAMES):
+        self.enabled = False
+        self.history = history
+        # 연결되면 오버레이가 꺼져 있어도 스코프 구간을 트레이스로 남김
+        self.tracer = None
+
+        # 현재 프레임에 누적 중인 값 (한 프레임에 여러 틱이 돌 수 있음)
+        self.frame_times: Dict[str, float] = {}
+        self.frame_counts: Dict[str, int] = {}
+        self.frame_start = 0.0
+
+        # 프레임 단위 링 버퍼 (ms / 개수)
+        self.samples: Dict[str, Deque[float]] = {}
+        self.counters: Dict[str, Deque[int]] = {}
+        self.frame_history: Deque[float] = deque(maxlen=history)
+
+    def set_enabled(self, enabled: bool):
+        self.enabled = enabled
+        self.frame_times.clear()
+        self.frame_counts.clear()
+
+    def toggle(self):
+        self.set_enabled(not self.enabled)
+
+    def set_tracer(self, tracer):
+        self.tracer = tracer
+
+    def is_active(self) -> bool:
+        return self.enabled or self.tracer is not None
+
+    def scope(self, name: str):
+        if not self.enabled and self.tracer is None:
+            return _NULL_SCOPE
+        return _TimingScope(self, name)
+
+    def profiled(self, name: str) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled and self.tracer is None:
+                    return func(*args, **kwargs)
+                with _TimingScope(self, name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record(self, name: str, start: float, seconds: float):
+        if self.enabled:
+            self.frame_times[name] = self.frame_times.get(name, 0.0) + seconds
+        if self.tracer is not None:
+            self.tracer.add_span(name, start, seconds)
+
+    def count(self, name: str, amount: int = 1):
+        if self.enabled:
+            self.frame_counts[name] = self.frame_counts.get(name, 0) + amount
+
+    def begin_frame(self):
+        if self.enabled or self.tracer is not None:
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled and self.tracer is None:
+            return
+
+        frame_time = time.perf_counter() - self.frame_start
+        if self.tracer is not None:
+            self.tracer.add_span("frame", self.frame_start, frame_time)
+        if not self.enabled:
+            return
+
+        self.frame_history.append(frame_time * 1000)
+
+        for name, seconds in self.frame_times.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.history)
+            self.samples[name].append(seconds * 1000)
+        # 이번 프레임에 안 불린 스코프는 0으로 채워서 평균이 맞도록 함
+        for name, samples in self.samples.items():
+            if name not in self.frame_times:
+                samples.append(0.0)
+
+        for name, amount in self.frame_counts.items():
+            if name not in self.counters:
+                self.counters[name] = deque(maxlen=self.history)
+            self.counters[name].append(amount)
+        for name, counts in self.counters.items():
+            if name not in self.frame_counts:
+                counts.append(0)
+
+        self.frame_times.clear()
+        self.frame_counts.clear()
+
+    def get_average(self, name: str) -> float:
+        samples = self.samples.get(name)
+        if not samples:
+            return 0.0
+        return sum(samples) / len(samples)
+
+    def get_latest_count(self, name: str) -> int:
+        counts = self.counters.get(name)
+        return counts[-1] if counts else 0
+
+    def get_scope_names(self) -> List[str]:
+        return sorted(self.samples)
+
+    def reset(self):
+        self.frame_times.clear()
+        self.frame_counts.clear()
+        self.samples.clear()
+        self.counters.clear()
+        self.frame_history.clear()
+
+
+_profiler: Optional[FrameProfiler] = None
+
+
+def get_profiler() -> FrameProfiler:
+    global _profiler
+    if _profiler is None:
+        _profiler = FrameProfiler()
+    return _profiler
@@ -0,0 +1,124 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pygame
+
+from utils.constants import EFFECT_SURFACE_CACHE_BYTES
+from utils.profiler import get_profiler
+
+Size = Tuple[int, int]
+Color = Tuple[int, int, int]
+
+
+class EffectSurfaceCache:
+    # (모양, 크기, 색, 알파)별로 미리 그려둔 SRCALPHA 서피스를 재사용
+    def __init__(self, max_bytes: int = EFFECT_SURFACE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def _get(self, key: tuple) -> Optional[pygame.Surface]:
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        return surface
+
+    def _create(self, size: Size) -> pygame.Surface:
+        self.misses += 1
+        get_profiler().count("surfaces")
+        return pygame.Surface(size, pygame.SRCALPHA)
+
+    def _store(self, key: tuple, surface: pygame.Surface) -> pygame.Surface:
+        size = surface.get_width() * surface.get_height() * 4
+        if size > self.max_bytes:
+            return surface
+
+        self.surfaces[key] = surface
+        self.bytes += size
+        # 메모리 상한을 넘으면 오래 안 쓴 것부터 버림
+        while self.bytes > self.max_bytes:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes -= old.get_width() * old.get_height() * 4
+        return surface
+
+    def fill(self, size: Size, color: Color, alpha: int) -> pygame.Surface:
+        size = (int(size[0]), int(size[1]))
+        key = ("fill", size, tuple(color), alpha)
+        surface = self._get(key)
+        if surface is None:
+            surface = self._create(size)
+            surface.fill((*color, alpha))
+            self._store(key, surface)
+        return surface
+
+    def rect_outline(
+        self, size: Size, color: Color, alpha: int, width: int
+    ) -> pygame.Surface:
+        size = (int(size[0]), int(size[1]))
+        key = ("rect_outline", size, tuple(color), alpha, width)
+        surface = self._get(key)
+        if surface is None:
+            surface = self._create(size)
+            pygame.draw.rect(surface, (*color, alpha), (0, 0, *size), width)
+            self._store(key, surface)
+        return surface
+
+    def circle(
+        self,
+        size: Size,
+        center: Tuple[int, int],
+        radius: int,
+        color: Color,
+        alpha: int,
+        outline_color: Optional[Color] = None,
+        outline_alpha: int = 0,
+        outline_width: int = 0,
+    ) -> pygame.Surface:
+        size = (int(size[0]), int(size[1]))
+        key = (
+            "circle",
+            size,
+            tuple(center),
+            radius,
+            tuple(color),
+            alpha,
+            tuple(outline_color) if outline_color else None,
+            outline_alpha,
+            outline_width,
+        )
+        surface = self._get(key)
+        if surface is None:
+            surface = self._create(size)
+            pygame.draw.circle(surface, (*color, alpha), center, radius)
+            if outline_color:
+                pygame.draw.circle(
+                    surface,
+                    (*outline_color, outline_alpha),
+                    center,
+                    radius,
+                    outline_width,
+                )
+            self._store(key, surface)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+_effect_surface_cache: Optional[EffectSurfaceCache] = None
+
+
+def get_effect_surface_cache() -> EffectSurfaceCache:
+    global _effect_surface_cache
+    if _effect_surface_cache is None:
+        _effect_surface_cache = EffectSurfaceCache()
+    return _effect_surface_cache
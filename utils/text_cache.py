@@ -0,0 +1,92 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from utils.constants import TEXT_CACHE_SIZE, TEXT_OUTLINE_OFFSET
+from utils.profiler import get_profiler
+
+_fonts: Dict[int, pygame.font.Font] = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+
+class TextCache:
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def render(
+        self,
+        text: str,
+        size: int,
+        color: Tuple[int, int, int],
+        outline_color: Optional[Tuple[int, int, int]] = None,
+    ) -> pygame.Surface:
+        key = (
+            text,
+            size,
+            tuple(color),
+            tuple(outline_color) if outline_color else None,
+        )
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if outline_color is None:
+            surface = get_font(size).render(text, True, color)
+            get_profiler().count("surfaces")
+        else:
+            surface = self._render_outline(text, size, color, outline_color)
+            get_profiler().count("surfaces", 3)
+
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def _render_outline(self, text, size, color, outline_color) -> pygame.Surface:
+        # 외곽선 8방향 + 본문을 한 장의 서피스로 합성
+        font = get_font(size)
+        offset = TEXT_OUTLINE_OFFSET
+        outline_surface = font.render(text, True, outline_color)
+        text_surface = font.render(text, True, color)
+
+        width, height = text_surface.get_size()
+        surface = pygame.Surface(
+            (width + offset * 2, height + offset * 2), pygame.SRCALPHA
+        )
+        for dx in [-offset, 0, offset]:
+            for dy in [-offset, 0, offset]:
+                if dx != 0 or dy != 0:
+                    surface.blit(outline_surface, (offset + dx, offset + dy))
+        surface.blit(text_surface, (offset, offset))
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_text_cache: Optional[TextCache] = None
+
+
+def get_text_cache() -> TextCache:
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = TextCache()
+    return _text_cache
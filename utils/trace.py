@@ -0,0 +1,80 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from utils.constants import TRACE_BUFFER_EVENTS
+
+# (이름, 시작 초, 길이 초, 스레드 id)
+TraceSpan = Tuple[str, float, float, int]
+
+
+class TraceRecorder:
+    # Chrome trace-event(JSON) 형식으로 구간을 기록, chrome://tracing / Perfetto에서 열림
+    def __init__(self, path: str, capacity: int = TRACE_BUFFER_EVENTS):
+        self.path = path
+        self.capacity = capacity
+        # 가득 차면 오래된 이벤트부터 버림 (최근 구간만 남음)
+        self.spans: Deque[TraceSpan] = deque(maxlen=capacity)
+        self.start_time = time.perf_counter()
+        self.pid = os.getpid()
+        self.thread_names: Dict[int, str] = {}
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def add_span(self, name: str, start: float, duration: float):
+        if len(self.spans) == self.capacity:
+            self.dropped += 1
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        self.spans.append((name, start, duration, tid))
+
+    def get_events(self) -> List[Dict]:
+        events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self.pid,
+                "args": {"name": "Darkspire"},
+            }
+        ]
+        for tid, thread_name in self.thread_names.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self.pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+            )
+
+        start_time = self.start_time
+        for name, start, duration, tid in self.spans:
+            events.append(
+                {
+                    "name": name,
+                    "cat": name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": round((start - start_time) * 1e6, 3),
+                    "dur": round(duration * 1e6, 3),
+                    "pid": self.pid,
+                    "tid": tid,
+                }
+            )
+        return events
+
+    def flush(self, path: Optional[str] = None):
+        path = path or self.path
+        data = {
+            "traceEvents": self.get_events(),
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": self.dropped},
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)